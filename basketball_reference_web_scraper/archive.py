@@ -0,0 +1,116 @@
+import gzip
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+
+from basketball_reference_web_scraper.cache import request_key
+
+
+class PageArchive:
+    """
+    a permanent record of every page fetched, so pages can be re-parsed later without
+    hitting the site again
+
+    bodies are gzipped and stored once per distinct content under their sha256
+    (blobs/ab/abcdef....gz), so fetching an unchanged page again only adds a row to the
+    index.  the index (an sqlite database next to the blobs) maps each url and fetch
+    time to the digest of what was fetched.  see `func:http_client.set_archive` to
+    archive every request, or to replay archived pages instead of making requests.
+
+    Args:
+        directory (str):  where to keep the index and the blobs; created if it doesn't exist
+        compression_level (int):  gzip compression level, 1 (fastest) to 9 (smallest)
+    """
+    def __init__(self, directory, compression_level=9):
+        self.directory = directory
+        self.compression_level = compression_level
+        os.makedirs(os.path.join(directory, 'blobs'), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.path.join(directory, 'index.sqlite'),
+            check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS pages (key TEXT, fetched_at REAL, digest TEXT)")
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS pages_key_fetched_at ON pages (key, fetched_at)")
+
+    def blob_path(self, digest):
+        return os.path.join(self.directory, 'blobs', digest[:2], digest + '.gz')
+
+    def store(self, url, body, params=None, fetched_at=None):
+        """
+        archive a page's body as fetched from `url` at `fetched_at` (defaults to now),
+        returning the digest it's stored under
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.blob_path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            ## write to a temporary file first so that a partially written blob is never visible
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(file_descriptor, 'wb') as temporary_file:
+                temporary_file.write(gzip.compress(body, compresslevel=self.compression_level))
+            os.replace(temporary_path, path)
+
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        with self._lock:
+            self._connection.execute("INSERT INTO pages VALUES (?, ?, ?)",
+                (request_key(url, params), fetched_at, digest))
+        return digest
+
+    def load(self, digest):
+        with open(self.blob_path(digest), 'rb') as blob:
+            return gzip.decompress(blob.read())
+
+    def history(self, url, params=None):
+        """
+        a list of (fetched_at, digest) for every time a page was archived, oldest first
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT fetched_at, digest FROM pages WHERE key = ? ORDER BY fetched_at",
+                (request_key(url, params),)).fetchall()
+
+    def latest(self, url, params=None, before=None):
+        """
+        the body of the most recent copy of a page (fetched before `before`, if given),
+        or None if it was never archived
+        """
+        query = "SELECT digest FROM pages WHERE key = ?"
+        arguments = [request_key(url, params)]
+        if before is not None:
+            query += " AND fetched_at < ?"
+            arguments.append(before)
+        query += " ORDER BY fetched_at DESC LIMIT 1"
+
+        with self._lock:
+            row = self._connection.execute(query, arguments).fetchone()
+        if row is None:
+            return None
+        return self.load(row[0])
+
+    def pages(self, pattern=None):
+        """
+        yield (url, fetched_at, body) for the most recent copy of every archived page
+        whose url (with its query parameters) `re.search`es `pattern`, e.g. to re-parse
+        every season totals page:
+
+            for url, fetched_at, body in archive.pages(r'/leagues/NBA_\\d+_totals.html'):
+                rows = parsers.parse_players_season_totals(body)
+        """
+        pattern = re.compile(pattern) if pattern is not None else None
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, MAX(fetched_at), digest FROM pages GROUP BY key ORDER BY key").fetchall()
+        for key, fetched_at, digest in rows:
+            if pattern is None or pattern.search(key):
+                yield key, fetched_at, self.load(digest)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,269 @@
+import asyncio
+
+import aiohttp
+
+from basketball_reference_web_scraper import async_http_client
+from basketball_reference_web_scraper import client
+from basketball_reference_web_scraper import output
+
+from basketball_reference_web_scraper.errors import InvalidSeason, InvalidDate, InvalidPlayer, InvalidSeries
+from basketball_reference_web_scraper.json_encoders import BasketballReferenceJSONEncoder
+
+## asyncio versions of every function in `client`.  arguments and return values are the
+## same, except that `session` is an aiohttp.ClientSession (see
+## `func:async_http_client.create_session`) -- share one between calls to reuse connections;
+## without one, each call opens and closes its own.
+
+NOT_FOUND = 404
+
+
+async def players_season_totals(season_end_year, playoffs=False, skip_totals=False,
+    output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None, columnar=False):
+    """
+    scrape the "Totals" stats of all players from a single year; see `func:client.players_season_totals`
+    """
+    try:
+        values = await async_http_client.players_season_totals(season_end_year,
+            skip_totals=skip_totals, playoffs=playoffs, session=session, columnar=columnar)
+    except aiohttp.ClientResponseError as http_error:
+        if http_error.status == NOT_FOUND:
+            raise InvalidSeason(season_end_year=season_end_year)
+        else:
+            raise http_error
+    return output.output(
+        values=values,
+        output_type=output_type,
+        output_file_path=output_file_path,
+        output_write_option=output_write_option,
+        csv_writer=output.players_season_totals_to_csv,
+        encoder=BasketballReferenceJSONEncoder,
+        json_options=json_options,
+        partition={'season': season_end_year},
+    )
+
+
+async def players_advanced_stats(season_end_year, playoffs=False, skip_totals=False,
+    output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None, columnar=False):
+    """
+    scrape the "Advanced" stats of all players from a single year; see `func:client.players_advanced_stats`
+    """
+    try:
+        values = await async_http_client.players_advanced_stats(season_end_year,
+            skip_totals=skip_totals, playoffs=playoffs, session=session, columnar=columnar)
+    except aiohttp.ClientResponseError as http_error:
+        if http_error.status == NOT_FOUND:
+            raise InvalidSeason(season_end_year=season_end_year)
+        else:
+            raise http_error
+    return output.output(
+        values=values,
+        output_type=output_type,
+        output_file_path=output_file_path,
+        output_write_option=output_write_option,
+        csv_writer=output.players_advanced_to_csv,
+        encoder=BasketballReferenceJSONEncoder,
+        json_options=json_options,
+        partition={'season': season_end_year},
+    )
+
+
+async def players_season_totals_per100(season_end_year, playoffs=False, skip_totals=False,
+    output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None, columnar=False):
+    """
+    scrape the "Totals per 100 possessions" stats of all players from a single year;
+    see `func:client.players_season_totals_per100`
+    """
+    if season_end_year < 1974:
+        raise ValueError("Per 100 Poss stats aren't available before 1974")
+
+    try:
+        values = await async_http_client.players_season_totals_per100(season_end_year,
+            skip_totals=skip_totals, playoffs=playoffs, session=session, columnar=columnar)
+    except aiohttp.ClientResponseError as http_error:
+        if http_error.status == NOT_FOUND:
+            raise InvalidSeason(season_end_year=season_end_year)
+        else:
+            raise http_error
+    return output.output(
+        values=values,
+        output_type=output_type,
+        output_file_path=output_file_path,
+        output_write_option=output_write_option,
+        csv_writer=output.players_season_totals_per100_to_csv,
+        encoder=BasketballReferenceJSONEncoder,
+        json_options=json_options,
+        partition={'season': season_end_year},
+    )
+
+
+async def player_box_scores(day, month, year, output_type=None, output_file_path=None, output_write_option=None,
+    json_options=None, session=None, records=False):
+    """
+    get the box score of every player who played on a single day; see `func:client.player_box_scores`
+    """
+    try:
+        values = await async_http_client.player_box_scores(day=day, month=month, year=year, session=session,
+            records=records)
+    except aiohttp.ClientResponseError as http_error:
+        if http_error.status == NOT_FOUND:
+            raise InvalidDate(day=day, month=month, year=year)
+        else:
+            raise http_error
+    return output.output(
+        values=values,
+        output_type=output_type,
+        output_file_path=output_file_path,
+        output_write_option=output_write_option,
+        csv_writer=output.box_scores_to_csv,
+        encoder=BasketballReferenceJSONEncoder,
+        json_options=json_options,
+    )
+
+
+async def team_box_scores(day, month, year, output_type=None, output_file_path=None, output_write_option=None,
+    json_options=None, session=None):
+    """
+    get the team totals from every game played on a single day; all of the games are
+    requested at once.  see `func:client.team_box_scores` (with max_workers set) for what
+    happens when some of the games fail
+    """
+    try:
+        values = await async_http_client.team_box_scores(day=day, month=month, year=year, session=session)
+    except aiohttp.ClientResponseError as http_error:
+        if http_error.status == NOT_FOUND:
+            raise InvalidDate(day=day, month=month, year=year)
+        else:
+            raise http_error
+    return output.output(
+        values=values,
+        output_type=output_type,
+        output_file_path=output_file_path,
+        output_write_option=output_write_option,
+        csv_writer=output.team_box_scores_to_csv,
+        encoder=BasketballReferenceJSONEncoder,
+        json_options=json_options,
+    )
+
+
+async def season_schedule(season_end_year, output_type=None, output_file_path=None, output_write_option=None,
+    json_options=None, session=None, records=False):
+    """
+    get every game of a season; the monthly schedule pages are all requested at once
+    """
+    try:
+        values = await async_http_client.season_schedule(season_end_year, session=session, records=records)
+    except aiohttp.ClientResponseError as http_error:
+        if http_error.status == NOT_FOUND:
+            raise InvalidSeason(season_end_year=season_end_year)
+        else:
+            raise http_error
+    return output.output(
+        values=values,
+        output_type=output_type,
+        output_file_path=output_file_path,
+        output_write_option=output_write_option,
+        csv_writer=output.schedule_to_csv,
+        encoder=BasketballReferenceJSONEncoder,
+        json_options=json_options,
+        partition={'season': season_end_year},
+    )
+
+
+async def single_player_career_tables(player_id, tables=['totals', 'advanced'],
+    output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None):
+    """
+    get one or more tables of a players career (one line per season); see
+    `func:client.single_player_career_tables`
+    """
+    tables = client._resolve_career_tables(tables)
+
+    try:
+        values_list = await async_http_client.player_career(player_id, tables, session=session)
+    except aiohttp.ClientResponseError as http_error:
+        if http_error.status == NOT_FOUND:
+            raise InvalidPlayer(player_id=player_id)
+        else:
+            raise http_error
+
+    return client._output_career_tables(tables, values_list, output_type=output_type,
+        output_file_path=output_file_path, output_write_option=output_write_option,
+        json_options=json_options)
+
+
+async def all_playoffs_series_in_one_year(year, tables=['basic', 'advanced'], output_type=None,
+    output_directory=None, output_write_option=None, json_options=None, session=None):
+    """
+    download the list of playoff series in a year, then the stats from all of those series
+    at once; see `func:client.all_playoffs_series_in_one_year`
+    """
+    output_base, schedule_output_path = client._playoffs_output_base(year, output_directory)
+    if output_base is None:
+        ## nowhere to write to, and the series have to stay rows (not in-memory json) to be named
+        output_type = None
+
+    kwargs = dict(output_type=output_type, output_write_option=output_write_option, json_options=json_options)
+
+    async with async_http_client.session_or_new(session) as session:
+        series_list = await playoff_series_list(year, output_file_path=schedule_output_path,
+            session=session, **kwargs)
+        output_file_path_list = client._name_playoff_series(series_list, output_base)
+
+        series_stats = await asyncio.gather(*[
+            playoff_series_stats(series, tables, output_file_path=output_file_path, session=session, **kwargs)
+            for (series, output_file_path) in zip(series_list, output_file_path_list)
+        ])
+
+    return {series['unique_series_name']: stats for (series, stats) in zip(series_list, series_stats)}
+
+
+async def playoff_series_stats(playoff_series, tables=['basic', 'advanced'],
+    output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None):
+    """
+    get basic and/or advanced stats from a given playoff series; see `func:client.playoff_series_stats`
+    """
+    tables, output_file_path, output_end = client._playoff_series_stats_tables(
+        playoff_series, tables, output_type, output_file_path)
+
+    try:
+        values_list = await async_http_client.playoff_series_stats(playoff_series, tables, session=session)
+    except aiohttp.ClientResponseError as http_error:
+        if http_error.status == NOT_FOUND:
+            raise InvalidSeries(series=playoff_series)
+        else:
+            raise http_error
+
+    return client._output_playoff_series_stats(tables, values_list, output_end, output_type=output_type,
+        output_file_path=output_file_path, output_write_option=output_write_option,
+        json_options=json_options)
+
+
+async def playoff_series_list(playoffs_year, output_type=None, output_file_path=None,
+    output_write_option=None, json_options=None, session=None):
+    """
+    get the list of playoff series that happened in the playoffs of a given year; see
+    `func:client.playoff_series_list`
+    """
+    if playoffs_year == 1954:
+        raise ValueError("Can't parse the round-robin playoff schedule of 1954, sorry")
+
+    try:
+        values = await async_http_client.playoffs_series(playoffs_year, session=session)
+    except aiohttp.ClientResponseError as http_error:
+        if http_error.status == NOT_FOUND:
+            raise InvalidSeason(season_end_year=playoffs_year)
+        else:
+            raise http_error
+    return output.output(
+        values=values,
+        output_type=output_type,
+        output_file_path=output_file_path,
+        output_write_option=output_write_option,
+        csv_writer=output.playoff_series_to_csv,
+        encoder=BasketballReferenceJSONEncoder,
+        json_options=json_options,
+    )
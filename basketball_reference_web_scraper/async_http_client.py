@@ -0,0 +1,306 @@
+import asyncio
+import functools
+from contextlib import asynccontextmanager
+
+import aiohttp
+
+from basketball_reference_web_scraper import http_client
+from basketball_reference_web_scraper import parsers
+from basketball_reference_web_scraper.errors import InvalidDate, IncompleteBoxScores, PageNotArchived
+
+## asyncio counterpart of http_client:  same pages, same parsers, but the requests are made
+## with aiohttp so that many pages can be in flight from a single event loop
+
+DEFAULT_LIMIT = 100
+DEFAULT_LIMIT_PER_HOST = 10
+DEFAULT_TIMEOUT = 60
+CONNECTION_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+OK = 200
+NOT_MODIFIED = 304
+
+
+def create_session(limit=DEFAULT_LIMIT, limit_per_host=DEFAULT_LIMIT_PER_HOST, timeout=DEFAULT_TIMEOUT):
+    """
+    build an aiohttp.ClientSession that pools keep-alive connections
+
+    has to be called from inside a running event loop, and closed when you're done with it
+    (e.g. `async with create_session() as session:`)
+
+    Args:
+        limit (int):  maximum number of connections open at once
+        limit_per_host (int):  maximum number of connections open at once to basketball-reference
+        timeout (float):  total timeout in seconds for a single request
+    """
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host)
+    return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout))
+
+
+@asynccontextmanager
+async def session_or_new(session=None):
+    """
+    use `session` if one is given, otherwise open a session just for the duration of the block
+    """
+    if session is not None:
+        yield session
+    else:
+        async with create_session() as new_session:
+            yield new_session
+
+
+async def fetch(url, session=None, **kwargs):
+    """
+    GET a url with the current USER_AGENT and return (status code, body)
+
+    raises aiohttp.ClientResponseError for 4xx and 5xx responses.  requests share
+    http_client's rate limiter, retry policy, cache and archive (see `func:http_client.set_rate_limiter`,
+    `func:http_client.set_retry_policy`, `func:http_client.set_cache` and `func:http_client.set_archive`)
+    when they're set; connection errors and timeouts are retried when the retry policy's
+    retry_exceptions include them (the defaults do), as they are for `func:http_client.fetch`.
+    when the archive is being replayed nothing is downloaded, and PageNotArchived is raised for
+    pages that were never archived.
+    """
+    archive = http_client.get_archive()
+    params = kwargs.get('params')
+    if http_client.is_replaying_archive():
+        body = await _in_thread(archive.latest, url, params=params)
+        if body is None:
+            raise PageNotArchived(url=url, params=params)
+        return OK, body
+
+    cache = http_client.get_cache()
+    async with session_or_new(session) as session:
+        if cache is None:
+            status, _, body = await _send(session, url, {'User-Agent': http_client.USER_AGENT}, **kwargs)
+            downloaded = True
+        else:
+            (status, body), downloaded = await _fetch_with_cache(cache, session, url, **kwargs)
+
+    if archive is not None and downloaded and status == OK:
+        await _in_thread(archive.store, url, body, params=params)
+
+    return status, body
+
+
+async def _send(session, url, headers, **kwargs):
+    retry_policy = http_client.get_retry_policy()
+    attempt = 1
+    while True:
+        try:
+            return await _fetch_when_allowed(session, url, headers, **kwargs)
+        except aiohttp.ClientResponseError as error:
+            if retry_policy is None or not retry_policy.should_retry(attempt, status_code=error.status):
+                raise
+            await retry_policy.wait_async(url, attempt, error.status, headers=error.headers)
+        except CONNECTION_ERRORS as error:
+            if retry_policy is None or not retry_policy.should_retry(attempt, exception=error):
+                raise
+            await retry_policy.wait_async(url, attempt, error)
+        attempt += 1
+
+
+async def _fetch_when_allowed(session, url, headers, **kwargs):
+    """
+    returns the status code, headers and body of the response
+    """
+    rate_limiter = http_client.get_rate_limiter()
+    deferrals = 0
+    while True:
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async()
+        async with session.get(url, headers=headers, **kwargs) as response:
+            if rate_limiter is not None and deferrals < rate_limiter.max_deferrals:
+                pause = rate_limiter.retry_after(response.status, response.headers)
+                if pause is not None:
+                    rate_limiter.pause(pause)
+                    deferrals += 1
+                    continue
+            response.raise_for_status()
+            return response.status, response.headers, await response.read()
+
+
+async def _in_thread(function, *args, **kwargs):
+    ## the cache and the archive are sqlite databases (and the archive gzips):  their reads
+    ## and writes shouldn't block the event loop
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(function, *args, **kwargs))
+
+
+async def _fetch_with_cache(cache, session, url, **kwargs):
+    """
+    the same as `func:http_client._fetch_with_cache`:  fresh pages come straight from the
+    cache, stale ones are revalidated with a conditional request.  returns (status code, body)
+    and whether the body was downloaded (rather than read from the cache)
+    """
+    params = kwargs.get('params')
+    entry = await _in_thread(cache.lookup, url, params)
+    if entry is not None and cache.is_fresh(entry, url):
+        return (OK, entry.body), False
+
+    headers = {'User-Agent': http_client.USER_AGENT}
+    if entry is not None:
+        if entry.etag is not None:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified is not None:
+            headers['If-Modified-Since'] = entry.last_modified
+
+    status, response_headers, body = await _send(session, url, headers, **kwargs)
+
+    if entry is not None and status == NOT_MODIFIED:
+        await _in_thread(cache.refresh, url, params)
+        return (OK, entry.body), False
+
+    if status == OK:
+        await _in_thread(cache.store, url, body, params=params,
+            etag=response_headers.get('ETag'), last_modified=response_headers.get('Last-Modified'))
+
+    return (status, body), True
+
+
+async def run_parser(parser, page, *args, **kwargs):
+    """
+    call one of the `parsers` on a page; with a parse executor set (see 
+    `func:http_client.set_parse_executor`), it runs there without blocking the event loop
+    """
+    executor = http_client.get_parse_executor()
+    if executor is None:
+        return parser(page, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor,
+        functools.partial(parser, page, *args, **kwargs))
+
+
+async def players_season_totals(season_end_year, skip_totals=False, playoffs=False, session=None, columnar=False):
+    if playoffs:
+        url = f'{http_client.BASE_URL}/playoffs/NBA_{season_end_year}_totals.html'
+    else:
+        url = f'{http_client.BASE_URL}/leagues/NBA_{season_end_year}_totals.html'
+    _, content = await fetch(url=url, session=session)
+    return await run_parser(parsers.parse_players_season_totals, content, skip_totals=skip_totals,
+        columnar=columnar)
+
+
+async def players_advanced_stats(season_end_year, skip_totals=False, playoffs=False, session=None, columnar=False):
+    if playoffs:
+        url = f'{http_client.BASE_URL}/playoffs/NBA_{season_end_year}_advanced.html'
+    else:
+        url = f'{http_client.BASE_URL}/leagues/NBA_{season_end_year}_advanced.html'
+    _, content = await fetch(url=url, session=session)
+    return await run_parser(parsers.parse_players_advanced_stats, content, skip_totals=skip_totals,
+        columnar=columnar)
+
+
+async def players_season_totals_per100(season_end_year, skip_totals=False, playoffs=False, session=None, columnar=False):
+    if playoffs:
+        url = f'{http_client.BASE_URL}/playoffs/NBA_{season_end_year}_per_poss.html'
+    else:
+        url = f'{http_client.BASE_URL}/leagues/NBA_{season_end_year}_per_poss.html'
+    _, content = await fetch(url=url, session=session)
+    return await run_parser(parsers.parse_players_season_totals_per100, content, skip_totals=skip_totals,
+        columnar=columnar)
+
+
+async def player_box_scores(day, month, year, session=None, records=False):
+    url = f'{http_client.BASE_URL}/friv/dailyleaders.cgi?month={month}&day={day}&year={year}'
+
+    status, content = await fetch(url=url, session=session, allow_redirects=False)
+
+    if status == 200:
+        return await run_parser(parsers.parse_player_box_scores, content, records=records)
+
+    raise InvalidDate(day=day, month=month, year=year)
+
+
+async def schedule_for_month(url, session=None, records=False):
+    _, content = await fetch(url=url, session=session)
+    return await run_parser(parsers.parse_schedule, content, records=records)
+
+
+async def season_schedule(season_end_year, session=None, records=False):
+    """
+    the schedule for the whole season; the pages for the other months are all
+    requested at once, and the games are returned in chronological order
+    """
+    url = f'{http_client.BASE_URL}/leagues/NBA_{season_end_year}_games.html'
+
+    async with session_or_new(session) as session:
+        _, content = await fetch(url=url, session=session)
+
+        season_schedule_values = await run_parser(parsers.parse_schedule, content, records=records)
+        other_month_url_paths = await run_parser(parsers.parse_schedule_for_month_url_paths, content)
+
+        monthly_schedules = await asyncio.gather(*[
+            schedule_for_month(url=f'{http_client.BASE_URL}{month_url_path}', session=session, records=records)
+            for month_url_path in other_month_url_paths
+        ])
+
+    for monthly_schedule in monthly_schedules:
+        season_schedule_values.extend(monthly_schedule)
+
+    return season_schedule_values
+
+
+async def team_box_score(game_url_path, session=None):
+    url = f"{http_client.BASE_URL}/{game_url_path}"
+    _, content = await fetch(url=url, session=session)
+    return await run_parser(parsers.parse_team_totals, content)
+
+
+async def team_box_scores(day, month, year, session=None):
+    """
+    the team totals of every game on a day, in the order the games are listed.  all the
+    games are requested at once; if any fail, IncompleteBoxScores is raised with the box
+    scores that succeeded and the error for each game that didn't
+    """
+    url = f"{http_client.BASE_URL}/boxscores/"
+
+    async with session_or_new(session) as session:
+        _, content = await fetch(url=url, session=session,
+            params={"day": day, "month": month, "year": year})
+
+        game_url_paths = await run_parser(parsers.parse_game_url_paths, content)
+
+        games_box_scores = await asyncio.gather(*[
+            team_box_score(game_url_path=game_url_path, session=session)
+            for game_url_path in game_url_paths
+        ], return_exceptions=True)
+
+    box_scores = []
+    failures = {}
+    for game_url_path, game_box_scores in zip(game_url_paths, games_box_scores):
+        if isinstance(game_box_scores, BaseException):
+            ## a cancellation (or KeyboardInterrupt) isn't a failed game; it stops the whole day
+            if not isinstance(game_box_scores, Exception):
+                raise game_box_scores
+            failures[game_url_path] = game_box_scores
+        else:
+            box_scores.extend(game_box_scores)
+
+    if failures:
+        raise IncompleteBoxScores(box_scores=box_scores, failures=failures)
+
+    return box_scores
+
+
+async def player_career(player_id, tables=['totals', 'advanced'], session=None):
+    if isinstance(tables, str):
+        tables = [tables]
+
+    tables = [table.lower() for table in tables]
+
+    first_init = player_id[0]
+    url = f'{http_client.BASE_URL}/players/{first_init}/{player_id}.html'
+
+    _, content = await fetch(url=url, session=session)
+
+    return await run_parser(parsers.parse_players_career_tables, content, tables)
+
+
+async def playoffs_series(playoffs_year, session=None):
+    url = f'{http_client.BASE_URL}/playoffs/NBA_{playoffs_year}.html'
+    _, content = await fetch(url=url, session=session)
+    return await run_parser(parsers.parse_playoff_series_list, content)
+
+
+async def playoff_series_stats(playoff_series, tables=['basic', 'advanced'], session=None):
+    url = f"{http_client.BASE_URL}/{playoff_series['stats_link_ending']}"
+    _, content = await fetch(url=url, session=session)
+
+    return await run_parser(parsers.parse_playoff_series_stats_tables, content, playoff_series, tables)
@@ -0,0 +1,134 @@
+import collections
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode
+
+## cached pages are revalidated after a day unless a pattern says otherwise
+DEFAULT_TTL = 24 * 60 * 60
+## 1 GB
+DEFAULT_MAX_SIZE = 1024 ** 3
+
+CacheEntry = collections.namedtuple('CacheEntry', ['body', 'etag', 'last_modified', 'fetched_at'])
+
+
+def request_key(url, params=None):
+    """
+    a url plus its query parameters (in a fixed order), identifying a single page
+    """
+    if not params:
+        return url
+    return url + '?' + urlencode(sorted(params.items()))
+
+
+class ResponseCache:
+    r"""
+    a persistent, size-bounded cache of page bodies keyed by url and query parameters
+
+    pages are kept in a single sqlite database, so the cache survives between runs and
+    can be shared by threads (and processes) pointing at the same path.  see
+    `func:http_client.set_cache` to have every request go through it.
+
+    Args:
+        path (str):  file to keep the cache in; created if it doesn't exist
+        ttls (list):  (pattern, seconds) pairs; the first pattern that `re.search`es a url
+            decides how long a page stays fresh.  None means it never goes stale, which
+            suits pages that won't change again, e.g.
+            [(r'/leagues/NBA_(19\d\d|200\d|201[0-8])_', None), (r'/boxscores/\?', 60)]
+        default_ttl (float):  seconds a page stays fresh when no pattern matches
+        max_size (int):  total bytes of page bodies to keep; the least recently used pages
+            are evicted first once it's exceeded
+
+    stale pages aren't thrown away:  they're revalidated with If-None-Match/If-Modified-Since,
+    and a 304 response just marks them fresh again.
+    """
+    def __init__(self, path, ttls=None, default_ttl=DEFAULT_TTL, max_size=DEFAULT_MAX_SIZE):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.ttls = [(re.compile(pattern), ttl) for (pattern, ttl) in (ttls or [])]
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB, etag TEXT, last_modified TEXT, "
+            "fetched_at REAL, accessed_at REAL, size INTEGER)")
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    @staticmethod
+    def key(url, params=None):
+        return request_key(url, params)
+
+    def ttl(self, url):
+        for pattern, ttl in self.ttls:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    def is_fresh(self, entry, url, now=None):
+        ttl = self.ttl(url)
+        if ttl is None:
+            return True
+        now = time.time() if now is None else now
+        return now - entry.fetched_at < ttl
+
+    def lookup(self, url, params=None):
+        key = self.key(url, params)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return CacheEntry(*row)
+
+    def store(self, url, body, params=None, etag=None, last_modified=None):
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.key(url, params), body, etag, last_modified, now, now, len(body)))
+            self._evict()
+
+    def refresh(self, url, params=None):
+        """
+        mark a cached page as freshly fetched (e.g. after a 304 Not Modified)
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, self.key(url, params)))
+
+    def size(self):
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self):
+        total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total_size <= self.max_size:
+            return
+
+        rows = self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        evicted_keys = []
+        for key, size in rows:
+            if total_size <= self.max_size:
+                break
+            evicted_keys.append((key,))
+            total_size -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted_keys)
@@ -1,18 +1,21 @@
 import requests
 import warnings
 import copy
+import datetime
+import functools
 import os
 
 from basketball_reference_web_scraper import http_client
 from basketball_reference_web_scraper import output
-from basketball_reference_web_scraper.data import OutputType
 
-from basketball_reference_web_scraper.errors import InvalidSeason, InvalidDate, InvalidPlayer
+from basketball_reference_web_scraper.errors import InvalidSeason, InvalidDate, InvalidPlayer, InvalidSeries
 from basketball_reference_web_scraper.json_encoders import BasketballReferenceJSONEncoder
+from basketball_reference_web_scraper.parsers.schedule import EASTERN
 
 
 def players_season_totals(season_end_year, playoffs=False, skip_totals=False, 
-    output_type=None, output_file_path=None, output_write_option=None, json_options=None):
+    output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None, columnar=False):
     """
     scrape the "Totals" stats of all players from a single year
 
@@ -22,17 +25,25 @@ def players_season_totals(season_end_year, playoffs=False, skip_totals=False,
         skip_totals (bool):  whether (True) or not (False) to skip the rows representing for 
             the complete year of a player that is traded (no effect for the playoffs)
 
-        output_type (str):  either csv or json, if you want to save that type of file
-        output_file_path (str): file you want to save to
-        output_write_option (str):  whether to write (default) or append
+        output_type (str):  csv, json, json_lines or parquet, if you want to save that type of file
+        output_file_path (str): file you want to save to (for parquet, the directory of the dataset)
+        output_write_option (str):  whether to write (default) or append; a parquet dataset is
+            appended to unless OutputWriteOption.WRITE is given, which replaces the season
         json_options (dict):  dictionary of options to pass to the json writer
 
+        session (requests.Session):  session to make the requests with; defaults to the 
+            pooled session shared by `http_client` (see `func:http_client.create_session`)
+        columnar (bool):  return the table as columns rather than rows:  a dictionary from
+            each name in COLUMN_RENAMER to its values, in an array.array for the numeric
+            columns and a list for the rest
+
     Returns:
         a list of rows; each row is a dictionary with items named from COLUMN_RENAMER
+        (or the columns, with columnar=True)
     """
     try:
         values = http_client.players_season_totals(season_end_year, 
-            skip_totals=skip_totals, playoffs=playoffs)
+            skip_totals=skip_totals, playoffs=playoffs, session=session, columnar=columnar)
     except requests.exceptions.HTTPError as http_error:
         if http_error.response.status_code == requests.codes.not_found:
             raise InvalidSeason(season_end_year=season_end_year)
@@ -46,11 +57,13 @@ def players_season_totals(season_end_year, playoffs=False, skip_totals=False,
         csv_writer=output.players_season_totals_to_csv,
         encoder=BasketballReferenceJSONEncoder,
         json_options=json_options,
+        partition={'season': season_end_year},
     )
 
 
 def players_advanced_stats(season_end_year, playoffs=False, skip_totals=False, 
-    output_type=None, output_file_path=None, output_write_option=None, json_options=None):
+    output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None, columnar=False):
     """
     scrape the "Advanced" stats of all players from a single year
 
@@ -60,17 +73,25 @@ def players_advanced_stats(season_end_year, playoffs=False, skip_totals=False,
         skip_totals (bool):  whether (True) or not (False) to skip the rows representing for 
             the complete year of a player that is traded (no effect for the playoffs)
 
-        output_type (str):  either csv or json, if you want to save that type of file
-        output_file_path (str): file you want to save to
-        output_write_option (str):  whether to write (default) or append
+        output_type (str):  csv, json, json_lines or parquet, if you want to save that type of file
+        output_file_path (str): file you want to save to (for parquet, the directory of the dataset)
+        output_write_option (str):  whether to write (default) or append; a parquet dataset is
+            appended to unless OutputWriteOption.WRITE is given, which replaces the season
         json_options (dict):  dictionary of options to pass to the json writer
 
+        session (requests.Session):  session to make the requests with; defaults to the 
+            pooled session shared by `http_client` (see `func:http_client.create_session`)
+        columnar (bool):  return the table as columns rather than rows:  a dictionary from
+            each name in COLUMN_RENAMER to its values, in an array.array for the numeric
+            columns and a list for the rest
+
     Returns:
         a list of rows; each row is a dictionary with items named from COLUMN_RENAMER
+        (or the columns, with columnar=True)
     """
     try:
         values = http_client.players_advanced_stats(season_end_year, 
-            skip_totals=skip_totals, playoffs=playoffs)
+            skip_totals=skip_totals, playoffs=playoffs, session=session, columnar=columnar)
     except requests.exceptions.HTTPError as http_error:
         if http_error.response.status_code == requests.codes.not_found:
             raise InvalidSeason(season_end_year=season_end_year)
@@ -84,11 +105,13 @@ def players_advanced_stats(season_end_year, playoffs=False, skip_totals=False,
         csv_writer=output.players_advanced_to_csv,
         encoder=BasketballReferenceJSONEncoder,
         json_options=json_options,
+        partition={'season': season_end_year},
     )
 
 
 def players_season_totals_per100(season_end_year, playoffs=False, skip_totals=False, 
-    output_type=None, output_file_path=None, output_write_option=None, json_options=None):
+    output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None, columnar=False):
     """
     scrape the "Totals per 100 possessions" stats of all players from a single year.  
 
@@ -100,20 +123,28 @@ def players_season_totals_per100(season_end_year, playoffs=False, skip_totals=Fa
         skip_totals (bool):  whether (True) or not (False) to skip the rows representing for 
             the complete year of a player that is traded (no effect for the playoffs)
 
-        output_type (str):  either csv or json, if you want to save that type of file
-        output_file_path (str): file you want to save to
-        output_write_option (str):  whether to write (default) or append
+        output_type (str):  csv, json, json_lines or parquet, if you want to save that type of file
+        output_file_path (str): file you want to save to (for parquet, the directory of the dataset)
+        output_write_option (str):  whether to write (default) or append; a parquet dataset is
+            appended to unless OutputWriteOption.WRITE is given, which replaces the season
         json_options (dict):  dictionary of options to pass to the json writer
 
+        session (requests.Session):  session to make the requests with; defaults to the 
+            pooled session shared by `http_client` (see `func:http_client.create_session`)
+        columnar (bool):  return the table as columns rather than rows:  a dictionary from
+            each name in COLUMN_RENAMER to its values, in an array.array for the numeric
+            columns and a list for the rest
+
     Returns:
         a list of rows; each row is a dictionary with items named from COLUMN_RENAMER
+        (or the columns, with columnar=True)
     """
     if season_end_year < 1974:
         raise ValueError("Per 100 Poss stats aren't available before 1974")
 
     try:
         values = http_client.players_season_totals_per100(season_end_year, 
-            skip_totals=skip_totals, playoffs=playoffs)
+            skip_totals=skip_totals, playoffs=playoffs, session=session, columnar=columnar)
     except requests.exceptions.HTTPError as http_error:
         if http_error.response.status_code == requests.codes.not_found:
             raise InvalidSeason(season_end_year=season_end_year)
@@ -127,12 +158,86 @@ def players_season_totals_per100(season_end_year, playoffs=False, skip_totals=Fa
         csv_writer=output.players_season_totals_per100_to_csv,
         encoder=BasketballReferenceJSONEncoder,
         json_options=json_options,
+        partition={'season': season_end_year},
     )
 
 
-def player_box_scores(day, month, year, output_type=None, output_file_path=None, output_write_option=None, json_options=None):
+## the season-level tables `func:players_season_tables` knows how to fetch
+SEASON_TABLES = {
+    'totals': http_client.players_season_totals,
+    'advanced': http_client.players_advanced_stats,
+    'per100': http_client.players_season_totals_per100,
+}
+FIRST_PER100_SEASON = 1974
+
+
+def players_season_tables(season_end_years, tables=['totals', 'advanced', 'per100'], playoffs=False,
+    skip_totals=False, max_workers=4, session=None):
+    """
+    scrape several season-level tables for many seasons at once, e.g. to build up every 
+    season since 1950:
+
+        for season_end_year, table, rows in players_season_tables(range(1950, 2020)):
+            ...
+
+    the pages are downloaded concurrently over the shared session, and each is yielded 
+    as soon as it's parsed, so they don't come back in any particular order.  "per100"
+    isn't available before 1974 and is quietly skipped for earlier seasons.
+
+    Args:
+        season_end_years (iterable):  years in which the seasons end
+        tables (list):  any of "totals", "advanced" and "per100"
+        playoffs (bool):  whether to grab the playoffs (True) or regular season (False) tables
+        skip_totals (bool):  same as `func:players_season_totals`
+        max_workers (int):  how many pages to download and parse at once
+        session (requests.Session):  same as `func:players_season_totals`
+
+    Yields:
+        (season_end_year, table, rows) tuples, where rows are the same as the matching
+        single-season function returns.  raises InvalidSeason for a season that doesn't exist
+    """
+    for table in tables:
+        if table not in SEASON_TABLES:
+            raise ValueError(f"Unknown season table {table!r}; expected one of {sorted(SEASON_TABLES)}")
+
+    requests_to_make = [
+        (season_end_year, table)
+        for season_end_year in season_end_years
+        for table in tables
+        if not (table == 'per100' and season_end_year < FIRST_PER100_SEASON)
+    ]
+
+    def fetch_table(request):
+        season_end_year, table = request
+        try:
+            return SEASON_TABLES[table](season_end_year, skip_totals=skip_totals, playoffs=playoffs,
+                session=session)
+        except requests.exceptions.HTTPError as http_error:
+            if http_error.response.status_code == requests.codes.not_found:
+                raise InvalidSeason(season_end_year=season_end_year)
+            else:
+                raise http_error
+
+    for (season_end_year, table), values in http_client.map_as_completed(fetch_table, requests_to_make,
+        max_workers=max_workers):
+        yield season_end_year, table, values
+
+
+def player_box_scores(day, month, year, output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None, records=False):
+    """
+    get the box score of every player who played on a single day
+
+    Args:
+        day, month, year (int):  the date of the games
+        records (bool):  return `records.PlayerBoxScore` records rather than dicts; they 
+            read the same but take much less memory, and can't be changed
+
+        Output-related args and session are the same as `func:players_season_totals`
+    """
     try:
-        values = http_client.player_box_scores(day=day, month=month, year=year)
+        values = http_client.player_box_scores(day=day, month=month, year=year, session=session,
+            records=records)
     except requests.exceptions.HTTPError as http_error:
         if http_error.response.status_code == requests.codes.not_found:
             raise InvalidDate(day=day, month=month, year=year)
@@ -149,9 +254,23 @@ def player_box_scores(day, month, year, output_type=None, output_file_path=None,
     )
 
 
-def team_box_scores(day, month, year, output_type=None, output_file_path=None, output_write_option=None, json_options=None):
+def team_box_scores(day, month, year, output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None, max_workers=None):
+    """
+    get the team totals from every game played on a single day
+
+    Args:
+        day, month, year (int):  the date of the games
+        max_workers (int):  how many of the games to download and parse at once.  
+            when set, games that fail don't stop the rest; an `IncompleteBoxScores`
+            error is raised at the end that holds both the box scores that succeeded 
+            (`.box_scores`) and the error for each failed game (`.failures`)
+
+        Output-related args and session are the same as `func:players_season_totals`
+    """
     try:
-        values = http_client.team_box_scores(day=day, month=month, year=year)
+        values = http_client.team_box_scores(day=day, month=month, year=year, session=session,
+            max_workers=max_workers)
     except requests.exceptions.HTTPError as http_error:
         if http_error.response.status_code == requests.codes.not_found:
             raise InvalidDate(day=day, month=month, year=year)
@@ -168,9 +287,114 @@ def team_box_scores(day, month, year, output_type=None, output_file_path=None, o
     )
 
 
-def season_schedule(season_end_year, output_type=None, output_file_path=None, output_write_option=None, json_options=None):
+def player_box_scores_between(start_date, end_date, schedule=None, max_workers=4, checkpoint_file_path=None,
+    session=None, records=False):
+    """
+    get the player box scores from every day between two dates, e.g. for a whole season:
+
+        schedule = season_schedule(2019)
+        for day, box_scores in player_box_scores_between(date(2018, 10, 16), date(2019, 4, 10), schedule):
+            ...
+
+    the days are downloaded concurrently and each is yielded as soon as it's parsed, so 
+    they don't come back in date order.  days without games are yielded with no box scores.
+    with a rate limiter set (see `func:http_client.set_rate_limiter`), raising max_workers
+    until requests queue up on the limiter keeps it busy.
+
+    Args:
+        start_date, end_date (datetime.date):  the first and last days (inclusive)
+        schedule (list):  the output of `func:season_schedule`; when given, only the days 
+            with a game on the schedule (in US Eastern time, like the site) are fetched
+        max_workers (int):  how many days to download and parse at once
+        checkpoint_file_path (str):  a file to record each finished day in.  days already 
+            recorded there are skipped, so a harvest that's interrupted carries on where it
+            left off when it's started again with the same file.  a day is only recorded once 
+            the caller has moved on from it
+        session (requests.Session):  same as `func:players_season_totals`
+        records (bool):  same as `func:player_box_scores`; worth it when a long harvest is
+            kept in memory
+
+    Yields:
+        (datetime.date, list of box scores) tuples
+    """
+    return _box_scores_between(functools.partial(_player_box_scores_on_day, records=records),
+        start_date, end_date, schedule=schedule,
+        max_workers=max_workers, checkpoint_file_path=checkpoint_file_path, session=session)
+
+
+def team_box_scores_between(start_date, end_date, schedule=None, max_workers=4, checkpoint_file_path=None,
+    session=None):
+    """
+    get the team totals from every game played between two dates; the same as 
+    `func:player_box_scores_between` but yields the rows `func:team_box_scores` returns
+    """
+    return _box_scores_between(_team_box_scores_on_day, start_date, end_date, schedule=schedule,
+        max_workers=max_workers, checkpoint_file_path=checkpoint_file_path, session=session)
+
+
+def _player_box_scores_on_day(day, session=None, records=False):
+    try:
+        return http_client.player_box_scores(day=day.day, month=day.month, year=day.year, session=session,
+            records=records)
+    except InvalidDate:
+        ## the site redirects days without any games
+        return []
+
+
+def _team_box_scores_on_day(day, session=None):
+    return http_client.team_box_scores(day=day.day, month=day.month, year=day.year, session=session)
+
+
+def _game_days(schedule):
+    return {game["start_time"].astimezone(EASTERN).date() for game in schedule}
+
+
+def _box_scores_between(box_scores_on_day, start_date, end_date, schedule, max_workers, checkpoint_file_path,
+    session):
+    days = [start_date + datetime.timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    if schedule is not None:
+        game_days = _game_days(schedule)
+        days = [day for day in days if day in game_days]
+
+    finished_days = set()
+    if checkpoint_file_path is not None and os.path.exists(checkpoint_file_path):
+        with open(checkpoint_file_path) as checkpoint_file:
+            finished_days = {datetime.datetime.strptime(line.strip(), "%Y-%m-%d").date()
+                for line in checkpoint_file if line.strip()}
+    days = [day for day in days if day not in finished_days]
+
+    def fetch_day(day):
+        try:
+            return box_scores_on_day(day, session=session)
+        except requests.exceptions.HTTPError as http_error:
+            if http_error.response.status_code == requests.codes.not_found:
+                raise InvalidDate(day=day.day, month=day.month, year=day.year)
+            else:
+                raise http_error
+
+    for day, values in http_client.map_as_completed(fetch_day, days, max_workers=max_workers):
+        yield day, values
+        if checkpoint_file_path is not None:
+            with open(checkpoint_file_path, 'a') as checkpoint_file:
+                checkpoint_file.write(day.isoformat() + '\n')
+
+
+def season_schedule(season_end_year, output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None, max_workers=None, records=False):
+    """
+    get every game of a season
+
+    Args:
+        season_end_year (int):  year in which the season ends, e.g. 2019 for 2018-2019 season
+        max_workers (int):  how many of the monthly schedule pages to download and parse at 
+            once; defaults to one at a time.  the games are in the same order either way
+        records (bool):  return `records.Game` records rather than dicts
+
+        Output-related args and session are the same as `func:players_season_totals`
+    """
     try:
-        values = http_client.season_schedule(season_end_year)
+        values = http_client.season_schedule(season_end_year, session=session, max_workers=max_workers,
+            records=records)
     except requests.exceptions.HTTPError as http_error:
         # https://github.com/requests/requests/blob/master/requests/status_codes.py#L58
         if http_error.response.status_code == requests.codes.not_found:
@@ -185,11 +409,13 @@ def season_schedule(season_end_year, output_type=None, output_file_path=None, ou
         csv_writer=output.schedule_to_csv,
         encoder=BasketballReferenceJSONEncoder,
         json_options=json_options,
+        partition={'season': season_end_year},
     )
 
 
 def single_player_career_tables(player_id, tables=['totals', 'advanced'], 
-    output_type=None, output_file_path=None, output_write_option=None, json_options=None):
+    output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None):
     """
     get one or more tables of a players career (one line per season)
 
@@ -204,26 +430,38 @@ def single_player_career_tables(player_id, tables=['totals', 'advanced'],
             subset of the entries/aliases in 
             `basketball_reference_web_scraper.parsers.player_career.UNIQUE_CAREER_TABLES`,
 
-        Output-related args are the same as `func:players_season_totals` and 
+        Output-related args and session are the same as `func:players_season_totals` and 
         `func:players_advanced_stats`
     
     Returns:
         a dictionary of tables 
     """
-    if tables in ['all', 'All', 'ALL']:
-        from basketball_reference_web_scraper.parsers.player_career import UNIQUE_CAREER_TABLES
-        tables = UNIQUE_CAREER_TABLES
-    if isinstance(tables, str):
-        tables = [tables]
+    tables = _resolve_career_tables(tables)
 
     try:
-        values_list = http_client.player_career(player_id, tables)
+        values_list = http_client.player_career(player_id, tables, session=session)
     except requests.exceptions.HTTPError as http_error:
         if http_error.response.status_code == requests.codes.not_found:
             raise InvalidPlayer(player_id=player_id)
         else:
             raise http_error
 
+    return _output_career_tables(tables, values_list, output_type=output_type, 
+        output_file_path=output_file_path, output_write_option=output_write_option, 
+        json_options=json_options)
+
+
+def _resolve_career_tables(tables):
+    if tables in ['all', 'All', 'ALL']:
+        from basketball_reference_web_scraper.parsers.player_career import UNIQUE_CAREER_TABLES
+        tables = UNIQUE_CAREER_TABLES
+    if isinstance(tables, str):
+        tables = [tables]
+    return tables
+
+
+def _output_career_tables(tables, values_list, output_type, output_file_path, 
+    output_write_option, json_options):
     if output_file_path is not None and len(tables) > 1:
         if output_file_path.endswith('.csv'):
             output_file_path = output_file_path[:-4]
@@ -243,7 +481,7 @@ def single_player_career_tables(player_id, tables=['totals', 'advanced'],
 
 
 def all_playoffs_series_in_one_year(year, tables=['basic', 'advanced'], output_type=None, 
-    output_directory=None, output_write_option=None, json_options=None):
+    output_directory=None, output_write_option=None, json_options=None, session=None):
     """
     download the list of playoff series in a year, then download the stats from each of those series
 
@@ -251,31 +489,50 @@ def all_playoffs_series_in_one_year(year, tables=['basic', 'advanced'], output_t
         year (int):  year of the playoffs to download
         tables (list or str):  which tables to grab for each series (i.e., basic, advanced, or both)
         output_directory (str):  where to save the tables.  you'll get a file giving the series,
-            then a file for each table for each series.
+            then a file for each table for each series.  without one nothing is saved, 
+            whatever output_type is
         
-        other output arguements are the same as `func:players_season_totals`
+        other output arguements and session are the same as `func:players_season_totals`
 
     Returns:
         a dictionary of dictionaries, where the outer key is the unique name of the series
         and the inner name is the name of the table (i.e. basic or advanced)
     """
-    kwargs = dict(output_type=output_type, output_write_option=output_write_option, json_options=json_options)
+    output_base, schedule_output_path = _playoffs_output_base(year, output_directory)
+    if output_base is None:
+        ## nowhere to write to, and the series have to stay rows (not in-memory json) to be named
+        output_type = None
 
-    if output_directory is not None:
-        if not output_directory.endswith('/'):  
-            output_directory += '/'
+    kwargs = dict(output_type=output_type, output_write_option=output_write_option, json_options=json_options,
+        session=session)
 
-        if str(year) not in os.path.abspath(output_directory):
-            output_base = output_directory + f'{year}'
-        else:
-            output_base = output_directory
+    series_list = playoff_series_list(year, output_file_path=schedule_output_path, **kwargs)
+    output_file_path_list = _name_playoff_series(series_list, output_base)
+
+    return {series['unique_series_name']: playoff_series_stats(series, tables, output_file_path=output_file_path, **kwargs)
+        for (series, output_file_path) in zip(series_list, output_file_path_list)}
 
-        schedule_output_path = output_base + 'playoff_schedule.csv'
+
+def _playoffs_output_base(year, output_directory):
+    if output_directory is None:
+        return None, None
+
+    if not output_directory.endswith('/'):  
+        output_directory += '/'
+
+    if str(year) not in os.path.abspath(output_directory):
+        output_base = output_directory + f'{year}'
     else:
-        schedule_output_path = None
+        output_base = output_directory
+
+    return output_base, output_base + 'playoff_schedule.csv'
 
-    series_list = playoff_series_list(year, output_file_path=schedule_output_path, **kwargs)
 
+def _name_playoff_series(series_list, output_base):
+    """
+    give each series a unique name (e.g. the first of the first-round series is 
+    'Western Conference First Round_0') and return the output file path for each
+    """
     series_count = {}
     for series in series_list:
         round_name = series['series_name']
@@ -298,17 +555,15 @@ def all_playoffs_series_in_one_year(year, tables=['basic', 'advanced'], output_t
         series['round_name'] = round_name
         series['unique_series_name'] = unique_series_name
 
-    if output_directory is not None:
-        output_file_path_list = [output_base + series['unique_series_name'] for series in series_list]
+    if output_base is not None:
+        return [output_base + series['unique_series_name'] for series in series_list]
     else:
-        output_file_path_list = [None] * len(series_list)
-
-    return {series['unique_series_name']: playoff_series_stats(series, tables, output_file_path=output_file_path, **kwargs)
-        for (series, output_file_path) in zip(series_list, output_file_path_list)}
+        return [None] * len(series_list)
 
 
 def playoff_series_stats(playoff_series, tables=['basic', 'advanced'], 
-    output_type=None, output_file_path=None, output_write_option=None, json_options=None):
+    output_type=None, output_file_path=None, output_write_option=None, json_options=None,
+    session=None):
     """
     get basic and/or advanced stats from a given playoff series
 
@@ -331,15 +586,37 @@ def playoff_series_stats(playoff_series, tables=['basic', 'advanced'],
 
         tables (list-like):  A dictionary of the tables to pull out of the page.
                              either 'basic', 'advanced', or both.
+
+        session (requests.Session):  session to make the requests with; defaults to the 
+            pooled session shared by `http_client`
+    """
+    tables, output_file_path, output_end = _playoff_series_stats_tables(
+        playoff_series, tables, output_type, output_file_path)
+
+    try:
+        values_list = http_client.playoff_series_stats(playoff_series, tables, session=session)
+    except requests.exceptions.HTTPError as http_error:
+        if http_error.response.status_code == requests.codes.not_found:
+            raise InvalidSeries(series=playoff_series)
+        else:
+            raise http_error
+
+    return _output_playoff_series_stats(tables, values_list, output_end, output_type=output_type, 
+        output_file_path=output_file_path, output_write_option=output_write_option, 
+        json_options=json_options)
+
+
+def _playoff_series_stats_tables(playoff_series, tables, output_type, output_file_path):
+    """
+    work out which tables can be fetched for a series, where they'll be written, and 
+    the extension of the output files
     """
     if isinstance(tables, str):
         tables = [tables]
 
+    output_end = None
     if output_type is not None:
-        if output_type == OutputType.JSON or output_type.upper()=="JSON":
-            output_end = 'json'
-        else:
-            output_end = 'csv'
+        output_end = output.output_file_extension(output_type)
 
     year = int(playoff_series['stats_link_ending'].split('/')[-1].split('-')[0])
     if year <= 1983 and 'advanced' in tables:
@@ -354,14 +631,11 @@ def playoff_series_stats(playoff_series, tables=['basic', 'advanced'],
         else:
             output_file_path = None
 
-    try:
-        values_list = http_client.playoff_series_stats(playoff_series, tables)
-    except requests.exceptions.HTTPError as http_error:
-        if http_error.response.status_code == requests.codes.not_found:
-            raise InvalidSeries(series=playoff_series)
-        else:
-            raise http_error
+    return tables, output_file_path, output_end
+
 
+def _output_playoff_series_stats(tables, values_list, output_end, output_type, output_file_path, 
+    output_write_option, json_options):
     if isinstance(output_file_path, list):
         assert len(output_file_path) >= len(tables), "must provide an output file for all tables if making by hand"
         output_file_path_list = output_file_path
@@ -385,7 +659,7 @@ def playoff_series_stats(playoff_series, tables=['basic', 'advanced'],
 
 
 def playoff_series_list(playoffs_year, output_type=None, output_file_path=None, 
-    output_write_option=None, json_options=None):
+    output_write_option=None, json_options=None, session=None):
     """
     get the list of playoff series that happened in the playoffs of a given year
 
@@ -396,7 +670,7 @@ def playoff_series_list(playoffs_year, output_type=None, output_file_path=None,
         raise ValueError("Can't parse the round-robin playoff schedule of 1954, sorry")
 
     try:
-        values = http_client.playoffs_series(playoffs_year)
+        values = http_client.playoffs_series(playoffs_year, session=session)
     except requests.exceptions.HTTPError as http_error:
         # https://github.com/requests/requests/blob/master/requests/status_codes.py#L58
         if http_error.response.status_code == requests.codes.not_found:
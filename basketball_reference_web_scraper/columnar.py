@@ -0,0 +1,180 @@
+import uuid
+from datetime import datetime
+from enum import Enum
+from itertools import chain
+
+from basketball_reference_web_scraper.parsers.common import COLUMN_RENAMER, COLUMN_PARSER, \
+    parse_team_as_string, parse_positions_as_string
+from basketball_reference_web_scraper.utilities import str_to_int, str_to_float, str_to_str, batches
+
+## columnar (Arrow / Parquet) output.  pyarrow is optional (pip install
+## basketball_reference_web_scraper[parquet]), so it's only imported once it's needed
+
+DEFAULT_ROWS_PER_GROUP = 1000
+
+## what each COLUMN_PARSER converter gives, as the name of a pyarrow type; teams and positions
+## only take a handful of values, so they're dictionary-encoded
+CONVERTER_ARROW_TYPES = {
+    str_to_int                : 'int64',
+    str_to_float              : 'float64',
+    str_to_str                : 'string',
+    parse_team_as_string      : 'dictionary',
+    parse_positions_as_string : 'dictionary',
+}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+    except ImportError:
+        raise ImportError("Parquet output needs pyarrow:  pip install basketball_reference_web_scraper[parquet]")
+    return pyarrow
+
+
+def _arrow_type(pa, name):
+    if name == 'dictionary':
+        return pa.dictionary(pa.int32(), pa.string())
+    if name == 'timestamp':
+        return pa.timestamp('us', tz='UTC')
+    return getattr(pa, name)()
+
+
+def header_column_types(header_columns):
+    """
+    the pyarrow type name of each output column of a table with the given header columns,
+    from COLUMN_RENAMER and COLUMN_PARSER
+    """
+    types = {}
+    for key in header_columns:
+        if key == 'empty':
+            continue
+        elif key == 'Player':
+            types['player_id'] = 'string'
+            types['player_name'] = 'string'
+        else:
+            types[COLUMN_RENAMER[key]] = CONVERTER_ARROW_TYPES.get(COLUMN_PARSER[key], 'float64')
+    return types
+
+
+def value_type(values):
+    """
+    the pyarrow type name for a column of python values, for columns that don't come
+    straight from a header (the enums and start times of box scores and schedules, ...)
+    """
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, Enum):
+            return 'dictionary'
+        if isinstance(value, bool):
+            return 'bool_'
+        if isinstance(value, datetime):
+            return 'timestamp'
+        if isinstance(value, int):
+            ## a column of mostly ints can still have a float in it
+            return 'float64' if any(isinstance(other, float) for other in values) else 'int64'
+        if isinstance(value, float):
+            return 'float64'
+        return 'string'
+    return 'string'
+
+
+def arrow_schema(rows, header_columns=None, partition=None):
+    """
+    the pyarrow schema for rows (a list of dicts, all with the same keys):  columns from a
+    header get the type of their COLUMN_PARSER converter, the rest are typed by their values.
+    partition columns go last.
+    """
+    pa = _import_pyarrow()
+    partition = partition or {}
+    types = header_column_types(header_columns) if header_columns is not None else {}
+    fields = [
+        pa.field(key, _arrow_type(pa, types[key] if key in types else value_type([row[key] for row in rows])))
+        for key in rows[0].keys() if key not in partition
+    ]
+    for key, value in partition.items():
+        fields.append(pa.field(key, _arrow_type(pa, value_type([value]))))
+    return pa.schema(fields)
+
+
+def _column(values):
+    ## enums are stored as their values
+    return [value.value if isinstance(value, Enum) else value for value in values]
+
+
+def record_batch(rows, schema, partition=None):
+    pa = _import_pyarrow()
+    partition = partition or {}
+    arrays = [
+        pa.array([partition[field.name]] * len(rows) if field.name in partition
+            else _column([row[field.name] for row in rows]), type=field.type)
+        for field in schema
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _leading_batches(row_groups, header_columns=None):
+    """
+    the first row groups, up to the one by which every column that's typed by its values
+    (see `func:value_type`) has had a value other than None, so that a column that starts
+    out empty (e.g. the scores of games that haven't been played yet) isn't typed as a string
+    """
+    header_types = header_column_types(header_columns) if header_columns is not None else {}
+    leading = []
+    untyped = None
+    for batch in row_groups:
+        leading.append(batch)
+        if untyped is None:
+            untyped = [key for key in batch[0].keys() if key not in header_types]
+        untyped = [key for key in untyped if all(row[key] is None for row in batch)]
+        if not untyped:
+            break
+    return leading
+
+
+def write_parquet_dataset(rows, base_dir, header_columns=None, partition=None,
+    rows_per_group=DEFAULT_ROWS_PER_GROUP, overwrite=False):
+    """
+    add rows to the Parquet dataset in base_dir, as a new file (so calls for different
+    seasons, or run at different times, append rather than overwrite) of row groups of
+    rows_per_group rows.  rows can be a generator; only one row group is held at a time,
+    except while a column typed by its values has only had Nones.
+
+    the dataset is hive-partitioned (base_dir/season=2019/...) by the keys of partition,
+    a dict of values for the columns to add to every row, e.g. {'season': 2019}; without
+    one, rows with a 'season' column are partitioned by it.
+
+    Args:
+        rows (iterable):  dicts, as returned by the client
+        base_dir (str):  the root directory of the dataset
+        header_columns (list):  the header columns of the table the rows are from, if any,
+            to take the column types from COLUMN_PARSER rather than from the values
+        partition (dict):  partition column names and values
+        rows_per_group (int):  rows in each row group
+        overwrite (bool):  replace what's already in the partitions being written to (the
+            whole dataset, if it isn't partitioned) rather than adding to it
+    """
+    pa = _import_pyarrow()
+
+    row_groups = batches(rows, rows_per_group)
+    leading_batches = _leading_batches(row_groups, header_columns=header_columns)
+    if not leading_batches:
+        return
+
+    schema = arrow_schema(list(chain.from_iterable(leading_batches)), header_columns=header_columns,
+        partition=partition)
+    if partition:
+        partitioning = list(partition.keys())
+    elif 'season' in schema.names:
+        partitioning = ['season']
+    else:
+        partitioning = None
+
+    reader = pa.RecordBatchReader.from_batches(schema,
+        (record_batch(batch, schema, partition=partition) for batch in chain(leading_batches, row_groups)))
+    pa.dataset.write_dataset(reader, base_dir, format='parquet',
+        partitioning=partitioning, partitioning_flavor='hive' if partitioning else None,
+        basename_template='part-' + uuid.uuid4().hex + '-{i}.parquet',
+        existing_data_behavior='delete_matching' if overwrite else 'overwrite_or_ignore', preserve_order=True,
+        min_rows_per_group=rows_per_group, max_rows_per_group=rows_per_group)
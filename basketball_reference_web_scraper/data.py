@@ -1,15 +1,29 @@
 from enum import Enum
+from types import MappingProxyType
 
-class Location(Enum):
+from basketball_reference_web_scraper.errors import UnknownTeam
+
+
+class PickledByName:
+    """
+    an Enum mixin that pickles members by name (Team.BOS as getattr(Team, 'BOS')) rather
+    than by value, which keeps the rows sent back from a parse executor small and is still
+    the same member after a value is renamed
+    """
+    def __reduce_ex__(self, protocol):
+        return getattr, (self.__class__, self.name)
+
+
+class Location(PickledByName, Enum):
     HOME = "HOME"
     AWAY = "AWAY"
 
 
-class Outcome(Enum):
+class Outcome(PickledByName, Enum):
     WIN = "WIN"
     LOSS = "LOSS"
 
-class Team(Enum):
+class Team(PickledByName, Enum):
     ATL = "ATLANTA HAWKS"
     BOS = "BOSTON CELTICS"
     BRK = "BROOKLYN NETS"
@@ -125,6 +139,10 @@ class Team(Enum):
 class OutputType(Enum):
     JSON = "JSON"
     CSV = "CSV"
+    ## one JSON object per line, written as the rows come
+    JSON_LINES = "JSON_LINES"
+    ## a Parquet dataset (needs pyarrow), partitioned by season
+    PARQUET = "PARQUET"
 
 
 class OutputWriteOption(Enum):
@@ -134,7 +152,7 @@ class OutputWriteOption(Enum):
     APPEND_AND_WRITE = "a+"
 
 
-class Position(Enum):
+class Position(PickledByName, Enum):
     POINT_GUARD = "POINT GUARD"
     SHOOTING_GUARD = "SHOOTING GUARD"
     SMALL_FORWARD = "SMALL FORWARD"
@@ -145,20 +163,37 @@ class Position(Enum):
     UNKNOWN_POSITION = "UNKNOWN POSITION"
 
 
-TEAM_ABBREVIATIONS_TO_TEAM = dict(Team.__members__)
-## blank string should also point to an unkown team
-TEAM_ABBREVIATIONS_TO_TEAM[''] = TEAM_ABBREVIATIONS_TO_TEAM['UNK']
+## lookups done for every row of every page, so they're precomputed once here rather than
+## going through Enum value lookup each time.  keys are upper case; the mappings are read-only.
+TEAM_ABBREVIATIONS_TO_TEAM = MappingProxyType(dict(
+    Team.__members__,
+    ## blank string should also point to an unkown team
+    **{'': Team.UNK}
+))
+
+TEAM_NAMES_TO_TEAM = MappingProxyType(dict(
+    [(team.value, team) for team in Team],
+    ## blank string should also point to an unkown team
+    **{'': Team.UNK}
+))
+
+def _lookup_team(teams, key):
+    team = teams.get(key)
+    if team is None:
+        team = teams.get(key.upper())
+        if team is None:
+            raise UnknownTeam(key)
+    return team
 
 def TEAM_NAME_TO_TEAM(team_name):
-    team_name = team_name.upper()
-    if not len(team_name):
-        return Team("UNKNOWN TEAM")
-    else:
-        return Team(team_name)
+    return _lookup_team(TEAM_NAMES_TO_TEAM, team_name)
+
+def TEAM_ABBREVIATION_TO_TEAM(team_abbreviation):
+    return _lookup_team(TEAM_ABBREVIATIONS_TO_TEAM, team_abbreviation)
 
 TEAM_TO_TEAM_ABBREVIATIONS = lambda team:  team.name
 
-POSITION_ABBREVIATIONS_TO_POSITION = {
+POSITION_ABBREVIATIONS_TO_POSITION = MappingProxyType({
     "PG": Position.POINT_GUARD,
     "SG": Position.SHOOTING_GUARD,
     "SF": Position.SMALL_FORWARD,
@@ -167,4 +202,4 @@ POSITION_ABBREVIATIONS_TO_POSITION = {
     "F": Position.FORWARD,
     "G": Position.GUARD,
     '':  Position.UNKNOWN_POSITION
-}
+})
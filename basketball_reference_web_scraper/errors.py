@@ -14,6 +14,17 @@ class InvalidSeason(Exception):
         message = "Season end year of {season_end_year} is invalid".format(season_end_year=season_end_year)
         super().__init__(message)
 
+class UnknownTeam(ValueError):
+    def __init__(self, team):
+        message = "{team!r} isn't a known team name or abbreviation".format(team=team)
+        super().__init__(message)
+        self.team = team
+
+class BoxScoreParseError(ValueError):
+    def __init__(self, teams, tables):
+        message = "Found {tables} game box score table(s) for {teams} team(s)".format(teams=teams, tables=tables)
+        super().__init__(message)
+
 class InvalidPlayer(Exception):
     def __init__(self, player_id):
         message = "Player ID of {player_id} is invalid".format(player_id=player_id)
@@ -25,4 +36,21 @@ class InvalidSeries(Exception):
             winning_team=series['winning_team'].value,
             losing_team=series['losing_team'].value,
             series_address=series['stats_link_ending'])
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+class IncompleteBoxScores(Exception):
+    def __init__(self, box_scores, failures):
+        message = "Couldn't get the box scores for {count} game(s): {games}".format(
+            count=len(failures),
+            games=", ".join(failures.keys()))
+        super().__init__(message)
+        ## the box scores of the games that did succeed, in order, and the error for each game that didn't
+        self.box_scores = box_scores
+        self.failures = failures
+
+class PageNotArchived(Exception):
+    def __init__(self, url, params=None):
+        message = "No archived copy of {url}{params}".format(
+            url=url,
+            params=" with params {params}".format(params=params) if params else "")
+        super().__init__(message)
@@ -1,109 +1,478 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import requests
+from requests.adapters import HTTPAdapter
 
-from basketball_reference_web_scraper.errors import InvalidDate
+from basketball_reference_web_scraper.errors import InvalidDate, IncompleteBoxScores, PageNotArchived
 from basketball_reference_web_scraper import parsers
 
 BASE_URL = 'https://www.basketball-reference.com'
 USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_14_4) ' + \
             'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.157 Safari/537.36'
 
-def players_season_totals(season_end_year, skip_totals=False, playoffs=False):
+## (connect, read) timeout in seconds applied to every request that doesn't set its own
+DEFAULT_TIMEOUT = (10, 30)
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    an HTTPAdapter that fills in a default timeout for requests that don't specify one
+    """
+    def __init__(self, timeout=DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def create_session(pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+    pool_block=False, timeout=DEFAULT_TIMEOUT):
+    """
+    build a requests.Session that keeps connections alive and pools them between calls
+
+    Args:
+        pool_connections (int):  number of host connection pools to cache
+        pool_maxsize (int):  maximum number of connections kept open per host; should 
+            be at least the number of threads sharing the session
+        pool_block (bool):  whether to block (True) or open a throwaway connection (False)
+            when every pooled connection to a host is in use
+        timeout (float or tuple):  default (connect, read) timeout in seconds
+    """
+    adapter = TimeoutHTTPAdapter(timeout=timeout, pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """
+    the session shared by every function in this module, created on first use
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def set_session(session):
+    """
+    replace the shared session (e.g. with one from `func:create_session` using different 
+    pool sizes or timeouts); pass None to go back to a default session on the next request
+    """
+    global _session
+    with _session_lock:
+        _session = session
+
+
+_cache = None
+
+def set_cache(cache):
+    """
+    send every request (including those from `async_http_client`) through a
+    `cache.ResponseCache` (or stop caching with None)
+    """
+    global _cache
+    _cache = cache
+
+
+def get_cache():
+    return _cache
+
+
+_archive = None
+_replay = False
+
+def set_archive(archive, replay=False):
+    """
+    keep every page that's downloaded (including by `async_http_client`) in an 
+    `archive.PageArchive` (or stop with None)
+
+    with replay=True nothing is downloaded at all:  every request is answered with 
+    the most recent archived copy of the page, and PageNotArchived is raised for
+    pages that were never archived
+    """
+    global _archive, _replay
+    _archive = archive
+    _replay = replay
+
+
+def get_archive():
+    return _archive
+
+
+def is_replaying_archive():
+    """
+    whether requests are being answered from the archive instead of the site
+    """
+    return _archive is not None and _replay
+
+
+_rate_limiter = None
+
+def set_rate_limiter(rate_limiter):
+    """
+    make every request (from any thread, and from `async_http_client`) wait its turn
+    with a `rate_limiting.RateLimiter` (or stop limiting with None)
+    """
+    global _rate_limiter
+    _rate_limiter = rate_limiter
+
+
+def get_rate_limiter():
+    return _rate_limiter
+
+
+_retry_policy = None
+
+def set_retry_policy(retry_policy):
+    """
+    send requests that fail for transient reasons again according to a
+    `retries.RetryPolicy` (or stop retrying with None)
+    """
+    global _retry_policy
+    _retry_policy = retry_policy
+
+
+def get_retry_policy():
+    return _retry_policy
+
+
+def fetch(url, session=None, **kwargs):
+    """
+    GET a url with the current USER_AGENT, using `session` or the shared session
+
+    when a retry policy is set, connection errors and responses with a retryable
+    status are sent again after a backoff.  when a rate limiter is set, the request
+    waits for its turn first and is sent again after the pause a 429 response asks
+    for.  when a cache is set, fresh pages are served straight from it and stale ones
+    are revalidated with a conditional request.  when an archive is set, pages that
+    were downloaded are added to it (or, when replaying, read from it).
+    """
+    if _archive is not None and _replay:
+        return _replay_from_archive(_archive, url, params=kwargs.get('params'))
+
+    if session is None:
+        session = get_session()
+
+    if _cache is None:
+        response = _send(session, url, {'User-Agent': USER_AGENT}, **kwargs)
+        downloaded = True
+    else:
+        response, downloaded = _fetch_with_cache(_cache, session, url, **kwargs)
+
+    if _archive is not None and downloaded and response.status_code == requests.codes.ok:
+        _archive.store(url, response.content, params=kwargs.get('params'))
+
+    return response
+
+
+def _send(session, url, headers, **kwargs):
+    retry_policy = _retry_policy
+    if retry_policy is None:
+        return _send_when_allowed(session, url, headers, **kwargs)
+
+    attempt = 1
+    while True:
+        try:
+            response = _send_when_allowed(session, url, headers, **kwargs)
+        except Exception as error:
+            if not retry_policy.should_retry(attempt, exception=error):
+                raise
+            retry_policy.wait(url, attempt, error)
+        else:
+            if not retry_policy.should_retry(attempt, status_code=response.status_code):
+                return response
+            retry_policy.wait(url, attempt, response.status_code, headers=response.headers)
+        attempt += 1
+
+
+def _send_when_allowed(session, url, headers, **kwargs):
+    rate_limiter = _rate_limiter
+    if rate_limiter is None:
+        return session.get(url=url, headers=headers, **kwargs)
+
+    deferrals = 0
+    while True:
+        rate_limiter.acquire()
+        response = session.get(url=url, headers=headers, **kwargs)
+        pause = rate_limiter.retry_after(response.status_code, response.headers)
+        if pause is None or deferrals >= rate_limiter.max_deferrals:
+            return response
+        rate_limiter.pause(pause)
+        deferrals += 1
+
+
+def _replay_from_archive(archive, url, params=None):
+    body = archive.latest(url, params=params)
+    if body is None:
+        raise PageNotArchived(url=url, params=params)
+    return _stored_response(url, body)
+
+
+def _fetch_with_cache(cache, session, url, **kwargs):
+    """
+    returns the response and whether its body was downloaded (rather than read from the cache)
+    """
+    params = kwargs.get('params')
+    entry = cache.lookup(url, params)
+    if entry is not None and cache.is_fresh(entry, url):
+        return _stored_response(url, entry.body), False
+
+    headers = {'User-Agent': USER_AGENT}
+    if entry is not None:
+        if entry.etag is not None:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified is not None:
+            headers['If-Modified-Since'] = entry.last_modified
+
+    response = _send(session, url, headers, **kwargs)
+
+    if entry is not None and response.status_code == requests.codes.not_modified:
+        cache.refresh(url, params)
+        return _stored_response(url, entry.body), False
+
+    if response.status_code == requests.codes.ok:
+        cache.store(url, response.content, params=params,
+            etag=response.headers.get('ETag'), last_modified=response.headers.get('Last-Modified'))
+
+    return response, True
+
+
+def _stored_response(url, body):
+    """
+    a successful response for a page body that didn't come off the network
+    """
+    response = requests.Response()
+    response.status_code = requests.codes.ok
+    response.url = url
+    response._content = body
+    return response
+
+
+_parse_executor = None
+
+def set_parse_executor(executor):
+    """
+    run the parsers in a `concurrent.futures` executor (or back in the calling thread with None)
+
+    parsing is CPU-bound and holds the GIL, so concurrent downloads still parse one page 
+    at a time.  with a ProcessPoolExecutor, the page bytes are sent to another process and 
+    only the parsed rows come back, so pages fetched by different threads (e.g. with 
+    max_workers) are parsed on different cores at once.
+    """
+    global _parse_executor
+    _parse_executor = executor
+
+
+def get_parse_executor():
+    return _parse_executor
+
+
+def run_parser(parser, page, *args, **kwargs):
+    """
+    call one of the `parsers` on a page, in the parse executor if one is set
+    """
+    executor = _parse_executor
+    if executor is None:
+        return parser(page, *args, **kwargs)
+    return executor.submit(parser, page, *args, **kwargs).result()
+
+
+def map_in_order(function, items, max_workers=None, return_exceptions=False):
+    """
+    call `function` on every item and return the results in the same order as `items`
+
+    with max_workers > 1 the calls are spread over that many threads; otherwise they're 
+    made one after the other.  the first exception raised by a call is re-raised, unless 
+    return_exceptions is True, in which case it takes the place of that item's result.
+    """
+    items = list(items)
+
+    def call(item):
+        if not return_exceptions:
+            return function(item)
+        try:
+            return function(item)
+        except Exception as exception:
+            return exception
+
+    if max_workers is None or max_workers <= 1 or len(items) <= 1:
+        return [call(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(call, items))
+
+
+def map_as_completed(function, items, max_workers=None):
+    """
+    call `function` on every item, yielding (item, result) pairs as soon as each call 
+    finishes rather than in the order of `items`
+
+    with max_workers > 1 the calls are spread over that many threads; otherwise they're 
+    made one after the other.  the first exception raised by a call is re-raised, and
+    calls that haven't started yet are cancelled (as they are if the caller stops early).
+    """
+    items = list(items)
+
+    if max_workers is None or max_workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield item, function(item)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(items)))
+    futures = {executor.submit(function, item): item for item in items}
+    try:
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def players_season_totals(season_end_year, skip_totals=False, playoffs=False, session=None, columnar=False):
     if playoffs:
         url = f'{BASE_URL}/playoffs/NBA_{season_end_year}_totals.html'
     else:
         url = f'{BASE_URL}/leagues/NBA_{season_end_year}_totals.html'
-    response = requests.get(url=url, headers={'User-Agent': USER_AGENT})
+    response = fetch(url=url, session=session)
     response.raise_for_status()
-    return parsers.parse_players_season_totals(response.content,
-        skip_totals=skip_totals)
+    return run_parser(parsers.parse_players_season_totals, response.content,
+        skip_totals=skip_totals, columnar=columnar)
 
 
-def players_advanced_stats(season_end_year, skip_totals=False, playoffs=False):
+def players_advanced_stats(season_end_year, skip_totals=False, playoffs=False, session=None, columnar=False):
     if playoffs:
         url = f'{BASE_URL}/playoffs/NBA_{season_end_year}_advanced.html'    
     else:
         url = f'{BASE_URL}/leagues/NBA_{season_end_year}_advanced.html'
-    response = requests.get(url=url, headers={'User-Agent': USER_AGENT})
+    response = fetch(url=url, session=session)
     response.raise_for_status()
-    return parsers.parse_players_advanced_stats(response.content, 
-        skip_totals=skip_totals)
+    return run_parser(parsers.parse_players_advanced_stats, response.content, 
+        skip_totals=skip_totals, columnar=columnar)
 
 
-def players_season_totals_per100(season_end_year, skip_totals=False, playoffs=False):
+def players_season_totals_per100(season_end_year, skip_totals=False, playoffs=False, session=None, columnar=False):
     if playoffs:
         url = f'{BASE_URL}/playoffs/NBA_{season_end_year}_per_poss.html'
     else:
         url = f'{BASE_URL}/leagues/NBA_{season_end_year}_per_poss.html'
-    response = requests.get(url=url, headers={'User-Agent': USER_AGENT})
+    response = fetch(url=url, session=session)
     response.raise_for_status()
-    return parsers.parse_players_season_totals_per100(response.content, 
-        skip_totals=skip_totals)
+    return run_parser(parsers.parse_players_season_totals_per100, response.content, 
+        skip_totals=skip_totals, columnar=columnar)
 
 
-def player_box_scores(day, month, year):
+def player_box_scores(day, month, year, session=None, records=False):
     url = f'{BASE_URL}/friv/dailyleaders.cgi?month={month}&day={day}&year={year}'
 
-    response = requests.get(url=url, 
-        allow_redirects=False, headers={'User-Agent': USER_AGENT})
+    response = fetch(url=url, session=session, allow_redirects=False)
 
     response.raise_for_status()
 
     if response.status_code == requests.codes.ok:
-        return parsers.parse_player_box_scores(response.content)
+        return run_parser(parsers.parse_player_box_scores, response.content, records=records)
 
     raise InvalidDate(day=day, month=month, year=year)
 
 
-def schedule_for_month(url):
-    response = requests.get(url=url, headers={'User-Agent': USER_AGENT})
+def schedule_for_month(url, session=None, records=False):
+    response = fetch(url=url, session=session)
 
     response.raise_for_status()
 
-    return parsers.parse_schedule(response.content)
+    return run_parser(parsers.parse_schedule, response.content, records=records)
 
 
-def season_schedule(season_end_year):
+def season_schedule(season_end_year, session=None, max_workers=None, records=False):
+    """
+    the schedule for the whole season:  the first month's page links to the others, 
+    which are fetched and parsed in up to `max_workers` threads (one at a time by default).
+    months are always returned in the order they're linked, i.e. chronologically.
+    """
     url = f'{BASE_URL}/leagues/NBA_{season_end_year}_games.html'
-    response = requests.get(url=url, headers={'User-Agent': USER_AGENT})
+    response = fetch(url=url, session=session)
     response.raise_for_status()
 
-    season_schedule_values = parsers.parse_schedule(response.content)
-    other_month_url_paths = parsers.parse_schedule_for_month_url_paths(response.content)
+    season_schedule_values = run_parser(parsers.parse_schedule, response.content, records=records)
+    other_month_url_paths = run_parser(parsers.parse_schedule_for_month_url_paths, response.content)
 
-    for month_url_path in other_month_url_paths:
-        url = f'{BASE_URL}{month_url_path}'
-        monthly_schedule = schedule_for_month(url=url)
+    monthly_schedules = map_in_order(
+        lambda month_url_path: schedule_for_month(url=f'{BASE_URL}{month_url_path}', session=session,
+            records=records),
+        other_month_url_paths,
+        max_workers=max_workers)
+
+    for monthly_schedule in monthly_schedules:
         season_schedule_values.extend(monthly_schedule)
 
     return season_schedule_values
 
 
-def team_box_score(game_url_path):
+def team_box_score(game_url_path, session=None):
     url = f"{BASE_URL}/{game_url_path}"
-    response = requests.get(url=url, headers={'User-Agent': USER_AGENT})
+    response = fetch(url=url, session=session)
     response.raise_for_status()
-    return parsers.parse_team_totals(response.content)
+    return run_parser(parsers.parse_team_totals, response.content)
+
 
+def team_box_scores(day, month, year, session=None, max_workers=None):
+    """
+    the team totals of every game on a day, in the order the games are listed
 
-def team_box_scores(day, month, year):
+    with max_workers set, the games are fetched and parsed in that many threads, and 
+    a game that fails doesn't stop the others:  once they're all done, IncompleteBoxScores
+    is raised with the box scores that did succeed and the error for each game that didn't
+    """
     url = f"{BASE_URL}/boxscores/"
 
-    response = requests.get(url=url, 
-        params={"day": day, "month": month, "year": year},
-        headers={'User-Agent': USER_AGENT})
+    response = fetch(url=url, session=session,
+        params={"day": day, "month": month, "year": year})
 
     response.raise_for_status()
 
-    game_url_paths = parsers.parse_game_url_paths(response.content)
+    game_url_paths = run_parser(parsers.parse_game_url_paths, response.content)
+
+    if max_workers is None:
+        return [
+            box_score
+            for game_url_path in game_url_paths
+            for box_score in team_box_score(game_url_path=game_url_path, session=session)
+        ]
+
+    games_box_scores = map_in_order(
+        lambda game_url_path: team_box_score(game_url_path=game_url_path, session=session),
+        game_url_paths,
+        max_workers=max_workers,
+        return_exceptions=True)
+
+    box_scores = []
+    failures = {}
+    for game_url_path, game_box_scores in zip(game_url_paths, games_box_scores):
+        if isinstance(game_box_scores, Exception):
+            failures[game_url_path] = game_box_scores
+        else:
+            box_scores.extend(game_box_scores)
 
-    return [
-        box_score
-        for game_url_path in game_url_paths
-        for box_score in team_box_score(game_url_path=game_url_path)
-    ]
+    if failures:
+        raise IncompleteBoxScores(box_scores=box_scores, failures=failures)
 
+    return box_scores
 
-def player_career(player_id, tables=['totals', 'advanced']):
+
+def player_career(player_id, tables=['totals', 'advanced'], session=None):
     if isinstance(tables, str):
         tables = [tables]
 
@@ -112,28 +481,23 @@ def player_career(player_id, tables=['totals', 'advanced']):
     first_init = player_id[0]
     url = f'{BASE_URL}/players/{first_init}/{player_id}.html'
 
-    response = requests.get(url=url, headers={'User-Agent': USER_AGENT})
+    response = fetch(url=url, session=session)
 
     response.raise_for_status()
 
-    return [parsers.parse_a_players_career_table(response.content, table) 
-        for table in tables]
+    return run_parser(parsers.parse_players_career_tables, response.content, tables)
 
 
-def playoffs_series(playoffs_year):
+def playoffs_series(playoffs_year, session=None):
     url = f'{BASE_URL}/playoffs/NBA_{playoffs_year}.html'
-    response = requests.get(url=url, headers={'User-Agent': USER_AGENT})
+    response = fetch(url=url, session=session)
     response.raise_for_status()
-    return parsers.parse_playoff_series_list(response.content)
+    return run_parser(parsers.parse_playoff_series_list, response.content)
 
 
-def playoff_series_stats(playoff_series, tables=['basic', 'advanced']):
+def playoff_series_stats(playoff_series, tables=['basic', 'advanced'], session=None):
     url = f"{BASE_URL}/{playoff_series['stats_link_ending']}"
-    response = requests.get(url=url, headers={'User-Agent': USER_AGENT})
+    response = fetch(url=url, session=session)
     response.raise_for_status()
 
-    return [parsers.parse_playoff_series_stats(response.content, playoff_series, table) 
-        for table in tables]
-
-
-
+    return run_parser(parsers.parse_playoff_series_stats_tables, response.content, playoff_series, tables)
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from datetime import datetime
 from json import JSONEncoder
 from enum import Enum
@@ -5,11 +6,16 @@ from enum import Enum
 
 class BasketballReferenceJSONEncoder(JSONEncoder):
     def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-
+        ## enums (teams, positions, ...) are by far the most common, so they're checked first
         if isinstance(obj, Enum):
             return obj.value
 
+        ## records (see `records.Record`) are written out like the dicts they stand in for
+        if isinstance(obj, Mapping):
+            return dict(obj)
+
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+
         return JSONEncoder.default(self, obj)
 
@@ -2,41 +2,18 @@ import csv
 import json
 import copy
 import warnings
+from itertools import chain
 
 from basketball_reference_web_scraper.data import OutputType, OutputWriteOption
-from basketball_reference_web_scraper.utilities import merge_two_dicts
+from basketball_reference_web_scraper import columnar
+from basketball_reference_web_scraper.parsers.common import rows_from_columns
+from basketball_reference_web_scraper.records import PlayerBoxScore, Game
+from basketball_reference_web_scraper.utilities import merge_two_dicts, batches
 
-box_score_fieldname = [
-    "player_id",
-    "player_name",
-    "team",
-    "location",
-    "opponent",
-    "outcome",
-    "seconds_played",
-    "made_field_goals",
-    "attempted_field_goals",
-    "made_three_point_field_goals",
-    "attempted_three_point_field_goals",
-    "made_free_throws",
-    "attempted_free_throws",
-    "offensive_rebounds",
-    "defensive_rebounds",
-    "assists",
-    "steals",
-    "blocks",
-    "turnovers",
-    "personal_fouls",
-    "game_score",
-]
+## the same fields, in the same order, as the records the parsers return with records=True
+box_score_fieldname = list(PlayerBoxScore.fields)
 
-game_fieldname = [
-    "start_time",
-    "away_team",
-    "away_team_score",
-    "home_team",
-    "home_team_score",
-]
+game_fieldname = list(Game.fields)
 
 team_box_score_fieldname = [
     "team",
@@ -61,10 +38,104 @@ default_json_options = {
     "indent": 4,
 }
 
+## for big dumps that nobody's going to read by eye:  without indentation json can use its
+## C encoder, and there's no sorting of every row's keys.  pass as json_options.
+compact_json_options = {
+    "sort_keys": False,
+    "indent": None,
+    "separators": (",", ":"),
+}
+
+
+## rows are written as they come, so the writers take any iterable of rows (e.g. a generator
+## chaining several seasons together) and never hold more than flush_interval of them
+DEFAULT_FLUSH_INTERVAL = 1000
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+OUTPUT_FILE_EXTENSIONS = {
+    OutputType.JSON: 'json',
+    OutputType.JSON_LINES: 'jsonl',
+    OutputType.CSV: 'csv',
+    ## a directory holding the dataset
+    OutputType.PARQUET: 'parquet',
+}
+
+def output_file_extension(output_type):
+    if not isinstance(output_type, OutputType):
+        output_type = OutputType(output_type.upper())
+    return OUTPUT_FILE_EXTENSIONS[output_type]
+
+
+def write_csv_rows(rows, output_file_path, write_option, fieldnames, flush_interval=DEFAULT_FLUSH_INTERVAL):
+    """
+    write rows (dicts with the fieldnames as keys) to a csv file, flushing the file every 
+    flush_interval rows so that a long dump can be followed as it's written.  with a 
+    flush_interval of None, the file is only flushed when it's closed.
+    """
+    with open(output_file_path, write_option.value, newline="", buffering=WRITE_BUFFER_SIZE) as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+        writer.writeheader()
+        if flush_interval is None:
+            writer.writerows(rows)
+            return
+        for batch in batches(rows, flush_interval):
+            writer.writerows(batch)
+            csv_file.flush()
+
+
+def json_lines_writer(rows, output_file_path, write_option, encoder, json_options=None, 
+    flush_interval=DEFAULT_FLUSH_INTERVAL):
+    """
+    write rows to a JSON Lines file (one compact JSON object per line), flushing the file
+    every flush_interval rows; returns the lines as a string instead if output_file_path is None
+    """
+    options = compact_json_options if json_options is None else merge_two_dicts(first=compact_json_options, second=json_options)
+    ## each row has to stay on one line
+    options = merge_two_dicts(first=options, second={"indent": None})
+    encode = encoder(**options).encode
+
+    if output_file_path is None:
+        return "".join(encode(row) + "\n" for row in rows)
+
+    with open(output_file_path, write_option.value, newline="", buffering=WRITE_BUFFER_SIZE) as json_lines_file:
+        for batch in batches(rows, flush_interval or DEFAULT_FLUSH_INTERVAL):
+            json_lines_file.write("".join(encode(row) + "\n" for row in batch))
+            if flush_interval is not None:
+                json_lines_file.flush()
+
+
+def table_header_columns(csv_writer, table=None):
+    """
+    the header columns of the table that a csv writer is for, or None if its rows aren't 
+    built from a header (box scores, schedules, ...)
+    """
+    if csv_writer == players_season_totals_to_csv:
+        from basketball_reference_web_scraper.parsers.players_season_totals import \
+            _totals_stats_by_year_header_columns as header_columns
+    elif csv_writer == players_advanced_to_csv:
+        from basketball_reference_web_scraper.parsers.players_advanced import \
+            _advanced_stats_by_year_header_columns as header_columns
+    elif csv_writer == players_season_totals_per100_to_csv:
+        from basketball_reference_web_scraper.parsers.players_season_totals_per100 import \
+            _totals_stats_per100_by_year_header_columns as header_columns
+    elif csv_writer == players_career_writer:
+        from basketball_reference_web_scraper.parsers.player_career import career_table_headers, career_table_renamer
+        header_columns = career_table_headers[career_table_renamer[table]]
+    elif csv_writer == playoff_stats_writer:
+        from basketball_reference_web_scraper.parsers.playoff_series_stats import \
+            _playoff_basic_header_columns, _playoff_advanced_header_columns
+        header_columns = _playoff_basic_header_columns if table == 'basic' else _playoff_advanced_header_columns
+    elif csv_writer == team_box_scores_to_csv:
+        from basketball_reference_web_scraper.parsers.box_scores.teams import \
+            _team_box_score_header_columns as header_columns
+    else:
+        header_columns = None
+    return header_columns
 
 
 def output(values, output_type, output_file_path, encoder, csv_writer, 
-    output_write_option=None, json_options=None, table=None):
+    output_write_option=None, json_options=None, table=None, flush_interval=DEFAULT_FLUSH_INTERVAL,
+    partition=None):
     if output_type is None:
         ## nothing else to do or check; just return
         return values
@@ -77,25 +148,55 @@ def output(values, output_type, output_file_path, encoder, csv_writer,
         else:
             warnings.warn("-- specified output_file_path, but it doesn't end with either .json or .csv; will not save")
 
+    ## output_type can be given as an OutputType or as its name
+    if not isinstance(output_type, OutputType):
+        output_type = OutputType(output_type.upper())
+
     write_option = OutputWriteOption.WRITE if output_write_option is None else output_write_option
 
+    ## columnar results (see RowDecoder.decode_columns) are written as rows, and returned as they were
+    columns = None
+    if isinstance(values, dict):
+        columns = values
+        values = rows_from_columns(columns)
+        if output_type == OutputType.JSON:
+            values = list(values)
+
     file_written = False
-    if output_type == OutputType.JSON or output_type.upper()=="JSON":
+    if output_type == OutputType.JSON:
         options = default_json_options if json_options is None else merge_two_dicts(first=default_json_options, second=json_options)
         if output_file_path is None:
-            json.dumps(values, cls=encoder, **options)
-        else:
-            with open(output_file_path, write_option.value, newline="") as json_file:
-                json.dump(values, json_file, cls=encoder, **options)
+            ## in-memory JSON:  the serialized values are what's returned
+            return json.dumps(values, cls=encoder, **options)
+        with open(output_file_path, write_option.value, newline="") as json_file:
+            json.dump(values, json_file, cls=encoder, **options)
+        file_written = True
+
+    if output_type == OutputType.JSON_LINES:
+        if output_file_path is None:
+            return json_lines_writer(values, None, write_option, encoder, json_options=json_options)
+        json_lines_writer(values, output_file_path, write_option, encoder, json_options=json_options, 
+            flush_interval=flush_interval)
+        file_written = True
+
+    if output_type == OutputType.PARQUET:
+        assert output_file_path is not None, "Parquet output must contain the path of the dataset directory"
+        ## a dataset is added to unless OutputWriteOption.WRITE is asked for explicitly, which
+        ## replaces the partition (e.g. the season) being written
+        columnar.write_parquet_dataset(values, output_file_path, 
+            header_columns=table_header_columns(csv_writer, table), partition=partition,
+            rows_per_group=flush_interval or columnar.DEFAULT_ROWS_PER_GROUP,
+            overwrite=output_write_option == OutputWriteOption.WRITE)
         file_written = True
 
-    if output_type == OutputType.CSV or output_type.upper()=="CSV":
+    if output_type == OutputType.CSV:
         assert output_file_path is not None, "CSV output must contain a file path"
         if not output_file_path.endswith('.csv'):
             print("-- adding '.csv' to the output file path")
             output_file_path = output_file_path + '.csv'
 
-        kwargs = dict(rows=values, output_file_path=output_file_path, write_option=write_option)
+        kwargs = dict(rows=values, output_file_path=output_file_path, write_option=write_option, 
+            flush_interval=flush_interval)
         if (csv_writer == players_career_writer) or (csv_writer == playoff_stats_writer):
             kwargs['table'] = table
         csv_writer(**kwargs)
@@ -105,18 +206,16 @@ def output(values, output_type, output_file_path, encoder, csv_writer,
     if output_type is not None and file_written == False:
         ValueError("Unknown output type: {output_type}".format(output_type=output_type))
 
-    return values
+    return values if columns is None else columns
 
 
 # I wrote the explicit mapping of CSV values because there didn't seem to be a way of outputting the values of enums
 # without doing it this way
 
 
-def box_scores_to_csv(rows, output_file_path, write_option):
-    with open(output_file_path, write_option.value, newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=box_score_fieldname)
-        writer.writeheader()
-        writer.writerows(
+def box_scores_to_csv(rows, output_file_path, write_option, flush_interval=DEFAULT_FLUSH_INTERVAL):
+    write_csv_rows(
+        (
             {
                 "player_id": row["player_id"],
                 "player_name": row["player_name"],
@@ -140,14 +239,14 @@ def box_scores_to_csv(rows, output_file_path, write_option):
                 "personal_fouls": row["personal_fouls"],
                 "game_score": row["game_score"],
             } for row in rows
-        )
+        ),
+        output_file_path, write_option, box_score_fieldname, flush_interval=flush_interval
+    )
 
 
-def schedule_to_csv(rows, output_file_path, write_option):
-    with open(output_file_path, write_option.value, newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=game_fieldname)
-        writer.writeheader()
-        writer.writerows(
+def schedule_to_csv(rows, output_file_path, write_option, flush_interval=DEFAULT_FLUSH_INTERVAL):
+    write_csv_rows(
+        (
             {
                 "start_time": row["start_time"],
                 "away_team": row["away_team"].value,
@@ -155,10 +254,12 @@ def schedule_to_csv(rows, output_file_path, write_option):
                 "home_team": row["home_team"].value,
                 "home_team_score": row["home_team_score"],
             } for row in rows
-        )
+        ),
+        output_file_path, write_option, game_fieldname, flush_interval=flush_interval
+    )
 
 
-def players_season_totals_to_csv(rows, output_file_path, write_option):
+def players_season_totals_to_csv(rows, output_file_path, write_option, flush_interval=DEFAULT_FLUSH_INTERVAL):
     from basketball_reference_web_scraper.parsers.players_season_totals import \
         _totals_stats_by_year_header_columns as header_columns
     from basketball_reference_web_scraper.parsers.common import COLUMN_RENAMER
@@ -168,14 +269,11 @@ def players_season_totals_to_csv(rows, output_file_path, write_option):
         ## put the player name and player id first
         fieldnames = ['player_id', 'player_name'] + fieldnames
 
-    with open(output_file_path, write_option.value, newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-        writer.writeheader()
+    ## the teams are now just raw strings, so turn each row into a dictionary:
+    write_csv_rows((dict([(k, row[k]) for k in fieldnames]) for row in rows),
+        output_file_path, write_option, fieldnames, flush_interval=flush_interval)
 
-        ## the teams are now just raw strings, so turn each row into a dictionary:
-        writer.writerows(dict([(k, row[k]) for k in fieldnames]) for row in rows)
-
-def players_advanced_to_csv(rows,output_file_path,write_option):
+def players_advanced_to_csv(rows,output_file_path,write_option, flush_interval=DEFAULT_FLUSH_INTERVAL):
     from basketball_reference_web_scraper.parsers.players_advanced import \
         _advanced_stats_by_year_header_columns as header_columns
 
@@ -186,14 +284,11 @@ def players_advanced_to_csv(rows,output_file_path,write_option):
         ## put the player name and player id first
         fieldnames = ['player_id', 'player_name'] + fieldnames
 
-    with open(output_file_path, write_option.value, newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-        writer.writeheader()
-
-        ## the teams are now just raw strings, so turn each row into a dictionary:
-        writer.writerows(dict([(k, row[k]) for k in fieldnames]) for row in rows)
+    ## the teams are now just raw strings, so turn each row into a dictionary:
+    write_csv_rows((dict([(k, row[k]) for k in fieldnames]) for row in rows),
+        output_file_path, write_option, fieldnames, flush_interval=flush_interval)
 
-def players_season_totals_per100_to_csv(rows, output_file_path, write_option):
+def players_season_totals_per100_to_csv(rows, output_file_path, write_option, flush_interval=DEFAULT_FLUSH_INTERVAL):
     from basketball_reference_web_scraper.parsers.players_season_totals_per100 import \
         _totals_stats_per100_by_year_header_columns as header_columns
     from basketball_reference_web_scraper.parsers.common import COLUMN_RENAMER
@@ -203,19 +298,14 @@ def players_season_totals_per100_to_csv(rows, output_file_path, write_option):
         ## put the player name and player id first
         fieldnames = ['player_id', 'player_name'] + fieldnames
 
-    with open(output_file_path, write_option.value, newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-        writer.writeheader()
-
-        ## the teams are now just raw strings, so turn each row into a dictionary:
-        writer.writerows(dict([(k, row[k]) for k in fieldnames]) for row in rows)
+    ## the teams are now just raw strings, so turn each row into a dictionary:
+    write_csv_rows((dict([(k, row[k]) for k in fieldnames]) for row in rows),
+        output_file_path, write_option, fieldnames, flush_interval=flush_interval)
 
 
-def team_box_scores_to_csv(rows, output_file_path, write_option):
-    with open(output_file_path, write_option.value, newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=team_box_score_fieldname)
-        writer.writeheader()
-        writer.writerows(
+def team_box_scores_to_csv(rows, output_file_path, write_option, flush_interval=DEFAULT_FLUSH_INTERVAL):
+    write_csv_rows(
+        (
             {
                 "team": row["team"].value,
                 "minutes_played": row["minutes_played"],
@@ -233,15 +323,15 @@ def team_box_scores_to_csv(rows, output_file_path, write_option):
                 "turnovers": row["turnovers"],
                 "personal_fouls": row["personal_fouls"],
             } for row in rows
-        )
+        ),
+        output_file_path, write_option, team_box_score_fieldname, flush_interval=flush_interval
+    )
 
-def playoff_series_to_csv(rows, output_file_path, write_option):
+def playoff_series_to_csv(rows, output_file_path, write_option, flush_interval=DEFAULT_FLUSH_INTERVAL):
     fieldnames = ['series_name', 'winning_team', 'losing_team',
         'winning_team_games_won', 'losing_team_games_won', 'stats_link_ending']
-    with open(output_file_path, write_option.value, newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(
+    write_csv_rows(
+        (
             {
                'series_name':row['series_name'],
                 "winning_team": row["winning_team"].value, 
@@ -250,24 +340,35 @@ def playoff_series_to_csv(rows, output_file_path, write_option):
                 "losing_team_games_won": row["losing_team_games_won"],
                 "stats_link_ending": row["stats_link_ending"],
             } for row in rows
-        )
+        ),
+        output_file_path, write_option, fieldnames, flush_interval=flush_interval
+    )
 
-def players_career_writer(rows, output_file_path, write_option, table):
+def players_career_writer(rows, output_file_path, write_option, table, flush_interval=DEFAULT_FLUSH_INTERVAL):
     from basketball_reference_web_scraper.parsers.player_career import career_table_headers, career_table_renamer
     from basketball_reference_web_scraper.parsers.common import COLUMN_RENAMER
 
     resolved_table = career_table_renamer[table]
     fieldnames = [COLUMN_RENAMER[k] for k in career_table_headers[resolved_table] if k != 'empty']
 
-    with open(output_file_path, write_option.value, newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-        writer.writeheader()
+    ## here I've opted to store the team and positions as raw strings, so can just turn my row into a dictionary
+    write_csv_rows((dict([(k, row[k]) for k in fieldnames]) for row in rows),
+        output_file_path, write_option, fieldnames, flush_interval=flush_interval)
+
 
-        ## here I've opted to store the team and positions as raw strings, so can just turn my row into a dictionary
-        writer.writerows(dict([(k, row[k]) for k in fieldnames]) for row in rows)
+def _peek(rows):
+    """
+    the first of rows (or None if there aren't any) and all of rows, for when rows might be
+    a generator that can only be read once
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return None, rows
+    return first, chain([first], rows)
 
 
-def playoff_stats_writer(rows, output_file_path, write_option, table):
+def playoff_stats_writer(rows, output_file_path, write_option, table, flush_interval=DEFAULT_FLUSH_INTERVAL):
     from basketball_reference_web_scraper.parsers.common import COLUMN_RENAMER
     from basketball_reference_web_scraper.parsers.playoff_series_stats import \
         _playoff_basic_header_columns, _playoff_advanced_header_columns
@@ -278,7 +379,8 @@ def playoff_stats_writer(rows, output_file_path, write_option, table):
         header_columns = copy.deepcopy(_playoff_basic_header_columns)
         
         ## older playoff series don't keep track of games started
-        if 'games_started' not in rows[0].keys():
+        first_row, rows = _peek(rows)
+        if first_row is not None and 'games_started' not in first_row.keys():
             header_columns.pop(header_columns.index('GS'))
     else:
         header_columns = _playoff_advanced_header_columns
@@ -289,25 +391,19 @@ def playoff_stats_writer(rows, output_file_path, write_option, table):
         ## put the player name and player id first
         fieldnames = ['player_id', 'player_name'] + fieldnames
 
-    with open(output_file_path, write_option.value, newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-        writer.writeheader()
-
-        ## again, just raw strings, so turn each row into a dictionary:
-        writer.writerows(dict([(k, row[k]) for k in fieldnames]) for row in rows)
+    ## again, just raw strings, so turn each row into a dictionary:
+    write_csv_rows((dict([(k, row[k]) for k in fieldnames]) for row in rows),
+        output_file_path, write_option, fieldnames, flush_interval=flush_interval)
 
 
-def csv_writer_from_keys(rows, output_file_path, write_option, table):
+def csv_writer_from_keys(rows, output_file_path, write_option, table, flush_interval=DEFAULT_FLUSH_INTERVAL):
     """
     write a list of dictionaries to a file using the keys of the first row as the column headers
 
     all rows must have exactly the same keys.  no guarantee of column ordering,
     unless the input rows are OrderedDictionaries
     """
-
-    fieldnames = rows[0].keys()
-    with open(output_file_path, write_option.value, newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(dict([(k, row[k]) for k in fieldnames]) for row in rows)
-
+    first_row, rows = _peek(rows)
+    fieldnames = [] if first_row is None else list(first_row.keys())
+    write_csv_rows((dict([(k, row[k]) for k in fieldnames]) for row in rows),
+        output_file_path, write_option, fieldnames, flush_interval=flush_interval)
@@ -1,12 +1,14 @@
-from .player_career import parse_a_players_career_table
+from .player_career import parse_a_players_career_table, parse_players_career_tables
 from .players_advanced import parse_players_advanced_stats
 from .players_season_totals import parse_players_season_totals
 from .players_season_totals_per100 import parse_players_season_totals_per100
-from .playoff_series_stats import parse_playoff_series_stats
+from .playoff_series_stats import parse_playoff_series_stats, parse_playoff_series_stats_tables
 from .playoff_series_list import parse_playoff_series_list
 from .schedule import parse_start_time, parse_game, parse_schedule, \
     parse_schedule_for_month_url_paths
 
 from .box_scores.games import parse_game_url_paths
 from .box_scores.players import parse_player_box_scores
-from .box_scores.teams import parse_team_totals
\ No newline at end of file
+from .box_scores.teams import parse_team_totals
+
+from .streaming import iter_players_season_totals, iter_players_advanced_stats, iter_players_season_totals_per100
@@ -1,6 +1,7 @@
 from lxml import html
 
-from basketball_reference_web_scraper.data import Location, Outcome, TEAM_ABBREVIATIONS_TO_TEAM
+from basketball_reference_web_scraper.data import Location, Outcome, TEAM_ABBREVIATION_TO_TEAM
+from basketball_reference_web_scraper.records import PlayerBoxScore
 from basketball_reference_web_scraper.utilities import str_to_int, str_to_float
 
 
@@ -40,9 +41,9 @@ def parse_player_box_score(row):
     return {
         "player_id": str(row[1].get("data-append-csv")),
         "player_name": str(row[1].text_content()),
-        "team": TEAM_ABBREVIATIONS_TO_TEAM.get(row[2].text_content()),
+        "team": TEAM_ABBREVIATION_TO_TEAM(row[2].text_content()),
         "location": parse_location(row[3].text_content()),
-        "opponent": TEAM_ABBREVIATIONS_TO_TEAM.get(row[4].text_content()),
+        "opponent": TEAM_ABBREVIATION_TO_TEAM(row[4].text_content()),
         "outcome": parse_outcome(row[5].text_content()),
         "seconds_played": parse_seconds_played(row[6].text_content()),
         "made_field_goals": str_to_int(row[7].text_content()),
@@ -62,7 +63,13 @@ def parse_player_box_score(row):
     }
 
 
-def parse_player_box_scores(page):
+def parse_player_box_scores(page, records=False):
+    """
+    the box score of every player on a daily leaders page; as PlayerBoxScore records
+    rather than dicts with records=True
+    """
     tree = html.fromstring(page)
     rows = tree.xpath('//table[@id="stats"]//tbody/tr[not(contains(@class, "thead"))]')
+    if records:
+        return [PlayerBoxScore(**parse_player_box_score(row)) for row in rows]
     return list(map(lambda row: parse_player_box_score(row), rows))
@@ -1,47 +1,39 @@
 from lxml import html
-from bs4 import BeautifulSoup
 
 from basketball_reference_web_scraper.data import TEAM_NAME_TO_TEAM
-from basketball_reference_web_scraper.utilities import str_to_str
-from basketball_reference_web_scraper.parsers.common import get_all_tables_with_soup, \
-    parse_souped_row_given_header_columns, split_header_columns, COLUMN_PARSER, COLUMN_RENAMER
+from basketball_reference_web_scraper.errors import BoxScoreParseError
+from basketball_reference_web_scraper.parsers.common import split_header_columns, RowDecoder, TableCell
 
 __team_box_score_header_string = "MP,FG,FGA,FG%,3P,3PA,3P%,FT,FTA,FT%,ORB,DRB,TRB,AST,STL,BLK,TOV,PF,PTS,+/-"
 _team_box_score_header_columns = split_header_columns(__team_box_score_header_string)
+_team_box_score_row_decoder = RowDecoder(_team_box_score_header_columns)
 
-def parse_team_total(footer, team):
-    row = footer.xpath('tr/td')
-    to_return = {}
+## one pass over the page for both:  the team names in the scorebox (away team first)
+## and the footers of the whole-game "basic" box score tables (in the same order).  those
+## are box_atl_basic on older pages and box-ATL-game-basic on newer ones, which also have
+## a table per quarter and half (box-ATL-q1-basic, box-ATL-h1-basic, ...) to leave out
+_scorebox_team_names_xpath = '//div[contains(@class, "scorebox")]//a[@itemprop="name"]'
+_basic_table_footers_xpath = ('//table[contains(@class, "stats_table") and ('
+    '(starts-with(@id, "box_") and substring(@id, string-length(@id) - 5) = "_basic") or '
+    'substring(@id, string-length(@id) - 10) = "-game-basic")]/tfoot')
 
-    for ii, key in enumerate(_team_box_score_header_columns):
-        if key == 'Player':
-            to_return['player_id'] = row[ii].get('data-append-csv')
-            to_return['player_name'] = str_to_str(row[ii].text_content())
-        elif key == 'empty':
-            continue
-        else:
-            to_return[COLUMN_RENAMER[key]] = COLUMN_PARSER[key](row[ii].text_content())
-    return to_return
+def parse_team_total(footer, team):
+    row = [TableCell(cell.text_content(), cell.attrib) for cell in footer.xpath('tr/td')]
+    team_total = _team_box_score_row_decoder(row)
+    team_total['team'] = team
+    return team_total
 
 def parse_team_totals(page):
     """
     gets only the totals for a team from the box score of a game
     (i.e. the last row)
     """
-    soup = BeautifulSoup(page, features='lxml')
-    scorebox = soup.find('div', {'class':'scorebox'})
-    teams = [TEAM_NAME_TO_TEAM(item.text) for item in 
-        scorebox.find_all('a', {'itemprop':'name'})]
-
     tree = html.fromstring(page)
-    tables = tree.xpath('//table[contains(@class, "stats_table")]')
-    footers = [
-        footer
-        for table in tables
-        if "basic" in table.attrib["id"]
-        for footer in table.xpath("tfoot")
-    ]
+    teams = [TEAM_NAME_TO_TEAM(item.text_content()) for item in tree.xpath(_scorebox_team_names_xpath)]
+    footers = tree.xpath(_basic_table_footers_xpath)
+    if len(footers) != len(teams):
+        raise BoxScoreParseError(teams=len(teams), tables=len(footers))
     return [
-        parse_team_total(footer=footer, team=teams[footers.index(footer)])
-        for footer in footers
+        parse_team_total(footer=footer, team=team)
+        for footer, team in zip(footers, teams)
     ]
@@ -1,5 +1,12 @@
-from basketball_reference_web_scraper.utilities import str_to_str, str_to_float, str_to_int
-from basketball_reference_web_scraper.data import TEAM_ABBREVIATIONS_TO_TEAM, POSITION_ABBREVIATIONS_TO_POSITION
+from array import array
+from copy import copy
+from html import escape
+
+from lxml import etree, html
+
+from basketball_reference_web_scraper.utilities import str_to_str, str_to_float, str_to_int, \
+    strs_to_strs, strs_to_floats, strs_to_ints
+from basketball_reference_web_scraper.data import TEAM_ABBREVIATION_TO_TEAM, POSITION_ABBREVIATIONS_TO_POSITION
 
 
 def extract_name_rows_from_table(tab, required_classes, excluded_row_classes):
@@ -45,11 +52,134 @@ def get_all_tables_with_soup(page, required_classes=['stats_table', 'sortable'],
             all_tables[name] = rows
     return all_tables
 
+class TableCell:
+    """
+    a td pulled out of a table by get_all_tables:  just its text and its attributes, 
+    read the same way as from a bs4 td (cell.text, cell.get('data-append-csv'))
+    """
+    __slots__ = ('text', 'attributes')
+
+    def __init__(self, text, attributes):
+        self.text = text
+        self.attributes = attributes
+
+    def get(self, key, default=None):
+        return self.attributes.get(key, default)
+
+    def __repr__(self):
+        return f'TableCell({self.text!r}, {self.attributes!r})'
+
+def _classes(element):
+    return (element.get('class') or '').split()
+
+def extract_name_rows_from_lxml_table(table, required_classes, excluded_row_classes):
+    """
+    the lxml version of extract_name_rows_from_table
+    """
+    classes = _classes(table)
+    if False in [k in classes for k in required_classes]:
+        return None, None
+
+    caption = next(table.iter('caption'), None)
+    if caption is None:
+        return None, None
+    name = caption.text_content().strip().upper()
+
+    rows = []
+    for row in table.iter('tr'):
+        header = next(row.iter('th'), None)
+        if header is None or True in [exclud_class in _classes(header) for exclud_class in excluded_row_classes]:
+            continue
+        cells = list(row.iter('td'))
+        if not len(cells) or cells[0].text_content() == 'Team Totals':
+            continue
+        rows.append([TableCell(cell.text_content(), dict(cell.attrib)) for cell in cells])
+    return name, rows
+
+def get_all_tables(page, required_classes=['stats_table', 'sortable'], 
+        excluded_row_classes=['over_header', 'poptip']):
+    """
+    find every stats table on a page, including the ones basketball-reference leaves 
+    commented out, and return {CAPTION: rows}, where each row is a list of TableCells
+
+    gives the same tables as get_all_tables_with_soup, but works on a single lxml tree 
+    (plus one small tree per comment that holds a table) instead of building BeautifulSoup
+    trees, which is several times faster.  see benchmarks/table_extraction.py
+    """
+    tree = html.fromstring(page)
+    all_tables = {}
+
+    ## first handle all the commented out tables
+    for comment in tree.iter(etree.Comment):
+        text = comment.text
+        if not text or '<table' not in text:
+            continue
+        for tab in html.fromstring(text).iter('table'):
+            name, rows = extract_name_rows_from_lxml_table(tab, required_classes, excluded_row_classes)
+            if name is not None:
+                all_tables[name] = rows
+
+    ## now handle the uncommented tables:
+    for tab in tree.iter('table'):
+        name, rows = extract_name_rows_from_lxml_table(tab, required_classes, excluded_row_classes)
+        if name is not None:
+            all_tables[name] = rows
+    return all_tables
+
+def _caption_matches(table, wanted, required_classes):
+    classes = _classes(table)
+    if False in [k in classes for k in required_classes]:
+        return None
+    caption = next(table.iter('caption'), None)
+    if caption is None:
+        return None
+    name = caption.text_content().strip().upper()
+    return name if name in wanted else None
+
+def get_tables(page, captions, required_classes=['stats_table', 'sortable'], 
+        excluded_row_classes=['over_header', 'poptip']):
+    """
+    like get_all_tables, but only for the tables with the given captions:  rows are only 
+    pulled out of those tables, and a comment is only parsed if the text of one of the 
+    captions still being looked for appears in it.  returns {CAPTION: rows} for the 
+    captions that were found (uppercased, like get_all_tables)
+
+    as with get_all_tables, a table that isn't commented out wins over a commented one
+    with the same caption.
+    """
+    wanted = {caption.upper() for caption in captions}
+    tree = html.fromstring(page)
+    tables = {}
+
+    for tab in tree.iter('table'):
+        if _caption_matches(tab, wanted, required_classes) is not None:
+            name, rows = extract_name_rows_from_lxml_table(tab, required_classes, excluded_row_classes)
+            tables[name] = rows
+
+    missing = wanted.difference(tables)
+    for comment in tree.iter(etree.Comment):
+        if not missing:
+            break
+        text = comment.text
+        if not text or '<table' not in text:
+            continue
+        ## captions are matched after stripping and uppercasing, so the raw text (or its 
+        ## html-escaped form) has to show up somewhere in the comment
+        upper_text = text.upper()
+        if not any(caption in upper_text or escape(caption, quote=False).upper() in upper_text for caption in missing):
+            continue
+        for tab in html.fromstring(text).iter('table'):
+            if _caption_matches(tab, missing, required_classes) is not None:
+                name, rows = extract_name_rows_from_lxml_table(tab, required_classes, excluded_row_classes)
+                tables[name] = rows
+                missing.discard(name)
+    return tables
+
 def parse_team(value):
-    return TEAM_ABBREVIATIONS_TO_TEAM[value]
+    return TEAM_ABBREVIATION_TO_TEAM(value)
 
 def parse_team_as_string(value):
-    return TEAM_ABBREVIATIONS_TO_TEAM[value].value
+    return TEAM_ABBREVIATION_TO_TEAM(value).value
 
 def parse_positions(positions_content):
     parsed_positions = list(
@@ -310,6 +440,59 @@ for k in COLUMN_RENAMER:
     if k not in COLUMN_PARSER:
         COLUMN_PARSER[k] = str_to_float
 
+## the batch backend:  converters that take a whole column of cell strings at once (see
+## RowDecoder.decode_rows), for the COLUMN_PARSER converters that have one
+BATCH_CONVERTERS = {
+    str_to_int   : strs_to_ints,
+    str_to_float : strs_to_floats,
+    str_to_str   : strs_to_strs,
+}
+
+def batch_converter(converter):
+    """
+    the batch version of a COLUMN_PARSER converter.  those without one in BATCH_CONVERTERS 
+    (teams, positions, ...) only have a handful of distinct values in a column, so each of 
+    those is converted once and the results are looked up for the rest of the column.
+    """
+    if converter in BATCH_CONVERTERS:
+        return BATCH_CONVERTERS[converter]
+
+    def convert_column(values):
+        converted = dict([(value, converter(value)) for value in set(values)])
+        return [converted[value] for value in values]
+    return convert_column
+
+BATCH_COLUMN_PARSER = dict([(k, batch_converter(v)) for (k, v) in COLUMN_PARSER.items()])
+
+## the array.array typecodes of the numeric converters, for columnar results
+## (see RowDecoder.decode_columns); the others' columns are kept as lists
+COLUMN_ARRAY_TYPECODES = {
+    str_to_int               : 'q',
+    str_to_float             : 'd',
+    parse_max_minutes_played : 'd',
+    parse_percent_time       : 'd',
+}
+
+def rows_from_columns(columns):
+    """
+    the rows of columnar results (see RowDecoder.decode_columns), one dict at a time
+    """
+    keys = list(columns.keys())
+    return (dict(zip(keys, values)) for values in zip(*columns.values()))
+
+def concatenate_columns(columns_list):
+    """
+    join several sets of columns with the same keys into one, in order
+    """
+    joined = {}
+    for columns in columns_list:
+        for key, values in columns.items():
+            if key in joined:
+                joined[key].extend(values)
+            else:
+                joined[key] = copy(values)
+    return joined
+
 def parse_souped_row_given_header_columns(row, header_columns):
     """
     parse a single row (from a tr.find_all('td')) given a list of column names
@@ -336,6 +519,109 @@ def parse_souped_row_given_header_columns(row, header_columns):
             to_return[COLUMN_RENAMER[key]] = COLUMN_PARSER[key](row[ii].text)
     return to_return
 
+class RowDecoder:
+    """
+    parse_souped_row_given_header_columns compiled for one list of column names
+
+    the names are looked up in COLUMN_RENAMER and COLUMN_PARSER once, when the decoder is 
+    built (normally at import time, next to the header it's for), leaving a list of 
+    (index, output key, converter) triples with the empty columns dropped.  calling the 
+    decoder on a row then just runs through those, giving the same dict as 
+    parse_souped_row_given_header_columns(row, header_columns) would.
+
+    decode_rows does the same for a whole table, converting a column at a time with the
+    converters in BATCH_COLUMN_PARSER; decode_columns gives that table as columns instead.
+    """
+    __slots__ = ('header_columns', 'leading_fields', 'player_index', 'trailing_fields', 'batch_fields',
+        'typecodes')
+
+    def __init__(self, header_columns):
+        self.header_columns = tuple(header_columns)
+        self.player_index = None
+
+        ## keys are kept in the same order as the columns, so fields after the player column
+        ## are added after player_id and player_name
+        self.leading_fields = []
+        self.trailing_fields = []
+        for ii, key in enumerate(self.header_columns):
+            if key == 'empty':
+                continue
+            elif key == 'Player':
+                self.player_index = ii
+            elif self.player_index is None:
+                self.leading_fields.append((ii, COLUMN_RENAMER[key], COLUMN_PARSER[key]))
+            else:
+                self.trailing_fields.append((ii, COLUMN_RENAMER[key], COLUMN_PARSER[key]))
+
+        self.batch_fields = [(ii, key, BATCH_COLUMN_PARSER[self.header_columns[ii]])
+            for (ii, key, _) in self.leading_fields + self.trailing_fields]
+        self.typecodes = dict([(key, COLUMN_ARRAY_TYPECODES.get(converter))
+            for (_, key, converter) in self.leading_fields + self.trailing_fields])
+
+    def __call__(self, row):
+        assert len(self.header_columns) == len(row), "mismatch between row length and header length"
+
+        to_return = {key: converter(row[ii].text) for (ii, key, converter) in self.leading_fields}
+        if self.player_index is not None:
+            player = row[self.player_index]
+            to_return['player_id'] = player.get('data-append-csv')
+            ## drop the star for a player's name that indicates they're in the hall of fame
+            to_return['player_name'] = player.text.replace('*', '')
+            for (ii, key, converter) in self.trailing_fields:
+                to_return[key] = converter(row[ii].text)
+        return to_return
+
+    def _decode_columns(self, rows):
+        """
+        the output keys and the converted values of each of them (as lists), in the order
+        __call__ gives them
+        """
+        for row in rows:
+            assert len(self.header_columns) == len(row), "mismatch between row length and header length"
+
+        ## the text of every cell, a column at a time
+        texts = list(zip(*[[cell.text for cell in row] for row in rows])) or [()] * len(self.header_columns)
+
+        keys = [key for (_, key, _) in self.batch_fields]
+        columns = [convert_column(texts[ii]) for (ii, _, convert_column) in self.batch_fields]
+        if self.player_index is not None:
+            ## the player fields go where __call__ puts them:  after the leading fields
+            position = len(self.leading_fields)
+            keys[position:position] = ['player_id', 'player_name']
+            columns[position:position] = [
+                [row[self.player_index].get('data-append-csv') for row in rows],
+                [text.replace('*', '') for text in texts[self.player_index]],
+            ]
+        return keys, columns
+
+    def decode_rows(self, rows):
+        """
+        decode a list of rows, giving the same dicts as calling the decoder on each one
+        """
+        if not rows:
+            return []
+
+        keys, columns = self._decode_columns(rows)
+        if not keys:
+            return [{} for row in rows]
+        return [dict(zip(keys, values)) for values in zip(*columns)]
+
+    def decode_columns(self, rows):
+        """
+        decode a list of rows into columns:  a dict from each key decode_rows would give to
+        its values, in an array.array for numeric columns (see COLUMN_ARRAY_TYPECODES) and a
+        list for the rest.  the strings in a list column (teams, positions) are shared
+        between rows, so they're stored once.
+        """
+        keys, columns = self._decode_columns(rows)
+        return dict([
+            (key, array(self.typecodes[key], values) if self.typecodes.get(key) else values)
+            for key, values in zip(keys, columns)
+        ])
+
+    def __repr__(self):
+        return f'RowDecoder({list(self.header_columns)!r})'
+
 def find_team_column(header_columns):
     return header_columns.index('Tm')
 
@@ -1,7 +1,7 @@
 from basketball_reference_web_scraper.utilities import merge_two_dicts
 from basketball_reference_web_scraper.data  import TEAM_ABBREVIATIONS_TO_TEAM
 from basketball_reference_web_scraper.parsers.common import COLUMN_RENAMER, COLUMN_PARSER, \
-    find_team_column, parse_souped_row_given_header_columns, split_header_columns, get_all_tables_with_soup
+    find_team_column, split_header_columns, get_tables, RowDecoder
 
 
 ### set list of aliases allowed for the different tables
@@ -92,6 +92,8 @@ __playoff_career_table_headers = dict([('playoffs_'+k, v)
 career_table_headers = merge_two_dicts(
     __base_career_table_headers, __playoff_career_table_headers)
 
+career_table_decoders = dict([(k, RowDecoder(v)) for (k, v) in career_table_headers.items()])
+
 
 ## now, what are the tables called in the code?
 ## have to add " Table" to the end of each of these
@@ -115,31 +117,50 @@ career_table_ids = merge_two_dicts(
 VALID_CAREER_TABLE_NAMES = __base_career_tables + __playoff_career_tables
 UNIQUE_CAREER_TABLES = list(set(career_table_renamer.values()))
 
-def get_rows_headercolumns(all_tables, table):
+def career_table_caption(table):
     """
-    get the id string to search for in the page and the headers for a table
+    the (uppercased) caption of a career table, given any of its aliases
     """
     if table not in career_table_renamer:
         msg = "Don't know how to get table {table}.  Must be one of: ".format(table=table)
         msg += ', '.join(list(career_table_renamer.keys()))
         raise KeyError(msg)
 
-    resolved_table = career_table_renamer[table]
-    
-    table_id = career_table_ids[resolved_table]
-    rows = all_tables[table_id.upper()]
+    return career_table_ids[career_table_renamer[table]].upper()
+
+def get_rows_headercolumns(all_tables, table):
+    """
+    look up a table's rows, by its caption, in the tables already pulled from the page by
+    get_tables; returns (rows, header_columns, team_column)
+    """
+    rows = all_tables[career_table_caption(table)]
 
-    header_columns = career_table_headers[resolved_table]
+    header_columns = career_table_headers[career_table_renamer[table]]
     team_column = find_team_column(header_columns)
 
     return rows, header_columns, team_column
 
-def parse_a_players_career_table(page, table):
-    all_tables = get_all_tables_with_soup(page)
+def parse_career_table(all_tables, table):
+    """
+    parse one career table out of the tables already pulled from a page by get_tables
+    """
     rows, header_columns, team_column = get_rows_headercolumns(all_tables, table)
+    decode_row = career_table_decoders[career_table_renamer[table]]
 
     ## skip rows with no entry in the age column, as those correspond to team totals
-    parsed_rows = [parse_souped_row_given_header_columns(row, header_columns) 
-        for row in rows if (row[team_column].text != "TOT" and len(row[0].text))]
+    parsed_rows = decode_row.decode_rows([row for row in rows if (row[team_column].text != "TOT" and len(row[0].text))])
     
     return parsed_rows
+
+def parse_a_players_career_table(page, table):
+    return parse_career_table(get_tables(page, [career_table_caption(table)]), table)
+
+def parse_players_career_tables(page, tables):
+    """
+    parse several career tables from the same page, pulling the tables out of it (and out
+    of the comments that hold them) only once rather than once per table
+
+    returns a list with the rows of each table, in the same order as tables
+    """
+    all_tables = get_tables(page, [career_table_caption(table) for table in tables])
+    return [parse_career_table(all_tables, table) for table in tables]
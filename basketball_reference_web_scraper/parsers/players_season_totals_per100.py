@@ -1,20 +1,19 @@
 from basketball_reference_web_scraper.data import TEAM_ABBREVIATIONS_TO_TEAM, POSITION_ABBREVIATIONS_TO_POSITION
 from basketball_reference_web_scraper.parsers.common import COLUMN_RENAMER, COLUMN_PARSER, \
-    find_team_column, parse_souped_row_given_header_columns, split_header_columns, get_all_tables_with_soup
+    find_team_column, split_header_columns, get_tables, RowDecoder
 
 __totals_stats_per100_by_year_header_string = "Player,Pos,Age,Tm,G,GS,MP,FGperposs,FGAperposs,FG%,3Pperposs,3PAperposs,3P%,2Pperposs,2PAperposs,2P%,FTperposs,FTAperposs,FT%,ORBperposs,DRBperposs,TRBperposs,ASTperposs,STLperposs,BLKperposs,TOVperposs,PFperposs,PTSperposs,empty,ORtg,DRtg"
 _totals_stats_per100_by_year_header_columns = split_header_columns(__totals_stats_per100_by_year_header_string)
+_totals_stats_per100_by_year_row_decoder = RowDecoder(_totals_stats_per100_by_year_header_columns)
 
-def parse_players_season_totals_per100(page, skip_totals=False):
-    all_tables = get_all_tables_with_soup(page)
-
-    rows = all_tables['PLAYER PER 100 POSS TABLE']
-    header_columns = _totals_stats_per100_by_year_header_columns
+def parse_players_season_totals_per100(page, skip_totals=False, columnar=False):
+    rows = get_tables(page, ['PLAYER PER 100 POSS TABLE'])['PLAYER PER 100 POSS TABLE']
+    decode_row = _totals_stats_per100_by_year_row_decoder
 
     if skip_totals:
-        team_column = find_team_column(header_columns)
-        return [parse_souped_row_given_header_columns(row, header_columns)
-            for row in rows if (row[team_column].text != "TOT" and len(row[0].text))]
-    else:
-        return [parse_souped_row_given_header_columns(row, header_columns) 
-            for row in rows]
+        team_column = find_team_column(_totals_stats_per100_by_year_header_columns)
+        rows = [row for row in rows if (row[team_column].text != "TOT" and len(row[0].text))]
+
+    if columnar:
+        return decode_row.decode_columns(rows)
+    return decode_row.decode_rows(rows)
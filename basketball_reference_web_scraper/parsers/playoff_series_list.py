@@ -1,6 +1,7 @@
 from lxml import html
 
 from basketball_reference_web_scraper.data  import TEAM_NAME_TO_TEAM
+from basketball_reference_web_scraper.records import PlayoffSeries
 from basketball_reference_web_scraper.utilities import str_to_str, str_to_int
 
 def parse_series_list_row(row):
@@ -18,8 +19,8 @@ def parse_series_list_row(row):
     winning_team = str_to_str(teams_string.split('over')[0])
     losing_team = str_to_str(teams_string.split('over')[1].strip().split('\n')[0])
     
-    winning_team = TEAM_NAME_TO_TEAM(winning_team.upper())
-    losing_team = TEAM_NAME_TO_TEAM(losing_team.upper())
+    winning_team = TEAM_NAME_TO_TEAM(winning_team)
+    losing_team = TEAM_NAME_TO_TEAM(losing_team)
 
     record = teams_string.split('(')[-1].split(')')[0]
     winning_team_games_won = str_to_int(record.split('-')[0])
@@ -54,10 +55,16 @@ def get_table_rows(tree, div_id):
     rows = div.xpath('//table/tbody/tr')
     return rows
 
-def parse_playoff_series_list(page):
+def parse_playoff_series_list(page, records=False):
+    """
+    every series of a year's playoffs; as PlayoffSeries records rather than dicts with
+    records=True.  (the client adds names to each series, so it always asks for dicts)
+    """
     tree = html.fromstring(page)
     rows = tree.xpath('//table[@id="all_playoffs"]/tbody/tr')
 
     parsed_rows = [parse_series_list_row(row) for row in rows]
+    if records:
+        return [PlayoffSeries(**row) for row in parsed_rows if row is not None]
     return [row for row in parsed_rows if row is not None]
 
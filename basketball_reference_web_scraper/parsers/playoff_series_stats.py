@@ -3,7 +3,7 @@ import copy
 from basketball_reference_web_scraper.utilities import merge_two_dicts
 from basketball_reference_web_scraper.data  import TEAM_ABBREVIATIONS_TO_TEAM, TEAM_TO_TEAM_ABBREVIATIONS
 from basketball_reference_web_scraper.parsers.common import COLUMN_RENAMER, COLUMN_PARSER, \
-     find_team_column, parse_souped_row_given_header_columns, split_header_columns, get_all_tables_with_soup
+     find_team_column, split_header_columns, get_tables, RowDecoder
 
 ## only two tables (just "basic" and "advanced") so no aliases (or dictionaries) needed/allowed here
 __playoff_basic_header_string = "Player,Age,G,GS,MP,FG,FGA,3P,3PA,FT,FTA,ORB,DRB,TRB,AST,STL,BLK,TOV,PF,PTS,FG%,3P%,FT%,MPpg,PTSpg,TRBpg,ASTpg,STLpg,BLKpg"
@@ -15,14 +15,18 @@ _playoff_advanced_header_columns = split_header_columns(__playoff_advanced_heade
 __old_playoff_basic_header_string = "Player,Age,G,MP,FG,FGA,3P,3PA,FT,FTA,ORB,DRB,TRB,AST,STL,BLK,TOV,PF,PTS,FG%,3P%,FT%,MPpg,PTSpg,TRBpg,ASTpg,STLpg,BLKpg"
 _old_playoff_basic_header_columns = split_header_columns(__old_playoff_basic_header_string)
 
-def get_rows_headercolumns(all_tables, table, team, team_record):
+_playoff_basic_row_decoder = RowDecoder(_playoff_basic_header_columns)
+_playoff_advanced_row_decoder = RowDecoder(_playoff_advanced_header_columns)
+_old_playoff_basic_row_decoder = RowDecoder(_old_playoff_basic_header_columns)
+
+def get_rows_decoder(all_tables, table, team, team_record):
     """
-    get the id string to search for in the page and the headers for a table
+    get the rows of a team's table and the RowDecoder for its columns
     """
     team_name = copy.deepcopy(team.value)
 
     if table == 'advanced':
-        header_columns = _playoff_advanced_header_columns
+        decode_row = _playoff_advanced_row_decoder
         table_id = team_name + ' Advanced Stats Table'.upper()
         rows = all_tables[table_id]
 
@@ -41,12 +45,12 @@ def get_rows_headercolumns(all_tables, table, team, team_record):
         old_table_id = team_name + ' ' + team_record + ' Table'.upper()
         
         if table_id in all_tables:
-            header_columns = _playoff_basic_header_columns
+            decode_row = _playoff_basic_row_decoder
             rows = all_tables[table_id]
         elif old_table_id in all_tables:
             ### search for the older (pre-1984) captioned tables
             ## note that there are no advanced stats for those years anyway
-            header_columns = _old_playoff_basic_header_columns
+            decode_row = _old_playoff_basic_row_decoder
             rows = all_tables[old_table_id]               
         else:
             raise KeyError(f"Can't find {table_id} or {old_table_id} on page.  Available tables are:\n\t"+"; ".join(all_tables.keys()))
@@ -56,16 +60,13 @@ def get_rows_headercolumns(all_tables, table, team, team_record):
         ## tables
         # rows = tree.xpath('//table[@id="'+table_id+'"]/tbody/tr')
 
-    return rows, header_columns
-
-def parse_playoff_series_stats(page, series, table):
-    assert table in ['basic', 'advanced'], \
-        f"must provide either 'basic' or 'advanced' for table; gave {table}"
-
-    all_tables = get_all_tables_with_soup(page)
+    return rows, decode_row
 
-    winning_team = series['winning_team']
-    losing_team = series['losing_team']
+def teams_and_records(series):
+    """
+    [(winning team, its record), (losing team, its record)], with records as they're 
+    written in the captions of the older tables, e.g. "(4-2)" and "(2-4)"
+    """
     winning_record = '({0}-{1})'.format(
         series['winning_team_games_won'],
         series['losing_team_games_won'])
@@ -74,19 +75,48 @@ def parse_playoff_series_stats(page, series, table):
         series['winning_team_games_won'],
         series['losing_team_games_won'])
 
-    winning_rows, header_columns = get_rows_headercolumns(all_tables, table, winning_team, winning_record)
+    return [(series['winning_team'], winning_record), (series['losing_team'], losing_record)]
 
-    parsed_rows = []
-    for row in winning_rows:
-        prow = parse_souped_row_given_header_columns(row, header_columns)
-        prow['team'] = winning_team.value
-        parsed_rows.append(prow)
+def series_table_captions(series, table):
+    """
+    every caption get_rows_decoder may look for to find a table for both teams
+    """
+    captions = []
+    for team, team_record in teams_and_records(series):
+        if table == 'advanced':
+            captions.append(team.value + ' Advanced Stats Table'.upper())
+        else:
+            captions.append(team.value + ' Basic Stats Table'.upper())
+            captions.append(team.value + ' ' + team_record + ' Table'.upper())
+    return captions
 
-    losing_rows, header_columns = get_rows_headercolumns(all_tables, table, losing_team, losing_record)
+def parse_series_stats_table(all_tables, series, table):
+    """
+    parse the basic or advanced stats of both teams in a series out of the tables 
+    already pulled from a page by get_tables
+    """
+    assert table in ['basic', 'advanced'], \
+        f"must provide either 'basic' or 'advanced' for table; gave {table}"
 
-    for row in losing_rows:
-        prow = parse_souped_row_given_header_columns(row, header_columns)
-        prow['team'] = losing_team.value
-        parsed_rows.append(prow)
+    parsed_rows = []
+    for team, team_record in teams_and_records(series):
+        rows, decode_row = get_rows_decoder(all_tables, table, team, team_record)
+        for prow in decode_row.decode_rows(rows):
+            prow['team'] = team.value
+            parsed_rows.append(prow)
 
     return parsed_rows
+
+def parse_playoff_series_stats(page, series, table):
+    return parse_series_stats_table(get_tables(page, series_table_captions(series, table)), series, table)
+
+def parse_playoff_series_stats_tables(page, series, tables):
+    """
+    parse several stats tables (basic and/or advanced) of a series from the same page,
+    pulling the tables out of it only once
+
+    returns a list with the rows of each table, in the same order as tables
+    """
+    captions = [caption for table in tables for caption in series_table_captions(series, table)]
+    all_tables = get_tables(page, captions)
+    return [parse_series_stats_table(all_tables, series, table) for table in tables]
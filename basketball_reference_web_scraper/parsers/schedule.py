@@ -1,58 +1,102 @@
 from lxml import html
 import datetime
+import functools
 import pytz
 
 from basketball_reference_web_scraper.data import Team, TEAM_NAME_TO_TEAM
+from basketball_reference_web_scraper.records import Game
 from basketball_reference_web_scraper.utilities import str_to_int
 
-def parse_start_time(formatted_date, formatted_time_of_day):
-    if formatted_time_of_day is not None and formatted_time_of_day not in ["", " "]:
-        # Starting in 2018, the start times had a "p" or "a" appended to the end
-        # Between 2001 and 2017, the start times had a "pm" or "am"
-        #
-        # https://www.basketball-reference.com/leagues/NBA_2018_games.html
-        # vs.
-        # https://www.basketball-reference.com/leagues/NBA_2001_games.html
-        is_prior_format = formatted_time_of_day[-2:] == "am" or formatted_time_of_day[-2:] == "pm"
+# All basketball reference times seem to be in Eastern
+EASTERN = pytz.timezone("US/Eastern")
 
+# Starting in 2018, the start times had a "p" or "a" appended to the end
+# Between 2001 and 2017, the start times had a "pm" or "am"
+#
+# https://www.basketball-reference.com/leagues/NBA_2018_games.html
+# vs.
+# https://www.basketball-reference.com/leagues/NBA_2001_games.html
+PRIOR_TIME_OF_DAY_FORMAT = "%I:%M %p"
+CURRENT_TIME_OF_DAY_FORMAT = "%I:%M%p"
+
+## a season has ~1,300 games on a couple hundred days at a handful of tip-off times, so
+## the same strings come up over and over
+START_TIME_CACHE_SIZE = 4096
+
+
+def has_time_of_day(formatted_time_of_day):
+    return formatted_time_of_day is not None and formatted_time_of_day not in ["", " "]
+
+
+def time_of_day_format(formatted_time_of_day):
+    """
+    the strptime format for a start time like "7:30 pm" or "8:01p"
+    """
+    is_prior_format = formatted_time_of_day[-2:] == "am" or formatted_time_of_day[-2:] == "pm"
+    return PRIOR_TIME_OF_DAY_FORMAT if is_prior_format else CURRENT_TIME_OF_DAY_FORMAT
+
+
+@functools.lru_cache(maxsize=START_TIME_CACHE_SIZE)
+def _parse_start_time(formatted_date, formatted_time_of_day, time_format):
+    if time_format is not None:
         # If format contains only "p" or "a" add an "m" so it can be parsed by datetime module
-        if is_prior_format:
-            combined_formatted_time = formatted_date + " " + formatted_time_of_day
-        else:
-            combined_formatted_time = formatted_date + " " + formatted_time_of_day + "m"
-
-        if is_prior_format:
-            start_time = datetime.datetime.strptime(combined_formatted_time, "%a, %b %d, %Y %I:%M %p")
-        else:
-            start_time = datetime.datetime.strptime(combined_formatted_time, "%a, %b %d, %Y %I:%M%p")
+        if time_format == CURRENT_TIME_OF_DAY_FORMAT:
+            formatted_time_of_day = formatted_time_of_day + "m"
+        start_time = datetime.datetime.strptime(formatted_date + " " + formatted_time_of_day,
+            "%a, %b %d, %Y " + time_format)
     else:
         start_time = datetime.datetime.strptime(formatted_date, "%a, %b %d, %Y")
 
-    # All basketball reference times seem to be in Eastern
-    est = pytz.timezone("US/Eastern")
-    localized_start_time = est.localize(start_time)
-    return localized_start_time.astimezone(pytz.utc)
+    return EASTERN.localize(start_time).astimezone(pytz.utc)
 
 
-def parse_game(row):
-    start_time = parse_start_time(formatted_date=row[0].text_content(), formatted_time_of_day=row[1].text_content())
+def parse_start_time(formatted_date, formatted_time_of_day, time_format=None):
+    """
+    the start time of a game in UTC.  time_format is the format of formatted_time_of_day
+    (see time_of_day_format); it's worked out from formatted_time_of_day if not given.
+
+    results are cached on the raw strings; datetimes are immutable, so they can be shared.
+    """
+    if not has_time_of_day(formatted_time_of_day):
+        return _parse_start_time(formatted_date, None, None)
+    if time_format is None:
+        time_format = time_of_day_format(formatted_time_of_day)
+    return _parse_start_time(formatted_date, formatted_time_of_day, time_format)
+
+
+def parse_game(row, time_format=None):
+    start_time = parse_start_time(formatted_date=row[0].text_content(), formatted_time_of_day=row[1].text_content(),
+        time_format=time_format)
     return {
         "start_time": start_time,
-        "away_team": TEAM_NAME_TO_TEAM(row[2].text_content().upper()),
-        "home_team": TEAM_NAME_TO_TEAM(row[4].text_content().upper()),
+        "away_team": TEAM_NAME_TO_TEAM(row[2].text_content()),
+        "home_team": TEAM_NAME_TO_TEAM(row[4].text_content()),
         "away_team_score": str_to_int(row[3].text_content(), default=None),
         "home_team_score": str_to_int(row[5].text_content(), default=None),
     }
 
 
-def parse_schedule(page):
-    tree = html.fromstring(page)
-    rows = tree.xpath('//table[@id="schedule"]//tbody/tr')
-    schedule = []
+def page_time_of_day_format(rows):
+    """
+    the format of the start times on a schedule page (every game on a page uses the same
+    one), or None if the page has no start times
+    """
     for row in rows:
-        if row.text_content() != "Playoffs":
-            schedule.append(parse_game(row))
-    return schedule
+        if len(row) > 1 and has_time_of_day(row[1].text_content()):
+            return time_of_day_format(row[1].text_content())
+    return None
+
+
+def parse_schedule(page, records=False):
+    """
+    the games on a schedule page; as Game records rather than dicts with records=True
+    """
+    tree = html.fromstring(page)
+    rows = [row for row in tree.xpath('//table[@id="schedule"]//tbody/tr') if row.text_content() != "Playoffs"]
+    time_format = page_time_of_day_format(rows)
+    if records:
+        return [Game(**parse_game(row, time_format=time_format)) for row in rows]
+    return [parse_game(row, time_format=time_format) for row in rows]
 
 
 def parse_schedule_for_month_url_paths(page):
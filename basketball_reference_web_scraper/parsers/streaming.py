@@ -0,0 +1,179 @@
+from lxml import etree
+
+from basketball_reference_web_scraper.parsers.common import TableCell, find_team_column
+from basketball_reference_web_scraper.parsers.players_season_totals import _totals_stats_by_year_row_decoder
+from basketball_reference_web_scraper.parsers.players_advanced import _advanced_stats_by_year_row_decoder
+from basketball_reference_web_scraper.parsers.players_season_totals_per100 import \
+    _totals_stats_per100_by_year_row_decoder
+
+## streaming versions of the league-wide table parsers:  the page is fed to lxml in chunks,
+## no tree is built, and each row is yielded as soon as its </tr> has been read, so memory
+## use doesn't grow with the size of the table and callers can start on the first rows
+## before the rest of the page has been parsed (or even downloaded)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class TableRowTarget:
+    """
+    an lxml parser target that collects the rows of the table with a given caption, the
+    same rows get_tables would give (lists of TableCells), as the page is fed in
+    """
+    def __init__(self, caption, required_classes=['stats_table', 'sortable'],
+        excluded_row_classes=['over_header', 'poptip']):
+        self.caption = caption.upper()
+        self.required_classes = required_classes
+        self.excluded_row_classes = excluded_row_classes
+
+        ## finished rows that haven't been handed out yet
+        self.rows = []
+        ## whether the table has been found (outside of a comment)
+        self.found = False
+        ## comments that might hold the table, for when it isn't found outside of one
+        self.comments = []
+
+        self._table_depth = 0
+        self._caption_parts = None
+        self._matched = False
+        self._in_row = False
+        self._header_classes = None
+        self._cells = None
+        self._cell_parts = None
+        self._cell_attributes = None
+
+    def start(self, tag, attrib):
+        if tag == 'table':
+            if self._table_depth:
+                self._table_depth += 1
+            elif not self.found and False not in [k in (attrib.get('class') or '').split()
+                    for k in self.required_classes]:
+                self._table_depth = 1
+                self._matched = False
+            return
+
+        if not self._table_depth:
+            return
+
+        if tag == 'caption' and not self._matched:
+            self._caption_parts = []
+        elif not self._matched:
+            return
+        elif tag == 'tr':
+            self._in_row = True
+            self._header_classes = None
+            self._cells = []
+        elif tag == 'th' and self._in_row and self._header_classes is None:
+            self._header_classes = (attrib.get('class') or '').split()
+        elif tag == 'td' and self._in_row:
+            self._cell_parts = []
+            self._cell_attributes = dict(attrib)
+
+    def data(self, text):
+        if self._cell_parts is not None:
+            self._cell_parts.append(text)
+        elif self._caption_parts is not None:
+            self._caption_parts.append(text)
+
+    def end(self, tag):
+        if not self._table_depth:
+            return
+
+        if tag == 'table':
+            self._table_depth -= 1
+            if not self._table_depth and self._matched:
+                self.found = True
+        elif tag == 'caption' and self._caption_parts is not None:
+            self._matched = ''.join(self._caption_parts).strip().upper() == self.caption
+            self._caption_parts = None
+        elif tag == 'td' and self._cell_parts is not None:
+            self._cells.append(TableCell(''.join(self._cell_parts), self._cell_attributes))
+            self._cell_parts = None
+        elif tag == 'tr' and self._in_row:
+            self._in_row = False
+            if (self._header_classes is not None and
+                    True not in [exclud_class in self._header_classes for exclud_class in self.excluded_row_classes] and
+                    len(self._cells) and self._cells[0].text != 'Team Totals'):
+                self.rows.append(self._cells)
+            self._cells = None
+
+    def comment(self, text):
+        if not self.found and '<table' in text and self.caption in text.upper():
+            self.comments.append(text)
+
+    def close(self):
+        return self.found
+
+
+def _chunks(page, chunk_size):
+    if isinstance(page, (bytes, str)):
+        for start in range(0, len(page), chunk_size):
+            yield page[start:start + chunk_size]
+    else:
+        yield from page
+
+
+def iter_table_rows(page, caption, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    yield the rows (lists of TableCells) of the table with the given caption as the page
+    is parsed.  page is either the whole page (bytes or str) or an iterable of chunks of
+    it, e.g. a requests response's iter_content(), so rows come out while it's downloading.
+
+    as with get_tables, a table that's commented out is only used when there isn't one
+    outside of a comment; raises KeyError if there's no such table at all.
+    """
+    target = TableRowTarget(caption)
+    parser = etree.HTMLParser(target=target)
+
+    for chunk in _chunks(page, chunk_size):
+        parser.feed(chunk)
+        if target.rows:
+            rows, target.rows = target.rows, []
+            yield from rows
+    parser.close()
+    yield from target.rows
+
+    if target.found:
+        return
+
+    for comment in target.comments:
+        comment_target = TableRowTarget(caption)
+        comment_parser = etree.HTMLParser(target=comment_target)
+        comment_parser.feed(comment)
+        comment_parser.close()
+        if comment_target.found:
+            yield from comment_target.rows
+            return
+
+    raise KeyError(caption.upper())
+
+
+def _iter_parsed_rows(page, caption, decode_row, skip_totals, chunk_size):
+    team_column = find_team_column(decode_row.header_columns)
+    for row in iter_table_rows(page, caption, chunk_size=chunk_size):
+        if skip_totals and (row[team_column].text == "TOT" or not len(row[0].text)):
+            continue
+        yield decode_row(row)
+
+
+def iter_players_season_totals(page, skip_totals=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    a generator version of parse_players_season_totals, yielding each row as it's parsed
+    """
+    return _iter_parsed_rows(page, 'PLAYER TOTALS TABLE', _totals_stats_by_year_row_decoder,
+        skip_totals, chunk_size)
+
+
+def iter_players_advanced_stats(page, skip_totals=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    a generator version of parse_players_advanced_stats, yielding each row as it's parsed
+    """
+    return _iter_parsed_rows(page, 'ADVANCED TABLE', _advanced_stats_by_year_row_decoder,
+        skip_totals, chunk_size)
+
+
+def iter_players_season_totals_per100(page, skip_totals=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    a generator version of parse_players_season_totals_per100, yielding each row as it's parsed
+    """
+    return _iter_parsed_rows(page, 'PLAYER PER 100 POSS TABLE', _totals_stats_per100_by_year_row_decoder,
+        skip_totals, chunk_size)
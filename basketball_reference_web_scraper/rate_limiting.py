@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+TOO_MANY_REQUESTS = 429
+SERVICE_UNAVAILABLE = 503
+
+
+def parse_retry_after(value, now=None):
+    """
+    the number of seconds a Retry-After header asks to wait (it's either a number of
+    seconds or an HTTP date), or None if it can't be parsed
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = datetime.now(timezone.utc) if now is None else now
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+class RateLimiter:
+    """
+    a token bucket shared by every request, so that threads and asyncio tasks making
+    requests at the same time stay under `rate` requests per second between them
+
+    requests queue up for tokens in the order they ask for them.  when the site answers
+    429 Too Many Requests (or 503 with a Retry-After header), the whole bucket is paused
+    for as long as Retry-After asks (`default_pause` seconds if a 429 doesn't say) and the
+    request goes back in the queue, up to `max_deferrals` times.  see
+    `func:http_client.set_rate_limiter`.
+
+    Args:
+        rate (float):  requests per second allowed on average
+        burst (int):  how many requests can go out back to back after a quiet period
+        max_deferrals (int):  how many times a single request is re-queued after a 429
+        default_pause (float):  seconds to pause after a 429 without a Retry-After header
+    """
+    def __init__(self, rate, burst=1, max_deferrals=3, default_pause=60,
+        clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.max_deferrals = max_deferrals
+        self.default_pause = default_pause
+
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+        ## bumped by every pause, voiding the reservations made before it
+        self._generation = 0
+
+    def _refill(self, now):
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def _reserve(self):
+        """
+        take the next token, returning how many seconds to wait before it can be used and
+        the generation of the reservation (see pause)
+        """
+        with self._lock:
+            return self._reserve_locked()
+
+    def _reserve_locked(self):
+        now = self._clock()
+        self._refill(now)
+        self._tokens -= 1
+        ready_at = self._updated + max(0.0, -self._tokens / self.rate)
+        return max(0.0, ready_at - now), self._generation
+
+    def _confirm(self, generation):
+        """
+        after waiting out a reservation:  nothing more to wait if there hasn't been a pause
+        since it was made, otherwise a new reservation, queued behind the pause
+        """
+        with self._lock:
+            if generation == self._generation:
+                return 0.0, generation
+            return self._reserve_locked()
+
+    def acquire(self):
+        """
+        block the calling thread until a request can be made
+        """
+        wait, generation = self._reserve()
+        while wait > 0:
+            self._sleep(wait)
+            ## a pause may have started while this thread was waiting its turn
+            wait, generation = self._confirm(generation)
+
+    async def acquire_async(self):
+        """
+        wait (without blocking the event loop) until a request can be made
+        """
+        wait, generation = self._reserve()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait, generation = self._confirm(generation)
+
+    def pause(self, seconds):
+        """
+        hold back every request for `seconds`; a burst isn't allowed once the pause ends
+
+        reservations already handed out are dropped:  the requests waiting on them reserve
+        again once their wait is up, so they go out one at a time (at `rate`) after the
+        pause rather than all at once as it ends
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            until = now + seconds
+            if until > self._updated:
+                ## one request can go as soon as the pause ends
+                self._generation += 1
+                self._tokens = 1.0
+                self._updated = until
+
+    def retry_after(self, status_code, headers):
+        """
+        how many seconds to pause before re-sending a request that got this response,
+        or None if the response doesn't ask us to slow down
+        """
+        if status_code not in (TOO_MANY_REQUESTS, SERVICE_UNAVAILABLE):
+            return None
+
+        seconds = parse_retry_after(headers.get('Retry-After'))
+        if seconds is None and status_code == TOO_MANY_REQUESTS:
+            return self.default_pause
+        return seconds
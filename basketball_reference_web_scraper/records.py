@@ -0,0 +1,110 @@
+from collections.abc import Mapping
+
+## compact, immutable versions of the fixed-shape rows the parsers return (box scores, games,
+## playoff series).  a record keeps its values in __slots__ rather than in a dict of its own,
+## so a long run of them (a decade of daily box scores, say) takes far less memory, but it
+## still reads like the dict it replaces -- row["team"], row.keys(), dict(row), row == {...} --
+## so the writers in `output` and BasketballReferenceJSONEncoder take either.  the parsers
+## (and the clients) return them with records=True.
+
+
+def _record(record_type, values):
+    return record_type(**dict(zip(record_type.fields, values)))
+
+
+class Record(Mapping):
+    """
+    a row with a fixed set of fields (`fields`), readable as a mapping or by attribute
+    (row.team); it can't be changed once it's made
+    """
+    __slots__ = ()
+    fields = ()
+
+    def __init__(self, **values):
+        if len(values) != len(self.fields) or not all(field in values for field in self.fields):
+            raise TypeError("{name} takes exactly the fields {fields}, got {given}".format(
+                name=type(self).__name__, fields=', '.join(self.fields), given=', '.join(values)))
+        for field in self.fields:
+            object.__setattr__(self, field, values[field])
+
+    def __getitem__(self, key):
+        if key in self.fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{name} records can't be changed".format(name=type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("{name} records can't be changed".format(name=type(self).__name__))
+
+    def __reduce__(self):
+        ## __setattr__ is blocked, so they're pickled (e.g. back from a parse executor) by value
+        return _record, (type(self), tuple(getattr(self, field) for field in self.fields))
+
+    def __repr__(self):
+        return '{name}({values})'.format(name=type(self).__name__,
+            values=', '.join('{field}={value!r}'.format(field=field, value=getattr(self, field))
+                for field in self.fields))
+
+
+class PlayerBoxScore(Record):
+    """
+    a row of `parsers.parse_player_box_scores`
+    """
+    __slots__ = fields = (
+        "player_id",
+        "player_name",
+        "team",
+        "location",
+        "opponent",
+        "outcome",
+        "seconds_played",
+        "made_field_goals",
+        "attempted_field_goals",
+        "made_three_point_field_goals",
+        "attempted_three_point_field_goals",
+        "made_free_throws",
+        "attempted_free_throws",
+        "offensive_rebounds",
+        "defensive_rebounds",
+        "assists",
+        "steals",
+        "blocks",
+        "turnovers",
+        "personal_fouls",
+        "game_score",
+    )
+
+
+class Game(Record):
+    """
+    a row of `parsers.parse_schedule`
+    """
+    __slots__ = fields = (
+        "start_time",
+        "away_team",
+        "away_team_score",
+        "home_team",
+        "home_team_score",
+    )
+
+
+class PlayoffSeries(Record):
+    """
+    a row of `parsers.parse_playoff_series_list`
+    """
+    __slots__ = fields = (
+        "series_name",
+        "winning_team",
+        "losing_team",
+        "winning_team_games_won",
+        "losing_team_games_won",
+        "stats_link_ending",
+    )
@@ -0,0 +1,108 @@
+import asyncio
+import random
+import threading
+import time
+
+import requests
+
+from basketball_reference_web_scraper.rate_limiting import parse_retry_after
+
+NOT_FOUND = 404
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+DEFAULT_RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError,
+    asyncio.TimeoutError)
+
+## aiohttp is only installed for the asyncio client (pip install basketball_reference_web_scraper[async])
+try:
+    import aiohttp
+except ImportError:
+    pass
+else:
+    DEFAULT_RETRY_EXCEPTIONS += (aiohttp.ClientConnectionError,)
+
+
+class RetryPolicy:
+    """
+    how requests that fail for transient reasons (a 503, a dropped connection) are sent
+    again:  up to `max_attempts` tries in all, waiting an exponentially growing delay
+    between them.  see `func:http_client.set_retry_policy`.
+
+    404s are never retried, so they still become InvalidSeason, InvalidDate, etc.
+
+    Args:
+        max_attempts (int):  tries in all, including the first one
+        backoff_base (float):  seconds to wait before the first retry; doubled for each one after
+        backoff_cap (float):  the most seconds to wait between two tries
+        jitter (bool):  wait a random time between 0 and the backoff instead of the backoff
+            itself ("full jitter"), so that many threads retrying at once spread out
+        retry_statuses (tuple):  response status codes to retry
+        retry_exceptions (tuple):  exception types to retry
+        on_retry (callable):  called as on_retry(url, attempt, delay, reason) before every
+            retry, where reason is the status code or the exception
+
+    a Retry-After header on a retried response is honoured when it asks for longer than
+    the backoff.  `retries` counts the retries made under this policy so far.
+    """
+    def __init__(self, max_attempts=3, backoff_base=1, backoff_cap=60, jitter=True,
+        retry_statuses=DEFAULT_RETRY_STATUSES, retry_exceptions=DEFAULT_RETRY_EXCEPTIONS,
+        on_retry=None, sleep=time.sleep, random=random.random):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.on_retry = on_retry
+        self.retries = 0
+
+        self._sleep = sleep
+        self._random = random
+        self._lock = threading.Lock()
+
+    def should_retry(self, attempt, status_code=None, exception=None):
+        """
+        whether the `attempt`th try (counting from 1) should be followed by another
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if exception is not None:
+            return isinstance(exception, self.retry_exceptions)
+        ## never retried, whatever retry_statuses says:  a missing page won't appear
+        if status_code == NOT_FOUND:
+            return False
+        return status_code in self.retry_statuses
+
+    def backoff(self, attempt, headers=None):
+        """
+        seconds to wait after the `attempt`th try before the next one
+        """
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay *= self._random()
+        if headers is not None:
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            if retry_after is not None and retry_after > delay:
+                delay = retry_after
+        return delay
+
+    def record_retry(self, url, attempt, delay, reason):
+        with self._lock:
+            self.retries += 1
+        if self.on_retry is not None:
+            self.on_retry(url, attempt, delay, reason)
+
+    def wait(self, url, attempt, reason, headers=None):
+        """
+        record a retry and block until it's time to make it
+        """
+        delay = self.backoff(attempt, headers)
+        self.record_retry(url, attempt, delay, reason)
+        self._sleep(delay)
+
+    async def wait_async(self, url, attempt, reason, headers=None):
+        delay = self.backoff(attempt, headers)
+        self.record_retry(url, attempt, delay, reason)
+        await asyncio.sleep(delay)
@@ -1,3 +1,5 @@
+from itertools import islice
+
 def str_to_int(value, default=int(0)):
     stripped_value = value.strip()
     try:
@@ -16,6 +18,38 @@ def str_to_str(value, default=""):
     stripped_value = value.strip()
     return stripped_value
 
+## batch versions of the above, for converting a whole column of cells at once, giving
+## exactly what calling the single-value version on each cell would.  int() and float()
+## ignore surrounding whitespace themselves, so a column that's all numbers (nearly all of
+## them; ".456" included) is converted in a single map; otherwise blanks get the default
+## without raising, and only values that aren't numbers at all go through an exception
+
+def strs_to_ints(values, default=int(0)):
+    try:
+        return list(map(int, values))
+    except ValueError:
+        return [default if not value or value.isspace() else str_to_int(value, default) for value in values]
+
+def strs_to_floats(values, default=float(0)):
+    try:
+        return list(map(float, values))
+    except ValueError:
+        return [default if not value or value.isspace() else str_to_float(value, default) for value in values]
+
+def strs_to_strs(values, default=""):
+    return [value.strip() for value in values]
+
+
+def batches(rows, size):
+    """
+    split an iterable (e.g. a generator) into lists of up to size items
+    """
+    rows = iter(rows)
+    batch = list(islice(rows, size))
+    while batch:
+        yield batch
+        batch = list(islice(rows, size))
+
 
 def merge_two_dicts(first, second):
     combined = first.copy()
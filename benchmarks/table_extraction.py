@@ -0,0 +1,47 @@
+"""
+time get_all_tables (lxml) against get_all_tables_with_soup (BeautifulSoup) on the HTML 
+fixtures in tests/, and get_tables looking up just the first table of each page
+
+    python benchmarks/table_extraction.py [repeats]
+"""
+import glob
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from basketball_reference_web_scraper.parsers.common import get_all_tables, get_all_tables_with_soup, get_tables
+
+FIXTURES = os.path.join(os.path.dirname(__file__), '..', 'tests', '*.html')
+
+
+def best_time(function, page, repeats):
+    return min(timeit.repeat(lambda: function(page), number=1, repeat=repeats))
+
+
+def main(repeats=5):
+    print(f"{'fixture':<45} {'soup (ms)':>10} {'lxml (ms)':>10} {'speedup':>8} {'one table (ms)':>15}")
+    soup_total = lxml_total = lazy_total = 0.0
+    for path in sorted(glob.glob(FIXTURES)):
+        with open(path, 'rb') as fixture:
+            page = fixture.read()
+        try:
+            soup_time = best_time(get_all_tables_with_soup, page, repeats)
+        except KeyError:
+            ## a few pages have header cells without a class, which the soup version can't handle
+            continue
+        lxml_time = best_time(get_all_tables, page, repeats)
+        first_caption = next(iter(get_all_tables(page)))
+        lazy_time = best_time(lambda page: get_tables(page, [first_caption]), page, repeats)
+        soup_total += soup_time
+        lxml_total += lxml_time
+        lazy_total += lazy_time
+        print(f"{os.path.basename(path):<45} {soup_time * 1000:>10.1f} {lxml_time * 1000:>10.1f} "
+            f"{soup_time / lxml_time:>7.1f}x {lazy_time * 1000:>15.1f}")
+    print(f"{'total':<45} {soup_total * 1000:>10.1f} {lxml_total * 1000:>10.1f} {soup_total / lxml_total:>7.1f}x "
+        f"{lazy_total * 1000:>15.1f}")
+
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:]])
@@ -26,6 +26,10 @@ setuptools.setup(
         'bs4',
         "soupsieve",
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "parquet": ["pyarrow"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
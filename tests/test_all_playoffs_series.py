@@ -0,0 +1,41 @@
+from unittest import TestCase, IsolatedAsyncioTestCase, mock
+
+from basketball_reference_web_scraper import async_client, client
+from basketball_reference_web_scraper.data import OutputType, Team
+
+
+def series_list():
+    return [
+        {"series_name": "Finals", "winning_team": Team.GSW,
+         "losing_team": Team.CLE, "winning_team_games_won": 4, "losing_team_games_won": 1,
+         "stats_link_ending": "/playoffs/2017-nba-finals-cavaliers-vs-warriors.html"},
+    ]
+
+
+series_stats = [[{"player_id": "curryst01", "points": 134}], [{"player_id": "curryst01", "true_shooting_percentage": 0.6}]]
+
+## the output types that serialize in memory when there's no file to write to
+IN_MEMORY_OUTPUT_TYPES = [OutputType.JSON, OutputType.JSON_LINES]
+
+
+class TestAllPlayoffsSeriesInOneYear(TestCase):
+    @mock.patch("basketball_reference_web_scraper.client.http_client")
+    def test_no_output_directory_returns_rows(self, mocked_http_client):
+        mocked_http_client.playoff_series_stats.return_value = series_stats
+        for output_type in IN_MEMORY_OUTPUT_TYPES:
+            mocked_http_client.playoffs_series.return_value = series_list()
+            with self.subTest(output_type=output_type):
+                self.assertEqual(client.all_playoffs_series_in_one_year(2017, output_type=output_type),
+                    {"Finals": {"basic": series_stats[0], "advanced": series_stats[1]}})
+
+
+class TestAsyncAllPlayoffsSeriesInOneYear(IsolatedAsyncioTestCase):
+    @mock.patch("basketball_reference_web_scraper.async_client.async_http_client")
+    async def test_no_output_directory_returns_rows(self, mocked_http_client):
+        mocked_http_client.session_or_new.return_value = mock.MagicMock()
+        mocked_http_client.playoff_series_stats = mock.AsyncMock(return_value=series_stats)
+        for output_type in IN_MEMORY_OUTPUT_TYPES:
+            mocked_http_client.playoffs_series = mock.AsyncMock(return_value=series_list())
+            with self.subTest(output_type=output_type):
+                self.assertEqual(await async_client.all_playoffs_series_in_one_year(2017, output_type=output_type),
+                    {"Finals": {"basic": series_stats[0], "advanced": series_stats[1]}})
@@ -0,0 +1,106 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from requests import codes
+
+from basketball_reference_web_scraper import http_client, parsers
+from basketball_reference_web_scraper.archive import PageArchive
+from basketball_reference_web_scraper.errors import PageNotArchived
+
+season_2001_totals_html = os.path.join(os.path.dirname(__file__), './NBA_2001_totals.html')
+
+
+class TestPageArchive(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.archive = PageArchive(self.directory.name)
+        with open(season_2001_totals_html, 'rb') as page:
+            self.page = page.read()
+
+    def tearDown(self):
+        self.archive.close()
+        self.directory.cleanup()
+
+    def blob_count(self):
+        return sum(len(files) for (_, _, files) in os.walk(os.path.join(self.directory.name, 'blobs')))
+
+    def test_identical_pages_are_stored_once(self):
+        first = self.archive.store('https://example.com/leagues/NBA_2001_totals.html', self.page, fetched_at=1)
+        second = self.archive.store('https://example.com/leagues/NBA_2001_totals.html', self.page, fetched_at=2)
+        third = self.archive.store('https://example.com/playoffs/NBA_2001_totals.html', self.page, fetched_at=3)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+        self.assertEqual(self.blob_count(), 1)
+        self.assertEqual(self.archive.history('https://example.com/leagues/NBA_2001_totals.html'),
+            [(1, first), (2, first)])
+
+    def test_pages_are_compressed(self):
+        digest = self.archive.store('https://example.com/leagues/NBA_2001_totals.html', self.page)
+        self.assertLess(os.path.getsize(self.archive.blob_path(digest)), len(self.page) / 5)
+        self.assertEqual(self.archive.load(digest), self.page)
+
+    def test_latest_copy(self):
+        self.archive.store('https://example.com/a.html', b'old', fetched_at=1)
+        self.archive.store('https://example.com/a.html', b'new', fetched_at=2)
+        self.assertEqual(self.archive.latest('https://example.com/a.html'), b'new')
+        self.assertEqual(self.archive.latest('https://example.com/a.html', before=2), b'old')
+        self.assertIsNone(self.archive.latest('https://example.com/b.html'))
+
+    def test_params_are_part_of_the_url(self):
+        self.archive.store('https://example.com/boxscores/', b'day one', params={'day': 1, 'month': 1})
+        self.assertEqual(self.archive.latest('https://example.com/boxscores/', params={'month': 1, 'day': 1}),
+            b'day one')
+        self.assertIsNone(self.archive.latest('https://example.com/boxscores/'))
+
+    def test_pages_yields_latest_copy_matching_pattern(self):
+        self.archive.store('https://example.com/leagues/NBA_2001_totals.html', b'old', fetched_at=1)
+        self.archive.store('https://example.com/leagues/NBA_2001_totals.html', self.page, fetched_at=2)
+        self.archive.store('https://example.com/leagues/NBA_2001_games.html', b'games', fetched_at=3)
+
+        pages = list(self.archive.pages(r'_totals\.html'))
+
+        self.assertEqual(len(pages), 1)
+        url, fetched_at, body = pages[0]
+        self.assertEqual((url, fetched_at), ('https://example.com/leagues/NBA_2001_totals.html', 2))
+        self.assertEqual(parsers.parse_players_season_totals(body), parsers.parse_players_season_totals(self.page))
+
+
+class TestFetchWithArchive(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.archive = PageArchive(self.directory.name)
+        with open(season_2001_totals_html, 'rb') as page:
+            self.page = page.read()
+
+    def tearDown(self):
+        http_client.set_archive(None)
+        self.archive.close()
+        self.directory.cleanup()
+
+    @mock.patch("requests.Session.get")
+    def test_downloaded_pages_are_archived(self, mocked_get):
+        http_client.set_archive(self.archive)
+        mocked_get.return_value = mock.Mock(status_code=codes.ok, content=self.page)
+
+        http_client.players_season_totals(2001)
+
+        self.assertEqual(self.archive.latest(http_client.BASE_URL + '/leagues/NBA_2001_totals.html'), self.page)
+
+    @mock.patch("requests.Session.get")
+    def test_replay_parses_archived_pages_without_requests(self, mocked_get):
+        self.archive.store(http_client.BASE_URL + '/leagues/NBA_2001_totals.html', self.page)
+        http_client.set_archive(self.archive, replay=True)
+
+        totals = http_client.players_season_totals(2001)
+
+        mocked_get.assert_not_called()
+        self.assertEqual(totals, parsers.parse_players_season_totals(self.page))
+
+    @mock.patch("requests.Session.get")
+    def test_replay_of_missing_page_raises(self, mocked_get):
+        http_client.set_archive(self.archive, replay=True)
+        self.assertRaisesRegex(PageNotArchived, "NBA_2002_totals.html",
+            http_client.players_season_totals, 2002)
+        mocked_get.assert_not_called()
@@ -0,0 +1,173 @@
+import asyncio
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase, mock
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from basketball_reference_web_scraper import async_client, async_http_client, http_client, parsers
+from basketball_reference_web_scraper.archive import PageArchive
+from basketball_reference_web_scraper.cache import ResponseCache
+from basketball_reference_web_scraper.errors import InvalidSeason, IncompleteBoxScores, PageNotArchived
+from basketball_reference_web_scraper.retries import RetryPolicy
+
+
+def fixture_content(file_name):
+    with open(os.path.join(os.path.dirname(__file__), file_name), 'rb') as fixture:
+        return fixture.read()
+
+
+class TestAsyncClient(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.pages = {
+            '/leagues/NBA_2018_totals.html': fixture_content('NBA_2018_totals.html'),
+            '/boxscores/': fixture_content('01_01_2017_box_scores.html'),
+            '/boxscores/201701010ATL.html': fixture_content('201701010ATL.html'),
+        }
+        self.requested_paths = []
+        self.unavailable_paths = set()
+        self.failures_before_success = {}
+
+        async def serve_fixture(request):
+            ## game links already start with a slash, so their urls have two
+            path = '/' + request.path.lstrip('/')
+            self.requested_paths.append(path)
+            if path in self.unavailable_paths:
+                raise web.HTTPServiceUnavailable()
+            if self.failures_before_success.get(path, 0) > 0:
+                self.failures_before_success[path] -= 1
+                raise web.HTTPServiceUnavailable()
+            if path in self.pages:
+                return web.Response(body=self.pages[path], content_type='text/html')
+            if path.startswith('/boxscores/2017'):
+                return web.Response(body=self.pages['/boxscores/201701010ATL.html'], content_type='text/html')
+            raise web.HTTPNotFound()
+
+        app = web.Application()
+        app.router.add_get('/{path:.*}', serve_fixture)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+        base_url_patch = mock.patch.object(http_client, 'BASE_URL', str(self.server.make_url('')).rstrip('/'))
+        base_url_patch.start()
+        self.addCleanup(base_url_patch.stop)
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_players_season_totals_matches_parser(self):
+        async with async_http_client.create_session() as session:
+            values = await async_client.players_season_totals(2018, session=session)
+        self.assertEqual(values, parsers.parse_players_season_totals(self.pages['/leagues/NBA_2018_totals.html']))
+
+    async def test_players_season_totals_without_session(self):
+        values = await async_client.players_season_totals(2018, skip_totals=True)
+        self.assertEqual(values, parsers.parse_players_season_totals(
+            self.pages['/leagues/NBA_2018_totals.html'], skip_totals=True))
+
+    async def test_not_found_raises_invalid_season(self):
+        with self.assertRaisesRegex(InvalidSeason, "Season end year of 1900 is invalid"):
+            await async_client.players_season_totals(1900)
+
+    async def test_team_box_scores_fetches_every_game(self):
+        values = await async_client.team_box_scores(day=1, month=1, year=2017)
+        self.assertEqual(len(values), 10)
+        self.assertEqual(sorted(self.requested_paths[1:]), [
+            '/boxscores/201701010ATL.html',
+            '/boxscores/201701010IND.html',
+            '/boxscores/201701010LAL.html',
+            '/boxscores/201701010MIA.html',
+            '/boxscores/201701010MIN.html',
+        ])
+
+    async def test_team_box_scores_keeps_successful_games(self):
+        self.unavailable_paths.add('/boxscores/201701010MIA.html')
+        with self.assertRaises(IncompleteBoxScores) as context:
+            await async_client.team_box_scores(day=1, month=1, year=2017)
+
+        self.assertEqual(list(context.exception.failures.keys()), ['/boxscores/201701010MIA.html'])
+        self.assertEqual(context.exception.failures['/boxscores/201701010MIA.html'].status, 503)
+        self.assertEqual(len(context.exception.box_scores), 8)
+
+    async def test_team_box_scores_cancelled_game_is_not_a_failure(self):
+        fetch_box_score = async_http_client.team_box_score
+
+        async def cancel_one_game(game_url_path, session=None):
+            if game_url_path.endswith('201701010MIA.html'):
+                raise asyncio.CancelledError()
+            return await fetch_box_score(game_url_path=game_url_path, session=session)
+
+        with mock.patch.object(async_http_client, 'team_box_score', side_effect=cancel_one_game):
+            with self.assertRaises(asyncio.CancelledError):
+                await async_client.team_box_scores(day=1, month=1, year=2017)
+
+    async def test_transient_failures_are_retried(self):
+        retry_policy = RetryPolicy(max_attempts=3, backoff_base=0)
+        http_client.set_retry_policy(retry_policy)
+        self.addCleanup(http_client.set_retry_policy, None)
+        self.failures_before_success['/leagues/NBA_2018_totals.html'] = 2
+
+        values = await async_client.players_season_totals(2018)
+
+        self.assertEqual(values, parsers.parse_players_season_totals(self.pages['/leagues/NBA_2018_totals.html']))
+        self.assertEqual(retry_policy.retries, 2)
+
+    async def test_not_found_is_not_retried(self):
+        http_client.set_retry_policy(RetryPolicy(max_attempts=3, backoff_base=0))
+        self.addCleanup(http_client.set_retry_policy, None)
+        with self.assertRaises(InvalidSeason):
+            await async_client.players_season_totals(1900)
+        self.assertEqual(self.requested_paths, ['/leagues/NBA_1900_totals.html'])
+
+    async def test_cached_pages_are_not_requested_again(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResponseCache(os.path.join(directory, 'cache.sqlite'))
+            http_client.set_cache(cache)
+            self.addCleanup(http_client.set_cache, None)
+            self.addCleanup(cache.close)
+
+            first = await async_client.players_season_totals(2018)
+            second = await async_client.players_season_totals(2018)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.requested_paths, ['/leagues/NBA_2018_totals.html'])
+
+    async def test_downloaded_pages_are_archived_and_replayed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            archive = PageArchive(directory)
+            self.addCleanup(archive.close)
+            self.addCleanup(http_client.set_archive, None)
+
+            http_client.set_archive(archive)
+            downloaded = await async_client.players_season_totals(2018)
+
+            http_client.set_archive(archive, replay=True)
+            replayed = await async_client.players_season_totals(2018)
+            with self.assertRaises(PageNotArchived):
+                await async_client.players_advanced_stats(2018)
+
+        self.assertEqual(replayed, downloaded)
+        self.assertEqual(self.requested_paths, ['/leagues/NBA_2018_totals.html'])
+
+
+class TestAsyncFetchWithRetryPolicy(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.get.side_effect = aiohttp.ServerDisconnectedError()
+        self.addCleanup(http_client.set_retry_policy, None)
+
+    async def test_connection_errors_are_retried_by_default(self):
+        retry_policy = RetryPolicy(max_attempts=3, backoff_base=0)
+        http_client.set_retry_policy(retry_policy)
+        with self.assertRaises(aiohttp.ServerDisconnectedError):
+            await async_http_client.fetch('http://localhost/', session=self.session)
+        self.assertEqual(self.session.get.call_count, 3)
+        self.assertEqual(retry_policy.retries, 2)
+
+    async def test_retry_exceptions_are_honoured(self):
+        http_client.set_retry_policy(RetryPolicy(max_attempts=3, backoff_base=0, retry_exceptions=(TimeoutError,)))
+        with self.assertRaises(aiohttp.ServerDisconnectedError):
+            await async_http_client.fetch('http://localhost/', session=self.session)
+        self.session.get.assert_called_once()
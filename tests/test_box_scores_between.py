@@ -0,0 +1,65 @@
+import os
+import tempfile
+from datetime import date, datetime
+from unittest import TestCase, mock
+
+import pytz
+from requests import HTTPError, codes
+
+from basketball_reference_web_scraper import client
+from basketball_reference_web_scraper.errors import InvalidDate
+
+
+def fake_player_box_scores(day, month, year, session=None, records=False):
+    if day == 20:
+        raise InvalidDate(day=day, month=month, year=year)
+    return [{'date': date(year, month, day)}]
+
+
+@mock.patch("basketball_reference_web_scraper.http_client.player_box_scores", side_effect=fake_player_box_scores)
+class TestPlayerBoxScoresBetween(TestCase):
+    def test_every_day_is_yielded(self, mocked_box_scores):
+        results = dict(client.player_box_scores_between(date(2018, 10, 16), date(2018, 10, 21), max_workers=3))
+
+        self.assertEqual(sorted(results), [date(2018, 10, day) for day in range(16, 22)])
+        self.assertEqual(results[date(2018, 10, 17)], [{'date': date(2018, 10, 17)}])
+        ## the site redirects days without games
+        self.assertEqual(results[date(2018, 10, 20)], [])
+
+    def test_records_are_asked_for(self, mocked_box_scores):
+        list(client.player_box_scores_between(date(2018, 10, 16), date(2018, 10, 16), records=True))
+        self.assertTrue(mocked_box_scores.call_args.kwargs['records'])
+
+    def test_schedule_skips_days_without_games(self, mocked_box_scores):
+        schedule = [
+            ## 8pm and 10:30pm Eastern on the 16th
+            {'start_time': pytz.utc.localize(datetime(2018, 10, 17, 0, 0))},
+            {'start_time': pytz.utc.localize(datetime(2018, 10, 17, 2, 30))},
+            {'start_time': pytz.utc.localize(datetime(2018, 10, 19, 23, 0))},
+            {'start_time': pytz.utc.localize(datetime(2018, 11, 1, 23, 0))},
+        ]
+        results = dict(client.player_box_scores_between(date(2018, 10, 16), date(2018, 10, 31), schedule=schedule))
+        self.assertEqual(sorted(results), [date(2018, 10, 16), date(2018, 10, 19)])
+
+    def test_checkpoint_resumes_where_it_left_off(self, mocked_box_scores):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_file_path = os.path.join(directory, 'checkpoint.txt')
+            harvest = client.player_box_scores_between(date(2018, 10, 16), date(2018, 10, 25), max_workers=1,
+                checkpoint_file_path=checkpoint_file_path)
+            first_days = [day for (day, _) in [next(harvest), next(harvest), next(harvest)]]
+            harvest.close()
+
+            rest = [day for (day, _) in client.player_box_scores_between(date(2018, 10, 16), date(2018, 10, 25),
+                checkpoint_file_path=checkpoint_file_path)]
+
+        self.assertEqual(first_days, [date(2018, 10, 16), date(2018, 10, 17), date(2018, 10, 18)])
+        ## the third day was never moved on from, so it's fetched again
+        self.assertEqual(sorted(rest), [date(2018, 10, day) for day in range(18, 26)])
+
+
+class TestTeamBoxScoresBetween(TestCase):
+    @mock.patch("basketball_reference_web_scraper.http_client.team_box_scores")
+    def test_missing_day_raises_invalid_date(self, mocked_box_scores):
+        mocked_box_scores.side_effect = HTTPError(response=mock.Mock(status_code=codes.not_found))
+        with self.assertRaisesRegex(InvalidDate, "year set to 2018, month set to 10, and day set to 16"):
+            list(client.team_box_scores_between(date(2018, 10, 16), date(2018, 10, 16)))
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import time
+from unittest import TestCase, mock
+
+from requests import codes
+
+from basketball_reference_web_scraper import http_client
+from basketball_reference_web_scraper.cache import ResponseCache
+
+
+class TestResponseCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(os.path.join(self.directory.name, 'cache.sqlite'),
+            ttls=[(r'/leagues/NBA_2001_', None), (r'/boxscores/', 0)], default_ttl=60)
+
+    def tearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
+
+    def test_store_and_lookup(self):
+        self.cache.store('https://example.com/a.html', b'<html></html>', etag='"abc"')
+        entry = self.cache.lookup('https://example.com/a.html')
+        self.assertEqual(entry.body, b'<html></html>')
+        self.assertEqual(entry.etag, '"abc"')
+        self.assertIsNone(self.cache.lookup('https://example.com/b.html'))
+
+    def test_params_are_part_of_the_key_in_any_order(self):
+        self.cache.store('https://example.com/boxscores/', b'first', params={'day': 1, 'month': 2})
+        self.assertEqual(self.cache.lookup('https://example.com/boxscores/', {'month': 2, 'day': 1}).body, b'first')
+        self.assertIsNone(self.cache.lookup('https://example.com/boxscores/', {'month': 2, 'day': 2}))
+
+    def test_ttl_patterns(self):
+        self.assertIsNone(self.cache.ttl('https://example.com/leagues/NBA_2001_totals.html'))
+        self.assertEqual(self.cache.ttl('https://example.com/boxscores/'), 0)
+        self.assertEqual(self.cache.ttl('https://example.com/leagues/NBA_2019_totals.html'), 60)
+
+        self.cache.store('https://example.com/leagues/NBA_2001_totals.html', b'old')
+        entry = self.cache.lookup('https://example.com/leagues/NBA_2001_totals.html')
+        self.assertTrue(self.cache.is_fresh(entry, 'https://example.com/leagues/NBA_2001_totals.html',
+            now=time.time() + 10 ** 9))
+
+        self.cache.store('https://example.com/leagues/NBA_2019_totals.html', b'new')
+        entry = self.cache.lookup('https://example.com/leagues/NBA_2019_totals.html')
+        self.assertTrue(self.cache.is_fresh(entry, 'https://example.com/leagues/NBA_2019_totals.html'))
+        self.assertFalse(self.cache.is_fresh(entry, 'https://example.com/leagues/NBA_2019_totals.html',
+            now=time.time() + 61))
+
+    def test_least_recently_used_pages_are_evicted(self):
+        self.cache.max_size = 25
+        self.cache.store('https://example.com/1', b'x' * 10)
+        self.cache.store('https://example.com/2', b'x' * 10)
+        self.cache.lookup('https://example.com/1')
+        self.cache.store('https://example.com/3', b'x' * 10)
+
+        self.assertIsNotNone(self.cache.lookup('https://example.com/1'))
+        self.assertIsNone(self.cache.lookup('https://example.com/2'))
+        self.assertIsNotNone(self.cache.lookup('https://example.com/3'))
+        self.assertEqual(self.cache.size(), 20)
+
+    def test_cache_persists_between_instances(self):
+        self.cache.store('https://example.com/a.html', b'kept')
+        reopened = ResponseCache(self.cache.path)
+        self.assertEqual(reopened.lookup('https://example.com/a.html').body, b'kept')
+        reopened.close()
+
+
+class TestFetchWithCache(TestCase):
+    url = http_client.BASE_URL + '/leagues/NBA_2019_totals.html'
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(os.path.join(self.directory.name, 'cache.sqlite'))
+        http_client.set_cache(self.cache)
+        self.session = mock.Mock()
+
+    def tearDown(self):
+        http_client.set_cache(None)
+        self.cache.close()
+        self.directory.cleanup()
+
+    def test_ok_response_is_stored_and_reused(self):
+        self.session.get.return_value = mock.Mock(status_code=codes.ok, content=b'page',
+            headers={'ETag': '"v1"'})
+        first = http_client.fetch(self.url, session=self.session)
+        second = http_client.fetch(self.url, session=self.session)
+
+        self.assertEqual(first.content, b'page')
+        self.assertEqual(second.content, b'page')
+        self.assertEqual(second.status_code, codes.ok)
+        self.session.get.assert_called_once()
+
+    def test_error_response_is_not_stored(self):
+        self.session.get.return_value = mock.Mock(status_code=codes.not_found, content=b'missing', headers={})
+        http_client.fetch(self.url, session=self.session)
+        self.assertIsNone(self.cache.lookup(self.url))
+
+    def test_stale_page_is_revalidated(self):
+        self.cache.store(self.url, b'page', etag='"v1"', last_modified='Wed, 01 May 2019 00:00:00 GMT')
+        self.cache.default_ttl = 0
+        self.session.get.return_value = mock.Mock(status_code=codes.not_modified, content=b'', headers={})
+
+        response = http_client.fetch(self.url, session=self.session)
+
+        self.assertEqual(response.content, b'page')
+        headers = self.session.get.call_args[1]['headers']
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+        self.assertEqual(headers['If-Modified-Since'], 'Wed, 01 May 2019 00:00:00 GMT')
+
+    def test_client_functions_use_the_cache(self):
+        with open(os.path.join(os.path.dirname(__file__), 'NBA_2019_totals.html'), 'rb') as page:
+            self.cache.store(self.url, page.read())
+        with mock.patch("requests.Session.get") as mocked_get:
+            totals = http_client.players_season_totals(2019)
+        mocked_get.assert_not_called()
+        self.assertGreater(len(totals), 0)
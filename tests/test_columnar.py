@@ -0,0 +1,115 @@
+import os
+import tempfile
+from datetime import datetime
+from unittest import TestCase, skipUnless
+
+import pytz
+
+from basketball_reference_web_scraper import output, parsers
+from basketball_reference_web_scraper.data import OutputType, OutputWriteOption, Team, Location, Outcome
+from basketball_reference_web_scraper.json_encoders import BasketballReferenceJSONEncoder
+
+try:
+    import pyarrow
+    import pyarrow.dataset
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def fixture_content(file_name):
+    with open(os.path.join(os.path.dirname(__file__), file_name), 'rb') as fixture:
+        return fixture.read()
+
+
+@skipUnless(pyarrow, "pyarrow isn't installed")
+class TestParquetOutput(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.dataset_path = os.path.join(self.directory.name, 'totals')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def output_parquet(self, values, csv_writer, partition=None, **kwargs):
+        output.output(values, output_type=OutputType.PARQUET, output_file_path=self.dataset_path,
+            encoder=BasketballReferenceJSONEncoder, csv_writer=csv_writer, partition=partition, **kwargs)
+
+    def read_dataset(self):
+        return pyarrow.dataset.dataset(self.dataset_path, format='parquet', partitioning='hive').to_table()
+
+    def test_season_totals_schema_comes_from_the_header(self):
+        totals = parsers.parse_players_season_totals(fixture_content('NBA_2018_totals.html'))
+        self.output_parquet(totals, output.players_season_totals_to_csv, partition={'season': 2018})
+
+        table = self.read_dataset()
+        self.assertEqual(table.num_rows, len(totals))
+        self.assertEqual(table.schema.field('games_played').type, pyarrow.int64())
+        self.assertEqual(table.schema.field('field_goal_percent').type, pyarrow.float64())
+        self.assertTrue(pyarrow.types.is_dictionary(table.schema.field('team').type))
+        self.assertTrue(pyarrow.types.is_dictionary(table.schema.field('positions').type))
+        self.assertEqual(table.column('season').to_pylist(), [2018] * len(totals))
+
+        rows = table.drop_columns(['season']).to_pylist()
+        self.assertEqual(rows, totals)
+
+    def test_each_call_appends_a_season(self):
+        totals_2018 = parsers.parse_players_season_totals(fixture_content('NBA_2018_totals.html'))
+        totals_2019 = parsers.parse_players_season_totals(fixture_content('NBA_2019_totals.html'))
+        self.output_parquet(totals_2018, output.players_season_totals_to_csv, partition={'season': 2018})
+        self.output_parquet(iter(totals_2019), output.players_season_totals_to_csv, partition={'season': 2019},
+            flush_interval=100)
+
+        self.assertEqual(sorted(os.listdir(self.dataset_path)), ['season=2018', 'season=2019'])
+        table = self.read_dataset()
+        self.assertEqual(table.num_rows, len(totals_2018) + len(totals_2019))
+
+        season_2019 = pyarrow.parquet.ParquetFile(os.path.join(self.dataset_path, 'season=2019',
+            os.listdir(os.path.join(self.dataset_path, 'season=2019'))[0]))
+        self.assertEqual(season_2019.metadata.num_row_groups, -(-len(totals_2019) // 100))
+
+    def test_enums_are_dictionary_encoded(self):
+        box_scores = [
+            {"player_id": "oneso01", "team": Team.BOS, "location": Location.HOME, "opponent": Team.MIA,
+             "outcome": Outcome.WIN, "seconds_played": 1800, "game_score": 10.5},
+            {"player_id": "twoso01", "team": Team.MIA, "location": Location.AWAY, "opponent": Team.BOS,
+             "outcome": Outcome.LOSS, "seconds_played": 0, "game_score": 0.0},
+        ]
+        self.output_parquet(box_scores, output.box_scores_to_csv)
+
+        table = self.read_dataset()
+        for column in ['team', 'location', 'opponent', 'outcome']:
+            self.assertTrue(pyarrow.types.is_dictionary(table.schema.field(column).type))
+        self.assertEqual(table.column('team').to_pylist(), ['BOSTON CELTICS', 'MIAMI HEAT'])
+        self.assertEqual(table.schema.field('seconds_played').type, pyarrow.int64())
+
+    def test_start_times_are_timestamps(self):
+        games = [{"start_time": datetime(2018, 10, 17, 0, 0, tzinfo=pytz.utc), "away_team": Team.BOS,
+            "away_team_score": None, "home_team": Team.MIA, "home_team_score": None}]
+        self.output_parquet(games, output.schedule_to_csv, partition={'season': 2019})
+
+        table = self.read_dataset()
+        self.assertEqual(table.schema.field('start_time').type, pyarrow.timestamp('us', tz='UTC'))
+        self.assertEqual(table.column('start_time').to_pylist(), [games[0]["start_time"]])
+
+    def test_write_replaces_the_partition(self):
+        totals_2018 = parsers.parse_players_season_totals(fixture_content('NBA_2018_totals.html'))
+        totals_2019 = parsers.parse_players_season_totals(fixture_content('NBA_2019_totals.html'))
+        self.output_parquet(totals_2018, output.players_season_totals_to_csv, partition={'season': 2018})
+        for _ in range(2):
+            self.output_parquet(totals_2019, output.players_season_totals_to_csv, partition={'season': 2019},
+                output_write_option=OutputWriteOption.WRITE)
+
+        table = self.read_dataset()
+        self.assertEqual(table.num_rows, len(totals_2018) + len(totals_2019))
+        self.assertEqual(len(os.listdir(os.path.join(self.dataset_path, 'season=2019'))), 1)
+
+    def test_column_that_starts_out_empty_takes_the_type_of_later_values(self):
+        games = [{"start_time": datetime(2018, 10, 17, 0, 0, tzinfo=pytz.utc), "away_team": Team.BOS,
+            "away_team_score": score, "home_team": Team.MIA, "home_team_score": score}
+            for score in [None, None, None, 101, None]]
+        self.output_parquet(iter(games), output.schedule_to_csv, partition={'season': 2019}, flush_interval=2)
+
+        table = self.read_dataset()
+        self.assertEqual(table.schema.field('home_team_score').type, pyarrow.int64())
+        self.assertEqual(table.column('home_team_score').to_pylist(), [None, None, None, 101, None])
@@ -0,0 +1,34 @@
+from unittest import TestCase
+
+from basketball_reference_web_scraper.data import Team, Position, TEAM_NAME_TO_TEAM, TEAM_ABBREVIATION_TO_TEAM, \
+    TEAM_ABBREVIATIONS_TO_TEAM, TEAM_NAMES_TO_TEAM, POSITION_ABBREVIATIONS_TO_POSITION
+from basketball_reference_web_scraper.errors import UnknownTeam
+
+
+class TestTeamLookup(TestCase):
+    def test_every_team_name(self):
+        for team in Team:
+            self.assertIs(TEAM_NAME_TO_TEAM(team.value), Team(team.value))
+
+    def test_names_are_case_insensitive(self):
+        self.assertIs(TEAM_NAME_TO_TEAM("San Antonio Spurs"), Team.SAS)
+        self.assertIs(TEAM_NAME_TO_TEAM("Philadelphia 76ers"), Team.PHI)
+
+    def test_every_team_abbreviation(self):
+        for abbreviation, team in Team.__members__.items():
+            self.assertIs(TEAM_ABBREVIATION_TO_TEAM(abbreviation), team)
+
+    def test_sentinels(self):
+        self.assertIs(TEAM_NAME_TO_TEAM(""), Team.UNK)
+        self.assertIs(TEAM_ABBREVIATION_TO_TEAM(""), Team.UNK)
+        self.assertIs(TEAM_ABBREVIATION_TO_TEAM("TOT"), Team.TOT)
+
+    def test_unknown_team_raises(self):
+        self.assertRaisesRegex(UnknownTeam, "SPRINGFIELD ATOMS", TEAM_NAME_TO_TEAM, "SPRINGFIELD ATOMS")
+        self.assertRaises(ValueError, TEAM_ABBREVIATION_TO_TEAM, "XXX")
+
+    def test_lookups_are_read_only(self):
+        for lookup in [TEAM_NAMES_TO_TEAM, TEAM_ABBREVIATIONS_TO_TEAM, POSITION_ABBREVIATIONS_TO_POSITION]:
+            with self.assertRaises(TypeError):
+                lookup["NEW"] = None
+        self.assertIs(POSITION_ABBREVIATIONS_TO_POSITION["PG"], Position.POINT_GUARD)
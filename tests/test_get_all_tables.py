@@ -0,0 +1,98 @@
+import glob
+import os
+from unittest import TestCase, mock
+
+from basketball_reference_web_scraper.parsers import common
+from basketball_reference_web_scraper.parsers.common import get_all_tables, get_all_tables_with_soup, get_tables
+
+fixtures = sorted(glob.glob(os.path.join(os.path.dirname(__file__), '*.html')))
+
+
+def cells(all_tables):
+    return {
+        name: [[(cell.text, cell.get('data-append-csv')) for cell in row] for row in rows]
+        for name, rows in all_tables.items()
+    }
+
+
+class TestGetAllTables(TestCase):
+    def test_same_tables_as_soup_for_every_fixture(self):
+        compared = 0
+        for fixture in fixtures:
+            with open(fixture, 'rb') as page_file:
+                page = page_file.read()
+            try:
+                expected = cells(get_all_tables_with_soup(page))
+            except KeyError:
+                ## header cells without a class trip up the soup version
+                continue
+            with self.subTest(fixture=os.path.basename(fixture)):
+                self.assertEqual(cells(get_all_tables(page)), expected)
+            compared += 1
+        self.assertGreater(compared, 10)
+
+    def test_commented_tables_are_found(self):
+        page = b'''<html><body>
+            <table class="stats_table sortable"><caption>Shown Table</caption>
+                <tr><th class="over_header">skipped</th><td>x</td></tr>
+                <tr><th class="left">1</th><td data-append-csv="someone01">Some One*</td><td>12</td></tr>
+                <tr><th class="left">2</th><td>Team Totals</td><td>99</td></tr>
+            </table>
+            <div><!--
+            <table class="stats_table sortable"><caption> Hidden Table </caption>
+                <tr><th class="left">1</th><td>BOS</td><td><a href="/x">3</a></td></tr>
+            </table>
+            --></div>
+            <!-- no tables in here -->
+            <table class="suppress_all"><caption>Other Table</caption></table>
+        </body></html>'''
+
+        self.assertEqual(cells(get_all_tables(page)), {
+            'SHOWN TABLE': [[('Some One*', 'someone01'), ('12', None)]],
+            'HIDDEN TABLE': [[('BOS', None), ('3', None)]],
+        })
+        self.assertEqual(cells(get_all_tables(page)), cells(get_all_tables_with_soup(page)))
+
+
+class TestGetTables(TestCase):
+    page = b'''<html><body>
+        <table class="stats_table sortable"><caption>Totals Table</caption>
+            <tr><th class="left">1</th><td>shown</td></tr>
+        </table>
+        <!--<table class="stats_table sortable"><caption>Totals Table</caption>
+            <tr><th class="left">1</th><td>hidden</td></tr>
+        </table>-->
+        <!--<table class="stats_table sortable"><caption>Advanced Table</caption>
+            <tr><th class="left">1</th><td>advanced</td></tr>
+        </table>-->
+        <!--<table class="stats_table sortable"><caption>Per Game &amp; Totals Table</caption>
+            <tr><th class="left">1</th><td>escaped</td></tr>
+        </table>-->
+    </body></html>'''
+
+    def test_same_rows_as_get_all_tables_for_every_fixture(self):
+        for fixture in fixtures:
+            with open(fixture, 'rb') as page_file:
+                page = page_file.read()
+            all_tables = get_all_tables(page)
+            with self.subTest(fixture=os.path.basename(fixture)):
+                self.assertEqual(cells(get_tables(page, [name.title() for name in all_tables])), cells(all_tables))
+
+    def test_only_wanted_tables_are_returned(self):
+        self.assertEqual(cells(get_tables(self.page, ['Advanced Table', 'Missing Table'])),
+            {'ADVANCED TABLE': [[('advanced', None)]]})
+        self.assertEqual(cells(get_tables(self.page, ['Per Game & Totals Table'])),
+            {'PER GAME & TOTALS TABLE': [[('escaped', None)]]})
+
+    def test_uncommented_table_wins(self):
+        self.assertEqual(cells(get_tables(self.page, ['Totals Table'])), {'TOTALS TABLE': [[('shown', None)]]})
+
+    def test_comments_without_the_caption_are_not_parsed(self):
+        with mock.patch.object(common.html, 'fromstring', wraps=common.html.fromstring) as fromstring:
+            get_tables(self.page, ['Totals Table'])
+        ## just the page itself
+        fromstring.assert_called_once()
+
+        with mock.patch.object(common.html, 'fromstring', wraps=common.html.fromstring) as fromstring:
+            get_tables(self.page, ['Advanced Table'])
+        self.assertEqual(fromstring.call_count, 2)
@@ -1,12 +1,15 @@
+import os
+import random
+import time
 from unittest import TestCase, mock
-from requests import codes
+from requests import codes, HTTPError
 
 from basketball_reference_web_scraper import http_client
-from basketball_reference_web_scraper.errors import InvalidDate
+from basketball_reference_web_scraper.errors import InvalidDate, IncompleteBoxScores
 
 
 class TestHttpClient(TestCase):
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_player_box_scores_raises_invalid_date_for_300_response(self, mocked_get):
         response = mock.Mock(status_code=codes.multiple_choices)
         mocked_get.return_value = response
@@ -14,4 +17,143 @@ class TestHttpClient(TestCase):
             InvalidDate,
             "Date with year set to 2018, month set to 1, and day set to 1 is invalid",
             http_client.player_box_scores,
-            day=1, month=1, year=2018)
\ No newline at end of file
+            day=1, month=1, year=2018)
+
+
+def fixture_content(file_name):
+    with open(os.path.join(os.path.dirname(__file__), file_name), 'rb') as fixture:
+        return fixture.read()
+
+
+class TestSeasonSchedule(TestCase):
+    def setUp(self):
+        self.october_2018 = fixture_content('NBA_2018_games-october.html')
+        self.other_months = [
+            fixture_content('NBA_2001_games-october.html'),
+            fixture_content('NBA_2007_games-november.html'),
+            fixture_content('NBA_2019_games-april.html'),
+        ]
+
+    def fake_fetch(self, url, session=None, **kwargs):
+        if url.endswith('NBA_2018_games.html'):
+            content = self.october_2018
+        else:
+            ## random delays so the months finish out of order
+            month_index = sum(ord(character) for character in url) % len(self.other_months)
+            time.sleep(random.random() / 50)
+            content = self.other_months[month_index]
+        return mock.Mock(content=content, status_code=codes.ok)
+
+    def test_concurrent_schedule_matches_sequential_order(self):
+        with mock.patch("basketball_reference_web_scraper.http_client.fetch", side_effect=self.fake_fetch):
+            sequential = http_client.season_schedule(2018)
+            concurrent = http_client.season_schedule(2018, max_workers=4)
+        self.assertGreater(len(sequential), 104)
+        self.assertEqual(sequential, concurrent)
+
+    def test_map_in_order_keeps_order(self):
+        def slow_square(value):
+            time.sleep((10 - value) / 1000)
+            return value * value
+        self.assertEqual(http_client.map_in_order(slow_square, range(10), max_workers=5),
+            [value * value for value in range(10)])
+
+    def test_map_as_completed_yields_every_item(self):
+        def slow_square(value):
+            time.sleep((10 - value) / 1000)
+            return value * value
+        results = list(http_client.map_as_completed(slow_square, range(10), max_workers=5))
+        self.assertEqual(sorted(results), [(value, value * value) for value in range(10)])
+
+    def test_map_as_completed_cancels_the_rest_when_stopped(self):
+        calls = []
+        def record(value):
+            calls.append(value)
+            time.sleep(0.01)
+            return value
+        results = http_client.map_as_completed(record, range(100), max_workers=2)
+        next(results)
+        results.close()
+        self.assertLess(len(calls), 100)
+
+
+@mock.patch("basketball_reference_web_scraper.http_client.fetch",
+    return_value=mock.Mock(content=fixture_content('01_01_2017_box_scores.html'), status_code=codes.ok))
+class TestTeamBoxScores(TestCase):
+    game_url_paths = [
+        '/boxscores/201701010ATL.html',
+        '/boxscores/201701010IND.html',
+        '/boxscores/201701010LAL.html',
+        '/boxscores/201701010MIA.html',
+        '/boxscores/201701010MIN.html',
+    ]
+
+    @staticmethod
+    def fake_team_box_score(game_url_path, session=None):
+        time.sleep(random.random() / 50)
+        if game_url_path.endswith('MIA.html'):
+            raise HTTPError(response=mock.Mock(status_code=codes.service_unavailable))
+        return [{'game': game_url_path, 'side': side} for side in ('away', 'home')]
+
+    def test_concurrent_box_scores_keep_game_order(self, mocked_fetch):
+        with mock.patch("basketball_reference_web_scraper.http_client.team_box_score",
+                side_effect=lambda game_url_path, session=None: [{'game': game_url_path}]):
+            box_scores = http_client.team_box_scores(day=1, month=1, year=2017, max_workers=3)
+        self.assertEqual([box_score['game'] for box_score in box_scores], self.game_url_paths)
+
+    def test_concurrent_failures_keep_successful_games(self, mocked_fetch):
+        with mock.patch("basketball_reference_web_scraper.http_client.team_box_score",
+                side_effect=self.fake_team_box_score):
+            with self.assertRaises(IncompleteBoxScores) as context:
+                http_client.team_box_scores(day=1, month=1, year=2017, max_workers=3)
+
+        error = context.exception
+        self.assertEqual(list(error.failures.keys()), ['/boxscores/201701010MIA.html'])
+        self.assertIsInstance(error.failures['/boxscores/201701010MIA.html'], HTTPError)
+        self.assertEqual(len(error.box_scores), 8)
+        self.assertEqual(
+            [box_score['game'] for box_score in error.box_scores[::2]],
+            [path for path in self.game_url_paths if not path.endswith('MIA.html')])
+
+    def test_sequential_failure_is_raised(self, mocked_fetch):
+        with mock.patch("basketball_reference_web_scraper.http_client.team_box_score",
+                side_effect=self.fake_team_box_score):
+            self.assertRaises(HTTPError, http_client.team_box_scores, day=1, month=1, year=2017)
+
+
+class TestSession(TestCase):
+    def tearDown(self):
+        http_client.set_session(None)
+
+    def test_create_session_mounts_pooled_adapter(self):
+        session = http_client.create_session(pool_connections=3, pool_maxsize=7, timeout=5)
+        adapter = session.get_adapter(http_client.BASE_URL)
+        self.assertIsInstance(adapter, http_client.TimeoutHTTPAdapter)
+        self.assertEqual(adapter.timeout, 5)
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 7)
+
+    def test_shared_session_is_reused(self):
+        self.assertIs(http_client.get_session(), http_client.get_session())
+
+    def test_set_session_replaces_shared_session(self):
+        session = mock.Mock()
+        http_client.set_session(session)
+        http_client.fetch(url=http_client.BASE_URL)
+        session.get.assert_called_once_with(
+            url=http_client.BASE_URL, headers={'User-Agent': http_client.USER_AGENT})
+
+    def test_injected_session_is_used(self):
+        session = mock.Mock()
+        session.get.return_value = mock.Mock(status_code=codes.multiple_choices)
+        self.assertRaises(InvalidDate, http_client.player_box_scores,
+            day=1, month=1, year=2018, session=session)
+        session.get.assert_called_once()
+
+    def test_adapter_fills_in_default_timeout(self):
+        adapter = http_client.TimeoutHTTPAdapter(timeout=12)
+        with mock.patch("requests.adapters.HTTPAdapter.send") as mocked_send:
+            adapter.send(mock.Mock(), timeout=None)
+            adapter.send(mock.Mock(), timeout=3)
+        self.assertEqual(mocked_send.call_args_list[0][1]['timeout'], 12)
+        self.assertEqual(mocked_send.call_args_list[1][1]['timeout'], 3)
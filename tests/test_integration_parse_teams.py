@@ -3,10 +3,23 @@ import os
 
 from basketball_reference_web_scraper.parsers.box_scores.teams import parse_team_totals
 from basketball_reference_web_scraper.data import Team
+from basketball_reference_web_scraper.errors import BoxScoreParseError
 
 atlanta_box_score_2017_01_01_html = os.path.join(os.path.dirname(__file__), './201701010ATL.html')
 
 
+
+def box_score_page(points_by_table_id):
+    ## a page laid out like the newer box scores, with a table per quarter and half as well
+    tables = "".join(
+        '<table class="sortable stats_table" id="{table_id}"><tfoot><tr><th>Team Totals</th>{cells}'
+        '<td>{points}</td><td>0</td></tr></tfoot></table>'.format(table_id=table_id, points=points,
+            cells="<td>0</td>" * 18)
+        for table_id, points in points_by_table_id)
+    return ('<html><body><div class="scorebox"><div><strong><a itemprop="name">San Antonio Spurs</a></strong></div>'
+        '<div><strong><a itemprop="name">Atlanta Hawks</a></strong></div></div>' + tables + '</body></html>')
+
+
 class TestParseTeams(TestCase):
     def setUp(self):
         self.atlanta_box_score_2017_01_01 = open(atlanta_box_score_2017_01_01_html).read()
@@ -52,3 +65,14 @@ class TestParseTeams(TestCase):
         self.assertEqual(atl_team_totals["blocks"], 6)
         self.assertEqual(atl_team_totals["turnovers"], 11)
         self.assertEqual(atl_team_totals["personal_fouls"], 21)
+
+    def test_quarter_and_half_tables_are_left_out(self):
+        page = box_score_page([('box-SAS-q1-basic', 30), ('box-SAS-h1-basic', 55), ('box-SAS-game-basic', 112),
+            ('box-ATL-q1-basic', 20), ('box-ATL-h1-basic', 50), ('box-ATL-game-basic', 108)])
+        team_totals = parse_team_totals(page)
+        self.assertEqual([(team_total["team"], team_total["points"]) for team_total in team_totals],
+            [(Team.SAS, 112), (Team.ATL, 108)])
+
+    def test_missing_table_raises(self):
+        page = box_score_page([('box-SAS-q1-basic', 30), ('box-SAS-game-basic', 112), ('box-ATL-q1-basic', 20)])
+        self.assertRaises(BoxScoreParseError, parse_team_totals, page)
@@ -0,0 +1,137 @@
+import json
+import os
+import tempfile
+from array import array
+from datetime import datetime
+from unittest import TestCase
+
+import pytz
+
+from basketball_reference_web_scraper import output
+from basketball_reference_web_scraper.data import OutputType, OutputWriteOption, Team, Location
+from basketball_reference_web_scraper.json_encoders import BasketballReferenceJSONEncoder
+
+
+class TestJSONOutput(TestCase):
+    values = [
+        {"team": Team.BOS, "location": Location.HOME, "points": 112,
+         "start_time": datetime(2018, 10, 17, 0, 0, tzinfo=pytz.utc)},
+    ]
+
+    def output_json(self, **kwargs):
+        return output.output(self.values, output_type=OutputType.JSON, encoder=BasketballReferenceJSONEncoder,
+            csv_writer=None, **kwargs)
+
+    def test_in_memory_json_is_returned(self):
+        serialized = self.output_json(output_file_path=None)
+        self.assertEqual(json.loads(serialized), [
+            {"team": "BOSTON CELTICS", "location": "HOME", "points": 112, "start_time": "2018-10-17T00:00:00+00:00"},
+        ])
+        self.assertIn('\n    ', serialized)
+
+    def test_compact_json(self):
+        serialized = self.output_json(output_file_path=None, json_options=output.compact_json_options)
+        self.assertEqual(serialized,
+            '[{"team":"BOSTON CELTICS","location":"HOME","points":112,"start_time":"2018-10-17T00:00:00+00:00"}]')
+
+    def test_json_file_returns_values(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_file_path = os.path.join(directory, 'values.json')
+            self.assertIs(self.output_json(output_file_path=output_file_path), self.values)
+            with open(output_file_path) as json_file:
+                self.assertEqual(json.load(json_file), json.loads(self.output_json(output_file_path=None)))
+
+
+class TestJSONLinesOutput(TestCase):
+    def rows(self):
+        for points in range(3):
+            yield {"team": Team.BOS, "points": points}
+
+    def test_in_memory_json_lines(self):
+        serialized = output.output(self.rows(), output_type=OutputType.JSON_LINES, output_file_path=None,
+            encoder=BasketballReferenceJSONEncoder, csv_writer=None)
+        self.assertEqual(serialized.splitlines(), [
+            '{"team":"BOSTON CELTICS","points":0}',
+            '{"team":"BOSTON CELTICS","points":1}',
+            '{"team":"BOSTON CELTICS","points":2}',
+        ])
+
+    def test_rows_stay_on_one_line_whatever_the_json_options(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_file_path = os.path.join(directory, 'rows.jsonl')
+            output.output(self.rows(), output_type="json_lines", output_file_path=output_file_path,
+                encoder=BasketballReferenceJSONEncoder, csv_writer=None, json_options={"indent": 4})
+            with open(output_file_path) as json_lines_file:
+                self.assertEqual([json.loads(line)["points"] for line in json_lines_file], [0, 1, 2])
+
+
+class TestColumnarOutput(TestCase):
+    columns = {"team": [Team.BOS, Team.BOS], "points": array('q', [112, 98])}
+
+    def test_columns_are_written_as_rows(self):
+        serialized = output.output(self.columns, output_type=OutputType.JSON_LINES, output_file_path=None,
+            encoder=BasketballReferenceJSONEncoder, csv_writer=None)
+        self.assertEqual(serialized.splitlines(), [
+            '{"team":"BOSTON CELTICS","points":112}',
+            '{"team":"BOSTON CELTICS","points":98}',
+        ])
+
+    def test_in_memory_json_of_columns(self):
+        serialized = output.output(self.columns, output_type=OutputType.JSON, output_file_path=None,
+            encoder=BasketballReferenceJSONEncoder, csv_writer=None, json_options=output.compact_json_options)
+        self.assertEqual(json.loads(serialized), [
+            {"team": "BOSTON CELTICS", "points": 112}, {"team": "BOSTON CELTICS", "points": 98},
+        ])
+
+    def test_columns_are_returned_after_writing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_file_path = os.path.join(directory, 'rows.jsonl')
+            self.assertIs(output.output(self.columns, output_type=OutputType.JSON_LINES,
+                output_file_path=output_file_path, encoder=BasketballReferenceJSONEncoder, csv_writer=None),
+                self.columns)
+
+
+class TestCSVWriters(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output_file_path = os.path.join(self.directory.name, 'rows.csv')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_lines(self):
+        with open(self.output_file_path) as csv_file:
+            return csv_file.read().splitlines()
+
+    def test_rows_are_flushed_as_they_are_written(self):
+        lines_written = []
+
+        def rows():
+            for points in range(5):
+                lines_written.append(len(self.read_lines()))
+                yield {"points": points}
+
+        output.write_csv_rows(rows(), self.output_file_path, OutputWriteOption.WRITE, ["points"], flush_interval=2)
+
+        ## the header and every 2 rows are on disk before the next rows are made
+        self.assertEqual(lines_written, [0, 0, 3, 3, 5])
+        self.assertEqual(self.read_lines(), ["points", "0", "1", "2", "3", "4"])
+
+    def test_csv_writer_from_keys_takes_a_generator(self):
+        output.csv_writer_from_keys(({"a": ii, "b": -ii} for ii in range(3)), self.output_file_path,
+            OutputWriteOption.WRITE, table=None)
+        self.assertEqual(self.read_lines(), ["a,b", "0,0", "1,-1", "2,-2"])
+
+    def test_playoff_stats_writer_takes_a_generator(self):
+        from basketball_reference_web_scraper.parsers.common import COLUMN_RENAMER
+        from basketball_reference_web_scraper.parsers.playoff_series_stats import _old_playoff_basic_header_columns
+
+        ## an old series, without games started
+        row = dict([(COLUMN_RENAMER[k], 1) for k in _old_playoff_basic_header_columns if k not in ['empty', 'Player']])
+        row.update(player_id='oneso01', player_name='Some One', team='BOSTON CELTICS')
+        output.playoff_stats_writer((dict(row) for _ in range(2)), self.output_file_path,
+            OutputWriteOption.WRITE, table='basic')
+
+        lines = self.read_lines()
+        self.assertEqual(len(lines), 3)
+        self.assertNotIn('games_started', lines[0])
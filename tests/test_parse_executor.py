@@ -0,0 +1,82 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase, IsolatedAsyncioTestCase, mock
+
+from requests import codes
+
+from basketball_reference_web_scraper import http_client, async_http_client, parsers
+from basketball_reference_web_scraper.data import Team, Location, Outcome, Position
+
+
+def fixture_content(file_name):
+    with open(os.path.join(os.path.dirname(__file__), file_name), 'rb') as fixture:
+        return fixture.read()
+
+
+class TestEnumsSurvivePickling(TestCase):
+    def test_round_trip_gives_back_the_same_members(self):
+        for enum in [Team, Location, Outcome, Position]:
+            for member in enum:
+                self.assertIs(pickle.loads(pickle.dumps(member)), member)
+
+    def test_members_are_pickled_by_name(self):
+        self.assertEqual(Team.BOS.__reduce_ex__(pickle.HIGHEST_PROTOCOL), (getattr, (Team, 'BOS')))
+        self.assertNotIn(Team.BOS.value.encode(), pickle.dumps(Team.BOS))
+
+
+class TestParseExecutor(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def setUp(self):
+        http_client.set_parse_executor(self.executor)
+
+    def tearDown(self):
+        http_client.set_parse_executor(None)
+
+    def test_run_parser_without_executor_calls_parser_directly(self):
+        http_client.set_parse_executor(None)
+        parser = mock.Mock(return_value=[])
+        self.assertEqual(http_client.run_parser(parser, b'page', skip_totals=True), [])
+        parser.assert_called_once_with(b'page', skip_totals=True)
+
+    def test_season_totals_parsed_in_another_process(self):
+        page = fixture_content('NBA_2018_totals.html')
+        self.assertEqual(http_client.run_parser(parsers.parse_players_season_totals, page, skip_totals=True),
+            parsers.parse_players_season_totals(page, skip_totals=True))
+
+    def test_box_scores_keep_their_enums(self):
+        page = fixture_content('12_18_2015_daily_leaders.html')
+        box_scores = http_client.run_parser(parsers.parse_player_box_scores, page)
+
+        self.assertEqual(box_scores, parsers.parse_player_box_scores(page))
+        self.assertIs(box_scores[0]['team'], Team.DET)
+        self.assertIsInstance(box_scores[0]['location'], Location)
+        self.assertIsInstance(box_scores[0]['outcome'], Outcome)
+
+    @mock.patch("requests.Session.get")
+    def test_fetching_functions_use_the_executor(self, mocked_get):
+        page = fixture_content('NBA_2018_totals.html')
+        mocked_get.return_value = mock.Mock(status_code=codes.ok, content=page)
+        with mock.patch.object(self.executor, 'submit', wraps=self.executor.submit) as submit:
+            totals = http_client.players_season_totals(2018)
+        submit.assert_called_once()
+        self.assertEqual(totals, parsers.parse_players_season_totals(page))
+
+
+class TestAsyncParseExecutor(IsolatedAsyncioTestCase):
+    async def test_parsed_in_another_process(self):
+        page = fixture_content('NBA_2018_totals.html')
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            http_client.set_parse_executor(executor)
+            try:
+                totals = await async_http_client.run_parser(parsers.parse_players_season_totals, page)
+            finally:
+                http_client.set_parse_executor(None)
+        self.assertEqual(totals, parsers.parse_players_season_totals(page))
@@ -50,3 +50,27 @@ class TestSchedule(TestCase):
             .astimezone(pytz.utc)
 
         self.assertTrue(abs(parsed_start_time - expected_datetime) < timedelta(seconds=1))
+
+    def test_correctly_parses_date_without_time_of_day(self):
+        parsed_start_time = schedule.parse_start_time(
+            formatted_date="Tue, Oct 17, 2017",
+            formatted_time_of_day=""
+        )
+        expected_datetime = pytz.timezone("US/Eastern") \
+            .localize(datetime(year=2017, month=10, day=17)) \
+            .astimezone(pytz.utc)
+
+        self.assertEqual(parsed_start_time, expected_datetime)
+
+    def test_repeated_start_times_are_parsed_once(self):
+        schedule._parse_start_time.cache_clear()
+        first = schedule.parse_start_time(formatted_date="Wed, Oct 18, 2017", formatted_time_of_day="7:00p")
+        second = schedule.parse_start_time(formatted_date="Wed, Oct 18, 2017", formatted_time_of_day="7:00p",
+            time_format=schedule.CURRENT_TIME_OF_DAY_FORMAT)
+
+        self.assertIs(first, second)
+        self.assertEqual(schedule._parse_start_time.cache_info().misses, 1)
+
+    def test_time_of_day_format(self):
+        self.assertEqual(schedule.time_of_day_format("8:01p"), schedule.CURRENT_TIME_OF_DAY_FORMAT)
+        self.assertEqual(schedule.time_of_day_format("7:30 pm"), schedule.PRIOR_TIME_OF_DAY_FORMAT)
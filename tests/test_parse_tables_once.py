@@ -0,0 +1,80 @@
+from unittest import TestCase, mock
+
+from basketball_reference_web_scraper import parsers
+from basketball_reference_web_scraper.data import Team
+from basketball_reference_web_scraper.parsers import player_career, playoff_series_stats
+
+
+def cell(column, row_number):
+    if column == 'Player':
+        return f'<td data-append-csv="player{row_number}">Player {row_number}*</td>'
+    values = {'Tm': 'BOS', 'Lg': 'NBA', 'Pos': 'PG-SG', 'empty': ''}
+    if column in values:
+        value = values[column]
+    elif '%' in column:
+        value = '.{0}'.format(row_number)
+    else:
+        value = str(10 + row_number)
+    return f'<td>{value}</td>'
+
+
+def table(caption, header_columns, rows=3, team_totals_row=False):
+    body = ''.join(
+        '<tr><th class="left">{0}</th>{1}</tr>'.format(row_number,
+            ''.join(cell(column, row_number) for column in header_columns))
+        for row_number in range(rows))
+    if team_totals_row:
+        body += '<tr><th class="left">Career</th>{0}</tr>'.format(
+            ''.join('<td>TOT</td>' if column == 'Tm' else cell(column, 0) for column in header_columns))
+    return f'<table class="stats_table sortable"><caption>{caption}</caption><tbody>{body}</tbody></table>'
+
+
+class TestPlayersCareerTables(TestCase):
+    ## like the real pages, every table but the first is commented out
+    page = '<html><body>{0}<div><!--{1}--></div><div><!--{2}--></div></body></html>'.format(
+        table('Totals Table', player_career.career_table_headers['totals'], team_totals_row=True),
+        table('Advanced Table', player_career.career_table_headers['advanced']),
+        table('Playoffs Totals Table', player_career.career_table_headers['totals'], rows=2),
+    ).encode()
+
+    def test_tables_match_parsing_one_at_a_time(self):
+        tables = ['totals', 'advanced', 'playoffs_totals']
+        self.assertEqual(parsers.parse_players_career_tables(self.page, tables),
+            [parsers.parse_a_players_career_table(self.page, table) for table in tables])
+
+    def test_page_is_read_once(self):
+        with mock.patch.object(player_career, 'get_tables',
+            wraps=player_career.get_tables) as get_tables:
+            totals, advanced = parsers.parse_players_career_tables(self.page, ['totals', 'advanced'])
+        get_tables.assert_called_once()
+        ## the TOT row is skipped
+        self.assertEqual(len(totals), 3)
+        self.assertEqual(totals[1]['team'], 'BOSTON CELTICS')
+        self.assertEqual(len(advanced), 3)
+
+
+class TestPlayoffSeriesStatsTables(TestCase):
+    series = {
+        'winning_team': Team.BOS,
+        'losing_team': Team.MIA,
+        'winning_team_games_won': 4,
+        'losing_team_games_won': 2,
+    }
+    page = '<html><body>{0}{1}<!--{2}{3}--></body></html>'.format(
+        table('Boston Celtics Basic Stats Table', playoff_series_stats._playoff_basic_header_columns),
+        table('Miami Heat Basic Stats Table', playoff_series_stats._playoff_basic_header_columns, rows=2),
+        table('Boston Celtics Advanced Stats Table', playoff_series_stats._playoff_advanced_header_columns),
+        table('Miami Heat Advanced Stats Table', playoff_series_stats._playoff_advanced_header_columns, rows=2),
+    ).encode()
+
+    def test_tables_match_parsing_one_at_a_time(self):
+        with mock.patch.object(playoff_series_stats, 'get_tables',
+            wraps=playoff_series_stats.get_tables) as get_tables:
+            basic, advanced = parsers.parse_playoff_series_stats_tables(self.page, self.series, ['basic', 'advanced'])
+        get_tables.assert_called_once()
+
+        self.assertEqual(basic, parsers.parse_playoff_series_stats(self.page, self.series, 'basic'))
+        self.assertEqual(advanced, parsers.parse_playoff_series_stats(self.page, self.series, 'advanced'))
+        self.assertEqual([row['team'] for row in basic], ['BOSTON CELTICS'] * 3 + ['MIAMI HEAT'] * 2)
+        self.assertEqual(basic[0]['player_id'], 'player0')
+        self.assertEqual(basic[0]['player_name'], 'Player 0')
@@ -0,0 +1,43 @@
+import random
+import time
+from unittest import TestCase, mock
+
+from requests import HTTPError, codes
+
+from basketball_reference_web_scraper import client
+from basketball_reference_web_scraper.errors import InvalidSeason
+
+
+def fake_table(table):
+    def fetch_table(season_end_year, skip_totals=False, playoffs=False, session=None):
+        ## random delays so the pages finish out of order
+        time.sleep(random.random() / 100)
+        if season_end_year > 2019:
+            raise HTTPError(response=mock.Mock(status_code=codes.not_found))
+        return [{'table': table, 'season': season_end_year, 'playoffs': playoffs}]
+    return fetch_table
+
+
+@mock.patch.dict(client.SEASON_TABLES, {table: fake_table(table) for table in client.SEASON_TABLES})
+class TestPlayersSeasonTables(TestCase):
+    def test_every_season_and_table_is_yielded_once(self):
+        results = list(client.players_season_tables(range(1980, 1990), tables=['totals', 'advanced'],
+            playoffs=True, max_workers=4))
+
+        self.assertEqual(sorted((season, table) for (season, table, _) in results),
+            sorted((season, table) for season in range(1980, 1990) for table in ['totals', 'advanced']))
+        for season, table, values in results:
+            self.assertEqual(values, [{'table': table, 'season': season, 'playoffs': True}])
+
+    def test_per100_is_skipped_before_1974(self):
+        results = list(client.players_season_tables([1972, 1973, 1974], tables=['totals', 'per100']))
+        self.assertEqual(sorted((season, table) for (season, table, _) in results),
+            [(1972, 'totals'), (1973, 'totals'), (1974, 'per100'), (1974, 'totals')])
+
+    def test_missing_season_raises_invalid_season(self):
+        with self.assertRaises(InvalidSeason):
+            list(client.players_season_tables([2018, 2019, 2020], max_workers=2))
+
+    def test_unknown_table_raises(self):
+        self.assertRaises(ValueError, list, client.players_season_tables([2018], tables=['shooting']))
+
@@ -0,0 +1,195 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from unittest import TestCase, IsolatedAsyncioTestCase, mock
+
+from requests import codes
+
+from basketball_reference_web_scraper import http_client
+from basketball_reference_web_scraper.rate_limiting import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class SteppedClock:
+    """
+    a fake clock for several threads at once:  sleeping threads block until `advance`
+    moves the time past when they're due
+    """
+    def __init__(self):
+        self.now = 0.0
+        self.sleepers = []
+        self.finished = 0
+        self.condition = threading.Condition()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.condition:
+            wake_at = self.now + seconds
+            self.sleepers.append(wake_at)
+            self.condition.notify_all()
+            while self.now < wake_at:
+                self.condition.wait()
+            self.sleepers.remove(wake_at)
+            self.condition.notify_all()
+
+    def finish(self):
+        with self.condition:
+            self.finished += 1
+            self.condition.notify_all()
+
+    def wait_until_settled(self, threads):
+        ## every thread is either done or asleep until later than now
+        with self.condition:
+            self.condition.wait_for(lambda: self.finished + len(self.sleepers) == threads
+                and all(wake_at > self.now for wake_at in self.sleepers), timeout=5)
+
+    def advance(self):
+        with self.condition:
+            self.now = min(self.sleepers)
+            self.condition.notify_all()
+
+
+class TestParseRetryAfter(TestCase):
+    def test_seconds(self):
+        self.assertEqual(parse_retry_after('120'), 120)
+
+    def test_http_date(self):
+        now = datetime(2019, 5, 1, 0, 0, 0, tzinfo=timezone.utc)
+        self.assertEqual(parse_retry_after('Wed, 01 May 2019 00:00:30 GMT', now=now), 30)
+        self.assertEqual(parse_retry_after('Tue, 30 Apr 2019 00:00:00 GMT', now=now), 0)
+
+    def test_unparseable(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('soon'))
+
+
+class TestRateLimiter(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.rate_limiter = RateLimiter(rate=2, burst=2, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_burst_then_steady_rate(self):
+        for _ in range(5):
+            self.rate_limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [0.5, 0.5, 0.5])
+
+    def test_tokens_refill_while_idle(self):
+        self.rate_limiter.acquire()
+        self.rate_limiter.acquire()
+        self.clock.now += 10
+        self.rate_limiter.acquire()
+        self.rate_limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_pause_holds_back_requests_without_a_burst_after(self):
+        self.rate_limiter.pause(30)
+        self.rate_limiter.acquire()
+        self.assertEqual(self.clock.now, 30)
+        self.rate_limiter.acquire()
+        self.assertEqual(self.clock.now, 30.5)
+
+    def test_requests_queued_before_a_pause_are_spaced_out_after_it(self):
+        clock = SteppedClock()
+        rate_limiter = RateLimiter(rate=2, burst=1, clock=clock, sleep=clock.sleep)
+        release_times = []
+
+        def request():
+            rate_limiter.acquire()
+            release_times.append(clock())
+            clock.finish()
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        clock.wait_until_settled(len(threads))
+        ## one request went straight away; the other four hold reservations at 0.5s, 1s, 1.5s and 2s
+        rate_limiter.pause(1.0)
+
+        while clock.finished < len(threads):
+            clock.advance()
+            clock.wait_until_settled(len(threads))
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(release_times), [0.0, 1.0, 1.5, 2.0, 2.5])
+
+    def test_retry_after(self):
+        self.assertIsNone(self.rate_limiter.retry_after(codes.ok, {}))
+        self.assertEqual(self.rate_limiter.retry_after(codes.too_many_requests, {'Retry-After': '5'}), 5)
+        self.assertEqual(self.rate_limiter.retry_after(codes.too_many_requests, {}), self.rate_limiter.default_pause)
+        self.assertEqual(self.rate_limiter.retry_after(codes.service_unavailable, {'Retry-After': '5'}), 5)
+        self.assertIsNone(self.rate_limiter.retry_after(codes.service_unavailable, {}))
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, RateLimiter, rate=0)
+        self.assertRaises(ValueError, RateLimiter, rate=1, burst=0)
+
+    def test_shared_between_threads(self):
+        rate_limiter = RateLimiter(rate=100, burst=1)
+        start = time.monotonic()
+        threads = [threading.Thread(target=lambda: [rate_limiter.acquire() for _ in range(5)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        ## 20 requests, the first one free
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+
+
+class TestRateLimiterAsync(IsolatedAsyncioTestCase):
+    async def test_shared_between_tasks(self):
+        rate_limiter = RateLimiter(rate=100, burst=1)
+        start = time.monotonic()
+        await asyncio.gather(*[rate_limiter.acquire_async() for _ in range(20)])
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+
+
+class TestFetchWithRateLimiter(TestCase):
+    url = http_client.BASE_URL + '/leagues/NBA_2019_totals.html'
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.rate_limiter = RateLimiter(rate=1, burst=1, max_deferrals=2, clock=self.clock, sleep=self.clock.sleep)
+        http_client.set_rate_limiter(self.rate_limiter)
+        self.session = mock.Mock()
+
+    def tearDown(self):
+        http_client.set_rate_limiter(None)
+
+    def test_too_many_requests_is_sent_again_after_retry_after(self):
+        self.session.get.side_effect = [
+            mock.Mock(status_code=codes.too_many_requests, headers={'Retry-After': '30'}),
+            mock.Mock(status_code=codes.ok, headers={}, content=b'page'),
+        ]
+        response = http_client.fetch(self.url, session=self.session)
+
+        self.assertEqual(response.content, b'page')
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertEqual(self.clock.now, 30)
+
+    def test_gives_up_after_max_deferrals(self):
+        self.session.get.return_value = mock.Mock(status_code=codes.too_many_requests, headers={'Retry-After': '1'})
+        response = http_client.fetch(self.url, session=self.session)
+
+        self.assertEqual(response.status_code, codes.too_many_requests)
+        self.assertEqual(self.session.get.call_count, 3)
+
+    def test_not_found_is_not_sent_again(self):
+        self.session.get.return_value = mock.Mock(status_code=codes.not_found, headers={})
+        http_client.fetch(self.url, session=self.session)
+        self.session.get.assert_called_once()
@@ -0,0 +1,80 @@
+import json
+import os
+import pickle
+import tempfile
+from unittest import TestCase
+
+from basketball_reference_web_scraper import output
+from basketball_reference_web_scraper.data import OutputType
+from basketball_reference_web_scraper.json_encoders import BasketballReferenceJSONEncoder
+from basketball_reference_web_scraper.parsers.box_scores.players import parse_player_box_scores
+from basketball_reference_web_scraper.parsers.schedule import parse_schedule
+from basketball_reference_web_scraper.records import Game, PlayerBoxScore
+
+
+def fixture_content(name):
+    with open(os.path.join(os.path.dirname(__file__), name), 'rb') as fixture:
+        return fixture.read()
+
+
+class TestRecords(TestCase):
+    def setUp(self):
+        self.box_scores_page = fixture_content('12_18_2015_daily_leaders.html')
+        self.schedule_page = fixture_content('NBA_2018_games-october.html')
+
+    def test_records_equal_the_dicts(self):
+        box_scores = parse_player_box_scores(self.box_scores_page, records=True)
+        self.assertIsInstance(box_scores[0], PlayerBoxScore)
+        self.assertEqual(box_scores, parse_player_box_scores(self.box_scores_page))
+
+        games = parse_schedule(self.schedule_page, records=True)
+        self.assertIsInstance(games[0], Game)
+        self.assertEqual(games, parse_schedule(self.schedule_page))
+
+    def test_mapping_and_attribute_access(self):
+        game = parse_schedule(self.schedule_page, records=True)[0]
+        self.assertEqual(game['home_team'], game.home_team)
+        self.assertEqual(list(game.keys()), output.game_fieldname)
+        self.assertEqual(len(game), len(Game.fields))
+        self.assertIsNone(game.get('season'))
+        self.assertRaises(KeyError, lambda: game['keys'])
+
+    def test_records_are_immutable(self):
+        game = parse_schedule(self.schedule_page, records=True)[0]
+        with self.assertRaises(AttributeError):
+            game.home_team_score = 0
+        with self.assertRaises(AttributeError):
+            game.season = 2018
+        self.assertFalse(hasattr(game, '__dict__'))
+
+    def test_missing_or_extra_fields(self):
+        game = dict(parse_schedule(self.schedule_page)[0])
+        self.assertRaises(TypeError, Game, **dict(game, season=2018))
+        del game['start_time']
+        self.assertRaises(TypeError, Game, **game)
+
+    def test_pickle(self):
+        box_score = parse_player_box_scores(self.box_scores_page, records=True)[0]
+        self.assertEqual(pickle.loads(pickle.dumps(box_score)), box_score)
+
+    def test_json_is_the_same_as_for_dicts(self):
+        games = parse_schedule(self.schedule_page)
+        self.assertEqual(
+            output.output(parse_schedule(self.schedule_page, records=True), output_type=OutputType.JSON,
+                output_file_path=None, encoder=BasketballReferenceJSONEncoder, csv_writer=None),
+            output.output(games, output_type=OutputType.JSON,
+                output_file_path=None, encoder=BasketballReferenceJSONEncoder, csv_writer=None))
+        self.assertEqual(json.loads(json.dumps(games[0], cls=BasketballReferenceJSONEncoder))['home_team'],
+            games[0]['home_team'].value)
+
+    def test_csv_is_the_same_as_for_dicts(self):
+        with tempfile.TemporaryDirectory() as directory:
+            written = []
+            for records in (False, True):
+                output_file_path = os.path.join(directory, 'box_scores_{records}.csv'.format(records=records))
+                output.output(parse_player_box_scores(self.box_scores_page, records=records),
+                    output_type=OutputType.CSV, output_file_path=output_file_path,
+                    encoder=BasketballReferenceJSONEncoder, csv_writer=output.box_scores_to_csv)
+                with open(output_file_path) as csv_file:
+                    written.append(csv_file.read())
+        self.assertEqual(written[0], written[1])
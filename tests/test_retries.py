@@ -0,0 +1,90 @@
+from unittest import TestCase, mock
+
+import requests
+from requests import codes
+
+from basketball_reference_web_scraper import client, http_client
+from basketball_reference_web_scraper.errors import InvalidSeason
+from basketball_reference_web_scraper.retries import RetryPolicy
+
+
+class TestRetryPolicy(TestCase):
+    def test_exponential_backoff_is_capped(self):
+        retry_policy = RetryPolicy(backoff_base=1, backoff_cap=5, jitter=False)
+        self.assertEqual([retry_policy.backoff(attempt) for attempt in range(1, 6)], [1, 2, 4, 5, 5])
+
+    def test_full_jitter(self):
+        retry_policy = RetryPolicy(backoff_base=2, jitter=True, random=lambda: 0.25)
+        self.assertEqual(retry_policy.backoff(3), 2)
+
+    def test_retry_after_longer_than_backoff_is_honoured(self):
+        retry_policy = RetryPolicy(backoff_base=1, jitter=False)
+        self.assertEqual(retry_policy.backoff(1, headers={'Retry-After': '30'}), 30)
+        self.assertEqual(retry_policy.backoff(3, headers={'Retry-After': '0'}), 4)
+
+    def test_should_retry(self):
+        retry_policy = RetryPolicy(max_attempts=3, retry_statuses=(404, 503))
+        self.assertTrue(retry_policy.should_retry(1, status_code=codes.service_unavailable))
+        self.assertFalse(retry_policy.should_retry(3, status_code=codes.service_unavailable))
+        self.assertFalse(retry_policy.should_retry(1, status_code=codes.not_found))
+        self.assertFalse(retry_policy.should_retry(1, status_code=codes.ok))
+        self.assertTrue(retry_policy.should_retry(1, exception=requests.ConnectionError()))
+        self.assertFalse(retry_policy.should_retry(1, exception=ValueError()))
+
+
+class TestFetchWithRetryPolicy(TestCase):
+    url = http_client.BASE_URL + '/leagues/NBA_2019_totals.html'
+
+    def setUp(self):
+        self.sleeps = []
+        self.on_retry = mock.Mock()
+        self.retry_policy = RetryPolicy(max_attempts=3, backoff_base=1, jitter=False,
+            on_retry=self.on_retry, sleep=self.sleeps.append)
+        http_client.set_retry_policy(self.retry_policy)
+        self.session = mock.Mock()
+
+    def tearDown(self):
+        http_client.set_retry_policy(None)
+
+    def test_transient_status_is_retried_with_backoff(self):
+        self.session.get.side_effect = [
+            mock.Mock(status_code=codes.service_unavailable, headers={}),
+            mock.Mock(status_code=codes.bad_gateway, headers={}),
+            mock.Mock(status_code=codes.ok, headers={}, content=b'page'),
+        ]
+        response = http_client.fetch(self.url, session=self.session)
+
+        self.assertEqual(response.content, b'page')
+        self.assertEqual(self.sleeps, [1, 2])
+        self.assertEqual(self.retry_policy.retries, 2)
+        self.on_retry.assert_has_calls([
+            mock.call(self.url, 1, 1, codes.service_unavailable),
+            mock.call(self.url, 2, 2, codes.bad_gateway),
+        ])
+
+    def test_connection_error_is_retried(self):
+        error = requests.ConnectionError()
+        self.session.get.side_effect = [error, mock.Mock(status_code=codes.ok, headers={}, content=b'page')]
+        response = http_client.fetch(self.url, session=self.session)
+
+        self.assertEqual(response.content, b'page')
+        self.on_retry.assert_called_once_with(self.url, 1, 1, error)
+
+    def test_gives_up_after_max_attempts(self):
+        self.session.get.return_value = mock.Mock(status_code=codes.service_unavailable, headers={})
+        response = http_client.fetch(self.url, session=self.session)
+
+        self.assertEqual(response.status_code, codes.service_unavailable)
+        self.assertEqual(self.session.get.call_count, 3)
+
+        self.session.get.side_effect = requests.Timeout()
+        self.assertRaises(requests.Timeout, http_client.fetch, self.url, session=self.session)
+
+    @mock.patch("requests.Session.get")
+    def test_not_found_still_raises_invalid_season(self, mocked_get):
+        mocked_get.return_value = mock.Mock(status_code=codes.not_found, headers={})
+        mocked_get.return_value.raise_for_status.side_effect = requests.HTTPError(response=mocked_get.return_value)
+
+        self.assertRaises(InvalidSeason, client.players_season_totals, 1900)
+        mocked_get.assert_called_once()
+        self.assertEqual(self.retry_policy.retries, 0)
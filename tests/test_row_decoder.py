@@ -0,0 +1,97 @@
+import os
+from unittest import TestCase
+
+from basketball_reference_web_scraper.parsers import player_career, playoff_series_stats, players_advanced, \
+    players_season_totals, players_season_totals_per100
+from basketball_reference_web_scraper.parsers.box_scores import teams
+from basketball_reference_web_scraper.parsers.common import RowDecoder, TableCell, get_tables, \
+    parse_souped_row_given_header_columns, rows_from_columns
+
+
+def sample_row(header_columns):
+    values = {'Tm': 'BOS', 'Lg': 'NBA', 'Pos': 'C-PF', 'Season': '2018-19', 'MP_max': '41:30', 'empty': ''}
+    return [
+        TableCell('Some One*', {'data-append-csv': 'oneso01'}) if column == 'Player'
+        else TableCell(values.get(column, '12%' if column.endswith('%') and column[0].isupper() else '12'), {})
+        for column in header_columns
+    ]
+
+
+class TestRowDecoder(TestCase):
+    header_columns_by_table = dict(
+        [('totals', players_season_totals._totals_stats_by_year_header_columns),
+         ('advanced', players_advanced._advanced_stats_by_year_header_columns),
+         ('per100', players_season_totals_per100._totals_stats_per100_by_year_header_columns),
+         ('playoff basic', playoff_series_stats._playoff_basic_header_columns),
+         ('playoff advanced', playoff_series_stats._playoff_advanced_header_columns),
+         ('old playoff basic', playoff_series_stats._old_playoff_basic_header_columns),
+         ('team box score', teams._team_box_score_header_columns)] +
+        [('career ' + table, header_columns) for table, header_columns in player_career.career_table_headers.items()])
+
+    def test_same_rows_as_parse_souped_row_given_header_columns(self):
+        for table, header_columns in self.header_columns_by_table.items():
+            row = sample_row(header_columns)
+            with self.subTest(table=table):
+                expected = parse_souped_row_given_header_columns(row, header_columns)
+                decoded = RowDecoder(header_columns)(row)
+                self.assertEqual(decoded, expected)
+                self.assertEqual(list(decoded), list(expected))
+
+    def test_empty_columns_are_dropped_when_compiled(self):
+        decoder = RowDecoder(['Player', 'G', 'empty', 'PTS'])
+        self.assertEqual(decoder.player_index, 0)
+        self.assertEqual([(ii, key) for (ii, key, _) in decoder.trailing_fields],
+            [(1, 'games_played'), (3, 'points')])
+        self.assertEqual(decoder(sample_row(['Player', 'G', 'empty', 'PTS'])),
+            {'player_id': 'oneso01', 'player_name': 'Some One', 'games_played': 12, 'points': 12})
+
+    def test_decode_rows_gives_the_same_rows(self):
+        for table, header_columns in self.header_columns_by_table.items():
+            rows = [sample_row(header_columns), sample_row(header_columns)]
+            ## a blank in every column, as in the percentages of players with no attempts
+            rows[1] = [TableCell('', cell.attributes) if column != 'Player' else cell
+                for cell, column in zip(rows[1], header_columns)]
+            decoder = RowDecoder(header_columns)
+            with self.subTest(table=table):
+                decoded = decoder.decode_rows(rows)
+                self.assertEqual(decoded, [decoder(row) for row in rows])
+                self.assertEqual([list(row) for row in decoded], [list(decoder(row)) for row in rows])
+
+    def test_decode_rows_of_fixture(self):
+        with open(os.path.join(os.path.dirname(__file__), 'NBA_2019_totals.html'), 'rb') as fixture:
+            rows = get_tables(fixture.read(), ['PLAYER TOTALS TABLE'])['PLAYER TOTALS TABLE']
+        decoder = players_season_totals._totals_stats_by_year_row_decoder
+        self.assertEqual(decoder.decode_rows(rows), [decoder(row) for row in rows])
+
+    def test_decode_no_rows(self):
+        self.assertEqual(RowDecoder(['G', 'PTS']).decode_rows([]), [])
+
+    def test_decode_columns_gives_the_same_rows(self):
+        for table, header_columns in self.header_columns_by_table.items():
+            rows = [sample_row(header_columns), sample_row(header_columns)]
+            rows[1] = [TableCell('', cell.attributes) if column != 'Player' else cell
+                for cell, column in zip(rows[1], header_columns)]
+            decoder = RowDecoder(header_columns)
+            with self.subTest(table=table):
+                self.assertEqual(list(rows_from_columns(decoder.decode_columns(rows))), decoder.decode_rows(rows))
+
+    def test_decode_columns_of_fixture(self):
+        with open(os.path.join(os.path.dirname(__file__), 'NBA_2019_totals.html'), 'rb') as fixture:
+            rows = get_tables(fixture.read(), ['PLAYER TOTALS TABLE'])['PLAYER TOTALS TABLE']
+        decoder = players_season_totals._totals_stats_by_year_row_decoder
+        columns = decoder.decode_columns(rows)
+
+        self.assertEqual(list(rows_from_columns(columns)), decoder.decode_rows(rows))
+        self.assertEqual(list(columns), list(decoder(rows[0])))
+        self.assertEqual(columns['points'].typecode, 'q')
+        self.assertEqual(columns['field_goal_percent'].typecode, 'd')
+        self.assertIsInstance(columns['player_name'], list)
+        self.assertIsInstance(columns['team'], list)
+
+    def test_decode_no_columns(self):
+        columns = RowDecoder(['Player', 'G', 'PTS']).decode_columns([])
+        self.assertEqual(list(columns), ['player_id', 'player_name', 'games_played', 'points'])
+        self.assertEqual([len(values) for values in columns.values()], [0, 0, 0, 0])
+
+    def test_row_length_is_checked(self):
+        self.assertRaises(AssertionError, RowDecoder(['G', 'PTS']), sample_row(['G']))
@@ -0,0 +1,78 @@
+import os
+import tracemalloc
+from unittest import TestCase
+
+from basketball_reference_web_scraper import parsers
+from basketball_reference_web_scraper.parsers import streaming
+
+
+def fixture_content(file_name):
+    with open(os.path.join(os.path.dirname(__file__), file_name), 'rb') as fixture:
+        return fixture.read()
+
+
+class TestStreamingParsers(TestCase):
+    def test_same_rows_as_parse_players_season_totals(self):
+        for file_name in ['NBA_2001_totals.html', 'NBA_2018_totals.html', 'NBA_2019_totals_jemerrio_jones_blank_age.html']:
+            page = fixture_content(file_name)
+            for skip_totals in [False, True]:
+                with self.subTest(file_name=file_name, skip_totals=skip_totals):
+                    self.assertEqual(
+                        list(parsers.iter_players_season_totals(page, skip_totals=skip_totals, chunk_size=1000)),
+                        parsers.parse_players_season_totals(page, skip_totals=skip_totals))
+
+    def test_rows_are_yielded_before_the_page_is_consumed(self):
+        page = fixture_content('NBA_2019_totals.html')
+        chunks_read = []
+
+        def chunks():
+            for start in range(0, len(page), 4096):
+                chunks_read.append(start)
+                yield page[start:start + 4096]
+
+        rows = parsers.iter_players_season_totals(chunks())
+        first_row = next(rows)
+
+        self.assertEqual(first_row, parsers.parse_players_season_totals(page)[0])
+        self.assertLess(len(chunks_read), len(page) / 4096 / 2)
+
+    def test_memory_does_not_grow_with_the_table(self):
+        page = fixture_content('NBA_2019_totals.html')
+        body_start, body_end = page.index(b'<tbody>') + len(b'<tbody>'), page.index(b'</tbody>')
+
+        def peak_memory(copies):
+            bigger_page = page[:body_start] + page[body_start:body_end] * copies + page[body_end:]
+            tracemalloc.start()
+            try:
+                for _ in parsers.iter_players_season_totals(bigger_page):
+                    pass
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        self.assertLess(peak_memory(8), peak_memory(1) * 1.5)
+
+    def test_commented_table_is_used_when_there_is_no_other(self):
+        page = b'''<html><body><div><!--
+            <table class="stats_table sortable"><caption>Advanced Table</caption>
+                <tr><th class="over_header">skipped</th><td>x</td></tr>
+                <tr><th class="right">1</th>''' + b''.join(
+                    b'<td>%s</td>' % value for value in
+                    [b'Someone', b'PG', b'25', b'BOS', b'10'] + [b'.5'] * 23) + b'''</tr>
+            </table>
+        --></div></body></html>'''
+
+        self.assertEqual(list(parsers.iter_players_advanced_stats(page)), parsers.parse_players_advanced_stats(page))
+        self.assertEqual(len(list(parsers.iter_players_advanced_stats(page))), 1)
+
+    def test_missing_table_raises(self):
+        with self.assertRaises(KeyError):
+            list(parsers.iter_players_season_totals_per100(fixture_content('NBA_2019_totals.html')))
+
+    def test_table_row_target_collects_cells(self):
+        rows = list(streaming.iter_table_rows(
+            '<table class="stats_table sortable"><caption>Some Table</caption>'
+            '<tr><th class="left">1</th><td data-append-csv="a01">A <b>B</b></td><td>1</td></tr>'
+            '<tr><th class="left">2</th><td>Team Totals</td><td>9</td></tr></table>', 'some table'))
+        self.assertEqual([[(cell.text, cell.get('data-append-csv')) for cell in row] for row in rows],
+            [[('A B', 'a01'), ('1', None)]])
@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from basketball_reference_web_scraper.utilities import str_to_int, str_to_float
+from basketball_reference_web_scraper.utilities import str_to_int, str_to_float, strs_to_ints, strs_to_floats
 
 
 class TestStrToInt(TestCase):
@@ -41,3 +41,20 @@ class TestStrToFloat(TestCase):
 
     def test_with_default(self):
         self.assertIsNone(str_to_float("", default=None))
+
+
+class TestBatchConverters(TestCase):
+    values = ["", "    ", "10", "  10", "10    ", "-3", "+4", ".456", "-.5", "1.", "1e3", "12%", "--5", "N/A", "1,000"]
+
+    def test_strs_to_ints_matches_str_to_int(self):
+        self.assertEqual(strs_to_ints(self.values), [str_to_int(value) for value in self.values])
+        self.assertEqual(strs_to_ints(self.values, default=None), [str_to_int(value, default=None) for value in self.values])
+
+    def test_strs_to_floats_matches_str_to_float(self):
+        self.assertEqual(strs_to_floats(self.values), [str_to_float(value) for value in self.values])
+        self.assertEqual(strs_to_floats(self.values, default=None),
+            [str_to_float(value, default=None) for value in self.values])
+
+    def test_all_numbers(self):
+        self.assertEqual(strs_to_ints(["1", " 2", "3 "]), [1, 2, 3])
+        self.assertEqual(strs_to_floats([".456", "1.000", "0"]), [0.456, 1.0, 0.0])